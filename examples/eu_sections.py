@@ -0,0 +1,30 @@
+"""EU sections demo: look up a few sections of each family and print their properties."""
+
+from steelsnakes.EU.angles import L_EQUAL, L_EQUAL_B2B, L_UNEQUAL, L_UNEQUAL_B2B
+from steelsnakes.EU.beams import HL, HLZ, IPE, UB
+from steelsnakes.EU.channels import PFC, UPE, UPN
+from steelsnakes.EU.columns import HD, UC
+
+if __name__ == "__main__":
+    # --- Beams ---
+    print(UB("1100x400x433").get_properties())
+    print(HL("HL-1100-M").get_properties())
+    print(HLZ("HLZ-1100-A").get_properties())
+    print(IPE("IPE-750x220").get_properties())
+
+    # --- Columns ---
+    print(UC("356x406x1299").get_properties(), "\n")
+    print(HD("HD-400x421").get_properties())
+
+    # --- Channels ---
+    print(PFC("430x100x64").get_properties())
+    print(UPE("UPE-400").get_properties())
+    print(UPN("UPN-400").get_properties())
+
+    # --- Angles ---
+    print(L_EQUAL("300x300x35.0").get_properties())
+    print(L_EQUAL_B2B("300x300x35.0").get_properties())
+    print(L_UNEQUAL("250x90x16").get_properties())
+    print(L_UNEQUAL_B2B("250x90x14").get_properties())
+
+    print("🐬")
@@ -0,0 +1,25 @@
+"""UK ULS checks demo: shear area and web shear stress of a section, then a batch of utilisation checks."""
+
+import numpy as np
+
+from steelsnakes.UK import UB
+from steelsnakes.UK.checks.uls import shear_area, tension_utilisation, tension_utilisation_batch, web_shear_stress
+
+if __name__ == "__main__":
+    # --- Section checks ---
+    element = UB("457x191x67")
+    # element = PFC("430x100x64") # from steelsnakes.UK import PFC
+    print(shear_area(element))
+    print(web_shear_stress(1000, element))
+
+    # --- One member, one load case ---
+    print(tension_utilisation(N_Ed=850e3, N_tRd=1000e3))
+
+    # --- Every member x load case at once ---
+    N_Ed = np.array([[850e3, 1200e3], [400e3, 950e3]]) # members down the rows, load cases across
+    N_tRd = np.array([[1000e3], [900e3]]) # one resistance per member, broadcast over load cases
+    checks = tension_utilisation_batch(N_Ed, N_tRd)
+    print(checks.utilisation)
+    print(checks.adequate)
+
+    print("🐬")
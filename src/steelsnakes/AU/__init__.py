@@ -10,6 +10,25 @@ Currently not implemented - planned for future development.
 
 
 
+# --- Lazy exports ---
+# As in the EU module, section classes are only imported on first attribute access (PEP 562).
+from steelsnakes.base._lazy import install as _install_lazy
+
+_LAZY: dict[str, str] = {
+    "AustralianSection": "steelsnakes.AU.sections",
+    "I_Section": "steelsnakes.AU.sections",
+    "UniversalBeam": "steelsnakes.AU.sections",
+    "UniversalColumn": "steelsnakes.AU.sections",
+    "TaperedFlangeBeam": "steelsnakes.AU.sections",
+    "ParallelFlangeChannel": "steelsnakes.AU.sections",
+    "Angle": "steelsnakes.AU.sections",
+    "EqualAngle": "steelsnakes.AU.sections",
+    "UnequalAngle": "steelsnakes.AU.sections",
+}
+
+_install_lazy(globals(), _LAZY)
+
+
 __all__ = [
     # Will be populated when Australian sections are implemented
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from steelsnakes.base.sections import BaseSection, SectionType
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, cast, Optional, Union
 from enum import Enum
 
@@ -11,9 +11,6 @@ class AustralianSection(BaseSection):
     @classmethod
     def get_section_type(cls) -> Any:
         return super().get_section_type()
-    
-    def get_properties(self) -> dict[str, Any]:
-        return asdict(self)
 
 class I_Section(AustralianSection):
     # Parameters based on AS/NZS 3679.1:2010 Appendix D
@@ -93,10 +90,3 @@ class UnequalAngle(Angle):
     def get_section_type(cls):
         # return SectionType.UA # FIXME: properties are different from UK/EU Unequal Angle, and parameters have different names
         return NotImplementedError("")
-
-
-
-
-if __name__ == "__main__":
-    
-    print("🐬")
\ No newline at end of file
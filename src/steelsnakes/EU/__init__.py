@@ -29,3 +29,66 @@
 # --- Flats ---
 # S - SIGMA
 # Z - Zed-butted Sections
+
+
+# --- Lazy exports ---
+# Section modules are only imported on first attribute access (PEP 562), so `import steelsnakes.EU`
+# doesn't build the EU factory or load any section family that isn't used.
+from steelsnakes.base._lazy import install as _install_lazy
+
+_LAZY: dict[str, str] = {
+    # Beams
+    "HRolledSection": "steelsnakes.EU.beams",
+    "Beam": "steelsnakes.EU.beams",
+    "ParallelFlangeBeam": "steelsnakes.EU.beams",
+    "WideFlangeBeam": "steelsnakes.EU.beams",
+    "ExtraWideFlangeBeam": "steelsnakes.EU.beams",
+    "UniversalBeam": "steelsnakes.EU.beams",
+    "IPE": "steelsnakes.EU.beams",
+    "HE": "steelsnakes.EU.beams",
+    "HL": "steelsnakes.EU.beams",
+    "HLZ": "steelsnakes.EU.beams",
+    "UB": "steelsnakes.EU.beams",
+    # Columns
+    "Column": "steelsnakes.EU.columns",
+    "WideFlangeColumn": "steelsnakes.EU.columns",
+    "UniversalColumn": "steelsnakes.EU.columns",
+    "HD": "steelsnakes.EU.columns",
+    "UC": "steelsnakes.EU.columns",
+    # Bearing Piles
+    "BearingPile": "steelsnakes.EU.piles",
+    "WideFlangeBearingPile": "steelsnakes.EU.piles",
+    "UniversalBearingPile": "steelsnakes.EU.piles",
+    "HP": "steelsnakes.EU.piles",
+    "UBP": "steelsnakes.EU.piles",
+    # Channels
+    "ParallelFlangeChannel": "steelsnakes.EU.channels",
+    "TaperedFlangeChannel": "steelsnakes.EU.channels",
+    "PFC": "steelsnakes.EU.channels",
+    "UPE": "steelsnakes.EU.channels",
+    "UPN": "steelsnakes.EU.channels",
+    # Angles
+    "EqualAngle": "steelsnakes.EU.angles",
+    "UnequalAngle": "steelsnakes.EU.angles",
+    "EqualAngleBackToBack": "steelsnakes.EU.angles",
+    "UnequalAngleBackToBack": "steelsnakes.EU.angles",
+    "L_EQUAL": "steelsnakes.EU.angles",
+    "L_UNEQUAL": "steelsnakes.EU.angles",
+    "L_EQUAL_B2B": "steelsnakes.EU.angles",
+    "L_UNEQUAL_B2B": "steelsnakes.EU.angles",
+    # Flats
+    "Sigma": "steelsnakes.EU.flats",
+    "Zed": "steelsnakes.EU.flats",
+    "S_section": "steelsnakes.EU.flats",
+    "Z_section": "steelsnakes.EU.flats",
+    # Infrastructure
+    "EUSectionDatabase": "steelsnakes.EU.database",
+    "get_EU_database": "steelsnakes.EU.database",
+    "EUSectionFactory": "steelsnakes.EU.factory",
+    "get_EU_factory": "steelsnakes.EU.factory",
+}
+
+_install_lazy(globals(), _LAZY)
+
+
+__all__ = list(_LAZY)
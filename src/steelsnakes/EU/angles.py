@@ -12,7 +12,7 @@ from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.EU.factory import EUSectionFactory, get_EU_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class EqualAngle(BaseSection):
     """
     Equal Angle (L_EQUAL) section.
@@ -62,15 +62,10 @@ class EqualAngle(BaseSection):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L_EQUAL
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
 
-@dataclass
+@dataclass(slots=True)
 class UnequalAngle(BaseSection):
     """
     Unequal Angle (L_UNEQUAL) section.
@@ -124,15 +119,10 @@ class UnequalAngle(BaseSection):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L_UNEQUAL
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
 
-@dataclass
+@dataclass(slots=True)
 class EqualAngleBackToBack(BaseSection):
     """
     Back-to-Back Equal Angles (L_EQUAL_B2B) section.
@@ -156,14 +146,9 @@ class EqualAngleBackToBack(BaseSection):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L_EQUAL_B2B
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class UnequalAngleBackToBack(BaseSection):
     """
     Back-to-Back Unequal Angles (L_UNEQUAL_B2B) section.
@@ -187,11 +172,6 @@ class UnequalAngleBackToBack(BaseSection):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L_UNEQUAL_B2B
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 # Convenience functions for direct instantiation
 def L_EQUAL(designation: str, data_directory: Optional[Path] = None) -> EqualAngle:
@@ -220,16 +200,3 @@ def L_UNEQUAL_B2B(designation: str, data_directory: Optional[Path] = None) -> Un
     factory: EUSectionFactory = get_EU_factory(data_directory)
     # return factory.create_section(designation, SectionType.L_UNEQUAL_B2B)
     return cast(UnequalAngleBackToBack, factory.create_section(designation, SectionType.L_UNEQUAL_B2B))
-
-
-if __name__ == "__main__":
-    # factory = get_EU_factory()
-    # test_section2 = factory.create_section("200x100x14", section_type=SectionType.L_UNEQUAL)
-    # print(test_section2.get_properties())
-
-    print(L_EQUAL("300x300x35.0").get_properties())
-    print(L_EQUAL_B2B("300x300x35.0").get_properties())
-    print(L_UNEQUAL("250x90x16").get_properties())
-    print(L_UNEQUAL_B2B("250x90x14").get_properties())
-
-    print("🐬")
\ No newline at end of file
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Union, cast
+from typing import Any, ClassVar, Union, cast
 
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.EU.factory import EUSectionFactory, SectionFactory, get_EU_factory
 
-@dataclass
-class Beam(BaseSection):
-    """Base class for all European steel beam sections."""
+@dataclass(slots=True)
+class HRolledSection(BaseSection):
+    """Shared field set of the European hot-rolled I/H sections: beams, columns and bearing piles."""
     
     # Identification  
     serial_size: str = ""
@@ -57,42 +57,41 @@ class Beam(BaseSection):
     I_w: float = 0.0  # Warping constant (cm⁶)
     I_t: float = 0.0  # Torsional constant (cm⁴)
     A: float = 0.0  # Cross-sectional area (cm²)
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
+class Beam(HRolledSection):
+    """Base class for all European steel beam sections."""
+
+
+@dataclass(slots=True)
 class ParallelFlangeBeam(Beam):
     """Parallel Flange I-beam section."""
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.IPE
 
-@dataclass
+@dataclass(slots=True)
 class WideFlangeBeam(Beam):
     """Wide Flange Beam section."""
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.HE
 
-@dataclass
+@dataclass(slots=True)
 class ExtraWideFlangeBeam(Beam):
     """Extra Wide Flange Beam section.
     
-    Supports both HL and HLZ section types through manual factory registration.
-    The factory will register this class for both SectionType.HL and SectionType.HLZ.
+    Supports both HL and HLZ section types: the factory registers this class for every type in `_TYPES`.
     """
+    _TYPES: ClassVar[tuple[SectionType, ...]] = (SectionType.HL, SectionType.HLZ)
+
     @classmethod
     def get_section_type(cls) -> SectionType:
-        # //return Union[SectionType.HL, SectionType.HLZ] # Pylance[reportReturnType]: https://github.com/microsoft/pylance-release/blob/main/docs/diagnostics/reportReturnType.md
-
-        # Return HL as the primary type - factory will handle both HL and HLZ registration
-        return SectionType.HL
+        # HL is the primary type; HL(...) and HLZ(...) pass their type to the factory explicitly
+        return cls._TYPES[0]
 
-@dataclass
+@dataclass(slots=True)
 class UniversalBeam(Beam):
     """Universal Beam section."""
     @classmethod
@@ -132,17 +131,3 @@ def UB(designation: str) -> UniversalBeam:
     """UB section - inherits UB type from parent."""
     # factory: EUSectionFactory = get_EU_factory()
     return cast(UniversalBeam, get_EU_factory().create_section(designation, SectionType.UB))
-
-
-if __name__ == "__main__":
-    # factory: EUSectionFactory = get_EU_factory()
-    # test_section = factory.create_section("1100x400x607", section_type=SectionType.UB)
-    # print(test_section.get_properties())
-
-    print(UB("1100x400x433").get_properties())
-    print(HL("HL-1100-M").get_properties())
-    print(HLZ("HLZ-1100-A").get_properties())
-    print(IPE("IPE-750x220").get_properties())
-    
-    
-    print("🐬")
\ No newline at end of file
@@ -5,13 +5,13 @@ Channel steel sections for EU module.
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Any, cast, Union
+from typing import Any, ClassVar, Optional, cast, Union
 
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.EU.factory import EUSectionFactory, get_EU_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class ParallelFlangeChannel(BaseSection):
     """
     Parallel Flange Channel (PFC) section.
@@ -19,9 +19,10 @@ class ParallelFlangeChannel(BaseSection):
     C-shaped section with parallel flanges, commonly used for 
     secondary beams, purlins, and cladding rails.
     
-    Supports both PFC and UPE section types through factory registration.
-    The factory will register this class for both SectionType.PFC and SectionType.UPE.
+    Supports both PFC and UPE section types: the factory registers this class for every type in `_TYPES`.
     """
+    _TYPES: ClassVar[tuple[SectionType, ...]] = (SectionType.PFC, SectionType.UPE)
+
     
     # Identification
     serial_size: str = ""
@@ -57,17 +58,11 @@ class ParallelFlangeChannel(BaseSection):
     
     @classmethod
     def get_section_type(cls) -> SectionType:
-        #// return cast(SectionType, Union[SectionType.PFC, SectionType.UPE])
-        # Return PFC as the primary type - factory will handle both PFC and UPE registration
-        return SectionType.PFC
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
+        # PFC is the primary type; PFC(...) and UPE(...) pass their type to the factory explicitly
+        return cls._TYPES[0]
 
 
-@dataclass
+@dataclass(slots=True)
 class TaperedFlangeChannel(BaseSection):
     
     serial_size: str = ""
@@ -106,12 +101,7 @@ class TaperedFlangeChannel(BaseSection):
 
     @classmethod
     def get_section_type(cls) -> SectionType:
-        return cast(SectionType, SectionType.UPN) # FIXME: check if Unions are the ussue
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
+        return SectionType.UPN
 
 # Convenience function for direct instantiation
 def PFC(designation: str, data_directory: Optional[Path] = None) -> ParallelFlangeChannel:
@@ -132,9 +122,3 @@ def UPN(designation: str, data_directory: Optional[Path] = None) -> TaperedFlang
     factory: EUSectionFactory = get_EU_factory(data_directory)
     # return factory.create_section(designation, SectionType.UPN)
     return cast(TaperedFlangeChannel, factory.create_section(designation, SectionType.UPN))
-
-if __name__ == "__main__":
-    print(PFC("430x100x64").get_properties())
-    print(UPE("UPE-400").get_properties())
-    print(UPN("UPN-400").get_properties())
-    print("🐬")
\ No newline at end of file
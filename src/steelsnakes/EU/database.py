@@ -1,130 +1,282 @@
 """EU-specific database implementation."""
 
 from __future__ import annotations
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
+import sqlite3
+import string
+import sys
 from typing import Optional, Any
 
 from steelsnakes.base.database import SectionDatabase
 from steelsnakes.base.sections import SectionType
 
+# Separators dropped when comparing designations, e.g. "HE 100 A", "457x191x67", "UPE-400"
+_STRIP_TABLE = str.maketrans("", "", " x.-")
+# Same, with ASCII lower-casing folded in, so ASCII designations are normalized in one pass
+_ASCII_NORMALIZE_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, " xX.-")
+
+
+# Most fuzzy results kept per database before the memo is cleared, see `_fuzzy_find_section()`
+_FUZZY_RESULTS_MAXSIZE: int = 4096
+
+
+def _normalize(designation: str) -> str:
+    """Return a designation lower-cased and stripped of separators, for fuzzy matching."""
+    if designation.isascii():
+        return designation.translate(_ASCII_NORMALIZE_TABLE)
+    return designation.lower().translate(_STRIP_TABLE)
+
+
+_CURRENT_FILE: Path = Path(__file__).resolve()
+
+
+@lru_cache(maxsize=None)
+def _discover_EU_data_directory(cwd: str) -> Path:
+    """Return the first existing EU data directory, searched from `cwd` and the package location.
+    Memoized, so repeated `EUSectionDatabase()` constructions skip the `resolve()`/`is_dir()` probes."""
+    possible_paths: list[Path] = [          
+        Path(cwd) / "src/steelsnakes/EU/data/", # from project root
+        _CURRENT_FILE.parent / "data/", # from package installation
+        _CURRENT_FILE.parent.parent.parent / "data/EU/", # from development environment
+        _CURRENT_FILE.parent.parent.parent / "src/steelsnakes/EU/data/", # from source directory
+        _CURRENT_FILE.parent.parent.parent.parent / "data/EU/" # from parent directory
+    ]
+    
+    for path in possible_paths:
+        resolved_path: Path = path.resolve()
+        if resolved_path.is_dir(): # .is_dir() implies .exists()
+            return resolved_path
+            
+    # Fallback
+    return _CURRENT_FILE.parent / "data/"
+
+
+# All EU-supported section types, in lookup order
+_EU_SUPPORTED_TYPES: tuple[SectionType, ...] = (
+    # Beams
+    SectionType.IPE, # Parallel Flange I-sections
+    SectionType.HE, # Wide Flange Beams
+    SectionType.HL, # Extra Wide Flange Beams # TODO: clarify HL and HLZ are only split at HL/HZ level but are together as Extra Wide Flange Beams
+    SectionType.HLZ, # Extra Wide Flange Beams # TODO: clarify HL and HLZ are only split at HL/HZ level but are together as Extra Wide Flange Beams
+    SectionType.UB, # Universal Beams
+
+    # Columns
+    SectionType.HD, # Wide Flange Columns
+    SectionType.UC, # Universal Columns
+
+    # Bearing Piles
+    SectionType.HP, # Wide Flange Bearing Piles
+    SectionType.UBP, # Universal Bearing Piles
+    
+    # Channels
+    SectionType.UPE, # Parallel Flange Channels (EU)
+    SectionType.UPN, # Tapered Flange Channels
+    SectionType.PFC, # Parallel Flange Channels (UK)
+    
+    # Angles
+    SectionType.L_EQUAL, # Equal Angles
+    SectionType.L_UNEQUAL, # Unequal Angles
+    SectionType.L_EQUAL_B2B, # Back to Back Equal Angles
+    SectionType.L_UNEQUAL_B2B, # Back to Back Unequal Angles
+    
+    # Flats
+    SectionType.Sigma, # SIGMA
+    SectionType.Zed, # Zed-butted Sections
+)
+
 
 class EUSectionDatabase(SectionDatabase):
     """EU-specific steel section database. EN 10365:2017"""
 
+    # Section types are only read from disk when first looked up
+    lazy_load = True
+
+    # Lower-cased and normalized designations -> (type, data); built on first fuzzy lookup, reset on load
+    _fuzzy_index: Optional[dict[str, tuple[SectionType, dict[str, Any]]]] = None
+    # Exact designations -> (type, data); built and reset alongside `_fuzzy_index`
+    _exact_index: Optional[dict[str, tuple[SectionType, dict[str, Any]]]] = None
+    # Queried designations -> fuzzy result, misses included; reset on load
+    _fuzzy_results: Optional[dict[str, Optional[tuple[SectionType, dict[str, Any]]]]] = None
+    # (normalized designation, type, designation) rows sorted for prefix lookups; built on first use, reset on load
+    _prefix_keys: Optional[list[tuple[str, SectionType, str]]] = None
+    # In-memory SQLite FTS5 index over `_prefix_keys`, for `find_sections_containing()`; reset on load
+    _designation_fts: Optional[sqlite3.Connection] = None
+
     def _resolve_data_directory(self, data_directory: Optional[Path]) -> Path:
         """Resolve the EU data directory path."""
         if data_directory is not None:
             return data_directory
             
-        # Auto-discovery for EU sections
-        current_file: Path = Path(__file__).resolve()
-        possible_paths: list[Path] = [          
-            Path.cwd() / "src/steelsnakes/EU/data/", # from project root
-            current_file.parent / "data/", # from package installation
-            current_file.parent.parent.parent / "data/EU/", # from development environment
-            current_file.parent.parent.parent / "src/steelsnakes/EU/data/", # from source directory
-            current_file.parent.parent.parent.parent / "data/EU/" # from parent directory
+        # Auto-discovery for EU sections, probed once per working directory
+        return _discover_EU_data_directory(str(Path.cwd()))
+
+    def get_supported_types(self) -> tuple[SectionType, ...]:
+        """Return all EU-supported section types (a shared constant, not a fresh list per call)."""
+        return _EU_SUPPORTED_TYPES
+
+    def _cache_section_type(self, section_type: SectionType) -> dict[str, dict[str, Any]]:
+        """Load a single section type into the cache, dropping the now stale lookup indexes."""
+        self._fuzzy_index = None
+        self._exact_index = None
+        self._fuzzy_results = None
+        self._prefix_keys = None
+        if self._designation_fts is not None:
+            self._designation_fts.close()
+            self._designation_fts = None
+        return super()._cache_section_type(section_type)
+
+    def _build_fuzzy_index(self) -> dict[str, tuple[SectionType, dict[str, Any]]]:
+        """Index every designation by its lower-cased form, then by its normalized form.
+        The first type (in `get_supported_types()` order) wins a clash, and exact case-insensitive
+        matches always take precedence over separator-stripped ones."""
+        entries: list[tuple[str, SectionType, dict[str, Any]]] = [
+            (stored_designation, section_type, section_data)
+            for section_type in self.get_supported_types()
+            for stored_designation, section_data in self._get_sections(section_type).items()
         ]
-        
-        for path in possible_paths:
-            resolved_path: Path = path.resolve()
-            if resolved_path.exists() and resolved_path.is_dir():
-                return resolved_path
-                
-        # Fallback
-        return current_file.parent / "data/"
-
-    def get_supported_types(self) -> list[SectionType]:
-        """Return all EU-supported section types."""
-        return [
-            # Beams
-            SectionType.IPE, # Parallel Flange I-sections
-            SectionType.HE, # Wide Flange Beams
-            SectionType.HL, # Extra Wide Flange Beams # TODO: clarify HL and HLZ are only split at HL/HZ level but are together as Extra Wide Flange Beams
-            SectionType.HLZ, # Extra Wide Flange Beams # TODO: clarify HL and HLZ are only split at HL/HZ level but are together as Extra Wide Flange Beams
-            SectionType.UB, # Universal Beams
-           
-            # Columns
-            SectionType.HD, # Wide Flange Columns
-            SectionType.UC, # Universal Columns
-
-            # Bearing Piles
-            SectionType.HP, # Wide Flange Bearing Piles
-            SectionType.UBP, # Universal Bearing Piles
-            
-            # Channels
-            SectionType.UPE, # Parallel Flange Channels (EU)
-            SectionType.UPN, # Tapered Flange Channels
-            SectionType.PFC, # Parallel Flange Channels (UK)
-            
-            # Angles
-            SectionType.L_EQUAL, # Equal Angles
-            SectionType.L_UNEQUAL, # Unequal Angles
-            SectionType.L_EQUAL_B2B, # Back to Back Equal Angles
-            SectionType.L_UNEQUAL_B2B, # Back to Back Unequal Angles
-            
-            # Flats
-            SectionType.Sigma, # SIGMA
-            SectionType.Zed, # Zed-butted Sections
-            ]
+        exact_index: dict[str, tuple[SectionType, dict[str, Any]]] = {}
+        index: dict[str, tuple[SectionType, dict[str, Any]]] = {}
+        for stored_designation, section_type, section_data in entries:
+            exact_index.setdefault(stored_designation, (section_type, section_data))
+            index.setdefault(sys.intern(stored_designation.lower()), (section_type, section_data))
+        for stored_designation, section_type, section_data in entries:
+            index.setdefault(sys.intern(_normalize(stored_designation)), (section_type, section_data))
+        self._exact_index, self._fuzzy_index = exact_index, index # set last, as loading types above resets them
+        return index
+
+    # 🌟 - Find section
+    def find_section(self, designation: str) -> Optional[tuple[SectionType, dict[str, Any]]]:
+        """Find a section by designation across all types.
+        Once the lookup indexes are built, an exact hit is one dict lookup instead of a probe of every type;
+        before that, the types are probed in order so only those up to the hit get loaded."""
+        if self._exact_index is None:
+            return super().find_section(designation)
+        match = self._exact_index.get(designation)
+        return match if match is not None else self._fuzzy_find_section(designation)
 
     def _fuzzy_find_section(self, designation: str) -> Optional[tuple[SectionType, dict[str, Any]]]:
         """
         EU-specific fuzzy section finding with case-insensitive matching.
         
-        Handles common EU designation variations and formats.
+        Handles common EU designation variations and formats. Lookups go through a normalized
+        index built once, so a query costs two dict lookups rather than a scan of every section.
+        Results, misses included, are memoized per designation until the next load.
         """
-        designation_lower: str = designation.lower().strip()
-        
-        # Try case-insensitive search across all types
-        for section_type in self.get_supported_types():
-            sections = self._cache.get(section_type, {})
-            
-            for stored_designation, section_data in sections.items():
-                if stored_designation.lower() == designation_lower:
-                    return section_type, section_data
-                    
-        # Try partial matches for common patterns
-        for section_type in self.get_supported_types():
-            sections: dict[str, dict[str, Any]] = self._cache.get(section_type, {})
-            
-            for stored_designation, section_data in sections.items():
-                # Remove spaces and try again
-                if stored_designation.lower().replace(" ", "") == designation_lower.replace(" ", ""):
-                    return section_type, section_data
-                    
-                # Try without 'x' separators (e.g., "457191x67" vs "457x191x67")
-                if "x" in designation_lower and "x" in stored_designation.lower():
-                    clean_input: str = designation_lower.replace("x", "")
-                    clean_stored: str = stored_designation.lower().replace("x", "")
-                    if clean_input == clean_stored:
-                        return section_type, section_data
-
-                if "." in designation_lower and "." in stored_designation.lower():
-                    clean_input = designation_lower.replace(".", "")
-                    clean_stored = stored_designation.lower().replace(".", "")
-                    if clean_input == clean_stored:
-                        return section_type, section_data
-
-                if "-" in designation_lower and "-" in stored_designation.lower():
-                    clean_input = designation_lower.replace("-", "")
-                    clean_stored = stored_designation.lower().replace("-", "")
-                    if clean_input == clean_stored:
-                        return section_type, section_data
-        
-        return None
+        results = self._fuzzy_results
+        if results is not None and designation in results:
+            return results[designation]
+
+        result = self._fuzzy_lookup(designation)
+        results = self._fuzzy_results # the lookup may have loaded types, resetting the memo
+        if results is None or len(results) >= _FUZZY_RESULTS_MAXSIZE:
+            results = self._fuzzy_results = {}
+        results[designation] = result
+        return result
+
+    def _fuzzy_lookup(self, designation: str) -> Optional[tuple[SectionType, dict[str, Any]]]:
+        """Resolve a designation against the fuzzy index: lower-cased first, then with separators stripped.
+        Every stored designation is indexed under both forms, so a miss here is a miss everywhere."""
+        designation_lower: str = sys.intern(designation.lower().strip()) # interned like the index keys
+        index = self._fuzzy_index if self._fuzzy_index is not None else self._build_fuzzy_index()
+        return index.get(designation_lower) or index.get(sys.intern(_normalize(designation_lower)))
 
+    def _get_prefix_keys(self) -> list[tuple[str, SectionType, str]]:
+        """Return `(normalized designation, type, designation)` for every section, sorted; built once."""
+        keys = self._prefix_keys
+        if keys is None:
+            keys = sorted(
+                (_normalize(stored_designation), section_type, stored_designation)
+                for section_type in self.get_supported_types()
+                for stored_designation in self._get_sections(section_type)
+            )
+            self._prefix_keys = keys # set last, as loading types above resets it
+        return keys
+
+    # 🌟 - Find sections by prefix
+    def find_sections_by_prefix(self, prefix: str) -> list[tuple[SectionType, str]]:
+        """Return `(type, designation)` for every section whose normalized designation starts with the
+        normalized `prefix`, e.g. `"IPE 750"` -> the IPE 750 series. Binary search over sorted keys."""
+        keys = self._get_prefix_keys()
+        normalized_prefix: str = _normalize(prefix.strip())
+        matches: list[tuple[SectionType, str]] = []
+        for position in range(bisect_left(keys, (normalized_prefix,)), len(keys)):
+            key, section_type, stored_designation = keys[position]
+            if not key.startswith(normalized_prefix):
+                break
+            matches.append((section_type, stored_designation))
+        return matches
+
+    # 🌟 - Find sections by substring
+    def find_sections_containing(self, text: str) -> list[tuple[SectionType, str]]:
+        """Return `(type, designation)` for every section whose normalized designation contains the
+        normalized `text`, e.g. `"1000"` -> `HE-1000x249`, `1000x400x296`, ... in sorted order.
+
+        With `use_sqlite=True`, queries of three or more characters go to an in-memory SQLite FTS5
+        index using the `trigram` tokenizer. Otherwise, or where FTS5 isn't compiled in, the
+        normalized keys are scanned.
+        """
+        normalized_text: str = _normalize(text.strip())
+        if self.use_sqlite and len(normalized_text) >= 3:
+            connection = self._get_designation_fts()
+            if connection is not None:
+                rows = connection.execute(
+                    "SELECT section_type, designation FROM sections_fts WHERE normalized MATCH ? ORDER BY rowid",
+                    ('"' + normalized_text.replace('"', '""') + '"',), # as one phrase, not FTS query syntax
+                ).fetchall()
+                return [(SectionType(section_type), stored_designation) for section_type, stored_designation in rows]
+
+        return [
+            (section_type, stored_designation)
+            for key, section_type, stored_designation in self._get_prefix_keys()
+            if normalized_text in key
+        ]
+
+    def _get_designation_fts(self) -> Optional[sqlite3.Connection]:
+        """Return an in-memory FTS5 trigram index of the normalized designations, built once per load,
+        or `None` if this SQLite build lacks FTS5 or the trigram tokenizer."""
+        if self._designation_fts is None:
+            keys = self._get_prefix_keys()
+            connection = sqlite3.connect(":memory:", check_same_thread=False) # read-only once built
+            try:
+                connection.execute(
+                    "CREATE VIRTUAL TABLE sections_fts USING fts5("
+                    "normalized, section_type UNINDEXED, designation UNINDEXED, tokenize='trigram')"
+                )
+            except sqlite3.OperationalError:
+                connection.close()
+                return None
+            connection.executemany(
+                "INSERT INTO sections_fts (normalized, section_type, designation) VALUES (?, ?, ?)",
+                ((key, section_type.value, stored_designation) for key, section_type, stored_designation in keys),
+            )
+            self._designation_fts = connection
+        return self._designation_fts
 
 # Global instance for convenience
 _global_EU_database: Optional[EUSectionDatabase] = None
+# Databases for an explicit data directory or backend, built once per `(data_directory, use_sqlite)`
+_EU_databases: dict[tuple[Optional[Path], bool], EUSectionDatabase] = {}
 
 
 def get_EU_database(data_directory: Optional[Path] = None, use_sqlite: bool = False) -> EUSectionDatabase:
-    """Get or create global EU database instance. Uses JSON by default."""
+    """Get or create global EU database instance. Uses JSON by default.
+
+    Databases for an explicit `data_directory` (or SQLite backend) are memoized, so asking
+    again for the same directory returns the loaded instance instead of re-reading its data.
+    """
     global _global_EU_database
-    if _global_EU_database is None or data_directory is not None:
-        _global_EU_database = EUSectionDatabase(data_directory, use_sqlite=use_sqlite)
-    return _global_EU_database
+    if data_directory is None and not use_sqlite:
+        if _global_EU_database is None:
+            _global_EU_database = EUSectionDatabase()
+        return _global_EU_database
+
+    key = (Path(data_directory) if data_directory is not None else None, use_sqlite)
+    database: Optional[EUSectionDatabase] = _EU_databases.get(key)
+    if database is None:
+        database = _EU_databases[key] = EUSectionDatabase(key[0], use_sqlite=use_sqlite)
+    return database
 
 if __name__ == "__main__":
     db: EUSectionDatabase = get_EU_database()
@@ -11,6 +11,38 @@ from steelsnakes.EU.database import EUSectionDatabase, get_EU_database
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# (section types, module, class name) of every EU section class, registered lazily by `EUSectionFactory`
+_EU_SECTION_CLASSES: tuple[tuple[tuple[SectionType, ...], str, str], ...] = (
+    # --- Beams ---
+    ((SectionType.IPE,), "steelsnakes.EU.beams", "ParallelFlangeBeam"),
+    ((SectionType.HE,), "steelsnakes.EU.beams", "WideFlangeBeam"),
+    ((SectionType.UB,), "steelsnakes.EU.beams", "UniversalBeam"),
+    ((SectionType.HL, SectionType.HLZ), "steelsnakes.EU.beams", "ExtraWideFlangeBeam"),
+
+    # --- Columns ---
+    ((SectionType.HD,), "steelsnakes.EU.columns", "WideFlangeColumn"),
+    ((SectionType.UC,), "steelsnakes.EU.columns", "UniversalColumn"),
+
+    # --- Bearing Piles ---
+    ((SectionType.HP,), "steelsnakes.EU.piles", "WideFlangeBearingPile"),
+    ((SectionType.UBP,), "steelsnakes.EU.piles", "UniversalBearingPile"),
+
+    # --- Channels ---
+    ((SectionType.UPN,), "steelsnakes.EU.channels", "TaperedFlangeChannel"),
+    ((SectionType.PFC, SectionType.UPE), "steelsnakes.EU.channels", "ParallelFlangeChannel"), # TODO: compare properties of UPE and PFC
+
+    # --- Angles ---
+    ((SectionType.L_EQUAL,), "steelsnakes.EU.angles", "EqualAngle"),
+    ((SectionType.L_UNEQUAL,), "steelsnakes.EU.angles", "UnequalAngle"),
+    ((SectionType.L_EQUAL_B2B,), "steelsnakes.EU.angles", "EqualAngleBackToBack"),
+    ((SectionType.L_UNEQUAL_B2B,), "steelsnakes.EU.angles", "UnequalAngleBackToBack"),
+
+    # --- Flats ---
+    ((SectionType.Sigma,), "steelsnakes.EU.flats", "Sigma"),
+    ((SectionType.Zed,), "steelsnakes.EU.flats", "Zed"),
+)
+
+
 class EUSectionFactory(SectionFactory):
     """EU-specific steel section factory.
     Automatically registers all EU section classes and provides 
@@ -24,88 +56,35 @@ class EUSectionFactory(SectionFactory):
         super().__init__(database)
 
     def _register_default_classes(self) -> None:
-        """Register all EU section classes automatically."""
-        # Import and register all EU section classes
-        try:
-            # --- Beams ---
-            from steelsnakes.EU.beams import (
-                ParallelFlangeBeam,
-                WideFlangeBeam,
-                ExtraWideFlangeBeam,
-                UniversalBeam,
-            )
-            self.register_section_class(ParallelFlangeBeam)
-            self.register_section_class(WideFlangeBeam)
-            self.register_section_class(UniversalBeam)
-            
-            # Manual registration for ExtraWideFlangeBeam (supports both HL and HLZ)
-            self._section_classes[SectionType.HL] = ExtraWideFlangeBeam
-            self._section_classes[SectionType.HLZ] = ExtraWideFlangeBeam
-
-            # --- Columns ---
-            from steelsnakes.EU.columns import (
-                WideFlangeColumn,
-                UniversalColumn,
-            )
-            self.register_section_class(WideFlangeColumn)
-            self.register_section_class(UniversalColumn)
-
-            # --- Bearing Piles ---
-            from steelsnakes.EU.piles import (
-                WideFlangeBearingPile,
-                UniversalBearingPile,
-            )
-            self.register_section_class(WideFlangeBearingPile)
-            self.register_section_class(UniversalBearingPile)
-
-            # --- Channels ---
-            from steelsnakes.EU.channels import (
-                ParallelFlangeChannel, # TODO: compare properties of UPE and PFC
-                TaperedFlangeChannel,
-
-            )
-            self.register_section_class(TaperedFlangeChannel)
-            
-            # Manual registration for ParallelFlangeChannel (supports both PFC and UPE)
-            self._section_classes[SectionType.PFC] = ParallelFlangeChannel
-            self._section_classes[SectionType.UPE] = ParallelFlangeChannel
-
-            # --- Angles ---
-            from steelsnakes.EU.angles import (
-                EqualAngle,
-                UnequalAngle,
-                EqualAngleBackToBack,
-                UnequalAngleBackToBack,
-            )
-            self.register_section_class(EqualAngle)
-            self.register_section_class(UnequalAngle)
-            self.register_section_class(EqualAngleBackToBack)
-            self.register_section_class(UnequalAngleBackToBack)
-
-            # --- Flats ---
-            from steelsnakes.EU.flats import (
-                Sigma,
-                Zed,
-            )
-            self.register_section_class(Sigma)
-            self.register_section_class(Zed)
-
-        except ImportError as e:
-            # Some section modules may not exist yet - gracefully handle
-            logger.warning(f"Warning: Could not import some EU section classes: {e}")
-
+        """Register all EU section classes automatically.
+        Classes are registered by import path and only imported when their type is first created."""
+        for section_types, module_name, class_name in _EU_SECTION_CLASSES:
+            self.register_lazy_section_class(section_types, module_name, class_name)
 
 # Global instance for convenience
 _global_EU_factory: Optional[EUSectionFactory] = None
+# Factories for explicit data directories, built once per directory
+_EU_factories: dict[Path, EUSectionFactory] = {}
 
 
 def get_EU_factory(data_directory: Optional[Path] = None) -> EUSectionFactory:
-    """Get or create global EU factory instance."""
+    """Get or create global EU factory instance.
+
+    Factories for an explicit `data_directory` are memoized per directory, so the
+    convenience functions (`IPE`, `UB`, `PFC`, `L_EQUAL`, ...) don't rebuild the
+    factory and reload its database on every call.
+    """
     global _global_EU_factory
-    if _global_EU_factory is None or data_directory is not None:
-        database: EUSectionDatabase | None = get_EU_database(data_directory) if data_directory else None
-        _global_EU_factory = EUSectionFactory(database)
-    return _global_EU_factory
+    if data_directory is None:
+        if _global_EU_factory is None:
+            _global_EU_factory = EUSectionFactory()
+        return _global_EU_factory
+
+    key = Path(data_directory)
+    factory: EUSectionFactory | None = _EU_factories.get(key)
+    if factory is None:
+        factory = _EU_factories[key] = EUSectionFactory(get_EU_database(key))
+    return factory
 
 if __name__ == "__main__":
     from steelsnakes.base.exceptions import SectionNotFoundError
@@ -5,7 +5,7 @@ from typing import Any, Union, cast
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.EU.factory import EUSectionFactory, SectionFactory, get_EU_factory
 
-@dataclass
+@dataclass(slots=True)
 class Sigma(BaseSection):
     serial_size: str = ""
     hw: float = 0.0
@@ -36,14 +36,9 @@ class Sigma(BaseSection):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.Sigma
-
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
     
 
-@dataclass
+@dataclass(slots=True)
 class Zed(BaseSection):
     serial_size: str = ""
     hw: float = 0.0 
@@ -71,12 +66,6 @@ class Zed(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.Zed
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
-  
-    
 
 def S_section(designation: str) -> Sigma:
     factory: EUSectionFactory = get_EU_factory()
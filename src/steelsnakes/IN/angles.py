@@ -1,11 +1,11 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Optional
 from pathlib import Path
 from steelsnakes.base import BaseSection, SectionType
 # from steelsnakes.IN.factory import INSectionFactory, get_IN_factory
 
-@dataclass
+@dataclass(slots=True)
 class Angle(BaseSection):
     M: float = 0.0 # Mass per metre (kg/m)
     area: float = 0.0 # Area (x10² mm²)
@@ -35,18 +35,14 @@ class Angle(BaseSection):
     
     I_t: float = 0.0 # Torsional constant (x10⁴ mm⁴)
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return asdict(self)
 
-
-@dataclass
+@dataclass(slots=True)
 class EqualAngle(Angle):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.EA
 
-@dataclass
+@dataclass(slots=True)
 class UnequalAngle(Angle):
     @classmethod
     def get_section_type(cls) -> SectionType:
@@ -1,11 +1,11 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from steelsnakes.base import BaseSection, SectionType
 from typing import Optional, cast, Any
 from pathlib import Path
 # from steelsnakes.IN.factory import INSectionFactory, get_IN_factory
 
-@dataclass
+@dataclass(slots=True)
 class Beam(BaseSection):
     M: float = 0.0 # Mass per metre (kg/m)
     area: float = 0.0 # Area (x100 mm²)
@@ -30,42 +30,38 @@ class Beam(BaseSection):
     I_t: float = 0.0 # Torsional constant (x10⁴ mm⁴)
     I_w: float = 0.0 # Warping constant (x10⁶ mm⁶)
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return asdict(self)
 
-
-@dataclass
+@dataclass(slots=True)
 class JuniorBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.JB
 
-@dataclass
+@dataclass(slots=True)
 class LightWeightBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.LWB
 
-@dataclass
+@dataclass(slots=True)
 class MediumWeightBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.MWB
 
-@dataclass
+@dataclass(slots=True)
 class WideFlangeBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.WFB
 
-@dataclass
+@dataclass(slots=True)
 class NarrowParallelFlangeBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.NPB
 
-@dataclass
+@dataclass(slots=True)
 class WideParallelFlangeBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
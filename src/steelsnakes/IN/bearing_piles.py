@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from steelsnakes.base import BaseSection, SectionType
 
-@dataclass
+@dataclass(slots=True)
 class BearingPile(BaseSection):
     M: float = 0.0 # Mass per metre (kg/m)
     area: float = 0.0 # Area (x10² mm²)
@@ -28,11 +28,11 @@ class BearingPile(BaseSection):
     I_w: float = 0.0 # Warping constant (x10⁶ mm⁶)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParallelFlangeBearingPile(BearingPile):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class PBP(ParallelFlangeBearingPile):
     pass
 
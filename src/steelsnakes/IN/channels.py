@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from steelsnakes.base import BaseSection, SectionType
 
-@dataclass
+@dataclass(slots=True)
 class Channel(BaseSection):
     M: float = 0.0 # Mass per metre (kg/m)
     area: float = 0.0 # Area (x10² mm²)
@@ -29,34 +29,34 @@ class Channel(BaseSection):
     I_w: float = 0.0 # Warping constant (x10⁶ mm⁶)
 
 
-@dataclass
+@dataclass(slots=True)
 class JuniorChannel(Channel):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class LightWeightChannel(Channel):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class MediumWeightChannel(Channel):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class MediumWeightParallelFlangeChannel(Channel):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class JC(JuniorChannel):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class LWC(LightWeightChannel):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class MWC(MediumWeightChannel):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class MPC(MediumWeightParallelFlangeChannel):
     pass
\ No newline at end of file
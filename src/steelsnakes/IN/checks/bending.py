@@ -0,0 +1,66 @@
+# IS 800:2007 Section 8: Bending
+# 8.2.2.1 Elastic lateral buckling moment Mcr; see notes in `IN/checks/__init__.py`
+# Written with NumPy ufuncs, so design-aid tables over (section, effective length) grids are one broadcast
+# rather than a Python double loop.
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from steelsnakes.IN.checks.constants import E_STEEL
+
+
+def elastic_lateral_buckling_moment(Iy: ArrayLike, hf: ArrayLike, ry: ArrayLike, tf: ArrayLike, L_LT: ArrayLike, E: float = E_STEEL) -> np.ndarray:
+    """IS 800:2007 8.2.2.1: Simplified Mcr for standard rolled I-sections and welded doubly-symmetric I-sections.
+    Mcr = (pi²*E*Iy*hf)/(2*L_LT²) * [1 + 0.05*((L_LT/ry)/(hf/tf))²]^0.5. Arguments broadcast.
+
+    Args:
+        Iy: Second moment of area about the minor axis (mm⁴)
+        hf: Centre-to-centre distance between flanges (mm)
+        ry: Radius of gyration about the minor axis (mm)
+        tf: Flange thickness (mm)
+        L_LT: Effective length for lateral-torsional buckling (mm), per 8.3
+        E: Modulus of elasticity (N/mm²)
+
+    Returns:
+        Mcr: Elastic lateral buckling moment (N·mm)
+    """
+    L_LT = np.asarray(L_LT, dtype=float)
+    slenderness_ratio = np.divide(L_LT, ry) / np.divide(hf, tf)
+    return np.pi**2 * E * np.multiply(Iy, hf) / (2.0 * L_LT * L_LT) * np.sqrt(1.0 + 0.05 * slenderness_ratio * slenderness_ratio)
+
+
+def elastic_lateral_buckling_moment_grid(Iy: ArrayLike, hf: ArrayLike, ry: ArrayLike, tf: ArrayLike, L_LT: ArrayLike, E: float = E_STEEL) -> np.ndarray:
+    """IS 800:2007 8.2.2.1: Mcr for every (section, effective length) pair, e.g. for a design-aid table.
+
+    Args:
+        Iy, hf, ry, tf: Section properties as equal-length 1-D arrays, one entry per section (mm⁴, mm)
+        L_LT: Effective lengths for lateral-torsional buckling as a 1-D array (mm)
+        E: Modulus of elasticity (N/mm²)
+
+    Returns:
+        Mcr: Array of shape (sections, lengths) (N·mm)
+    """
+    Iy, hf, ry, tf = (np.asarray(values, dtype=float)[:, np.newaxis] for values in (Iy, hf, ry, tf)) # sections down the rows
+    return elastic_lateral_buckling_moment(Iy, hf, ry, tf, np.asarray(L_LT, dtype=float)[np.newaxis, :], E)
+
+
+def elastic_lateral_buckling_moment_table(arrays: dict[str, np.ndarray], L_LT: ArrayLike, E: float = E_STEEL) -> np.ndarray:
+    """Mcr grid for an I-section family, read straight from `section_arrays()`/`as_arrays()` columns
+    (`D`, `T` in mm; `I_yy`/`I_zz` in x10⁴ mm⁴; `r_y`/`r_z` in mm). The minor axis is taken as the one with the
+    smaller second moment of area, and hf = D - T.
+
+    Args:
+        arrays: Property columns for one section family, one entry per section
+        L_LT: Effective lengths for lateral-torsional buckling as a 1-D array (mm)
+        E: Modulus of elasticity (N/mm²)
+
+    Returns:
+        Mcr: Array of shape (sections, lengths) (N·mm)
+    """
+    I_yy, I_zz = np.asarray(arrays["I_yy"], dtype=float), np.asarray(arrays["I_zz"], dtype=float)
+    minor_is_y = I_yy <= I_zz
+    Iy = 1e4 * np.where(minor_is_y, I_yy, I_zz)
+    ry = np.where(minor_is_y, arrays["r_y"], arrays["r_z"])
+    hf = np.subtract(arrays["D"], arrays["T"])
+    return elastic_lateral_buckling_moment_grid(Iy, hf, ry, arrays["T"], L_LT, E)
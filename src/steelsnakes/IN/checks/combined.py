@@ -0,0 +1,67 @@
+# IS 800:2007 Section 9: Combined Forces
+# 9.2 Combined shear and bending; see notes in `IN/checks/__init__.py`
+# Written with NumPy ufuncs over (section, load case) arrays; intermediates are updated in place so a sweep
+# allocates one working array rather than a temporary per term.
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from steelsnakes.IN.checks.constants import GAMMA_M0
+
+
+def shear_reduction_factor(V: ArrayLike, Vd: ArrayLike) -> np.ndarray:
+    """IS 800:2007 9.2.2(a): beta = (2V/Vd - 1)².
+
+    Args:
+        V: Factored applied shear force (N)
+        Vd: Design shear strength (N), per 8.4.1 or 8.4.2
+
+    Returns:
+        beta: Reduction factor for the moment capacity
+    """
+    beta = np.asarray(np.divide(V, Vd, dtype=float)) # a fresh (0-d for scalars) array, updated in place
+    beta *= 2.0
+    beta -= 1.0
+    return np.square(beta, out=beta)
+
+
+def reduced_design_moment(V: ArrayLike, Vd: ArrayLike, Md: ArrayLike, Mfd: ArrayLike, Ze: ArrayLike, fy: ArrayLike, gamma_M0: float = GAMMA_M0) -> np.ndarray:
+    """IS 800:2007 9.2: Design bending strength under shear for plastic and compact sections.
+    Mdv = Md - beta*(Md - Mfd) <= 1.2*Ze*fy/gamma_M0 when V > 0.6*Vd (9.2.2(a)); Md otherwise (9.2.1).
+    Arguments broadcast.
+
+    Args:
+        V: Factored applied shear force (N)
+        Vd: Design shear strength (N)
+        Md: Plastic design moment disregarding high shear (N·mm), per 8.2.1.2
+        Mfd: Plastic design strength of the section excluding the shear area (N·mm)
+        Ze: Elastic section modulus of the whole section (mm³)
+        fy: Yield stress (N/mm²)
+        gamma_M0: Partial safety factor for material
+
+    Returns:
+        Mdv: Design bending strength under shear (N·mm)
+    """
+    Md = np.asarray(Md, dtype=float)
+    Mdv = np.empty(np.broadcast_shapes(*(np.shape(x) for x in (V, Vd, Md, Mfd, Ze, fy)))) # the one working array
+    np.subtract(Md, Mfd, out=Mdv)
+    Mdv *= shear_reduction_factor(V, Vd)
+    np.subtract(Md, Mdv, out=Mdv)
+    np.minimum(Mdv, 1.2 * np.multiply(Ze, fy) / gamma_M0, out=Mdv)
+    low_shear = np.less_equal(V, np.multiply(0.6, Vd))
+    return np.where(low_shear, Md, Mdv)
+
+
+def reduced_design_moment_semi_compact(Ze: ArrayLike, fy: ArrayLike, gamma_M0: float = GAMMA_M0) -> np.ndarray:
+    """IS 800:2007 9.2.2(b): Mdv = Ze*fy/gamma_M0 for semi-compact sections under high shear.
+
+    Args:
+        Ze: Elastic section modulus of the whole section (mm³)
+        fy: Yield stress (N/mm²)
+        gamma_M0: Partial safety factor for material
+
+    Returns:
+        Mdv: Design bending strength under shear (N·mm)
+    """
+    return np.multiply(Ze, fy) / gamma_M0
@@ -0,0 +1,116 @@
+# IS 800:2007 Section 7: Compression
+# 7.1.2.1 fcd - Design compressive stress of axially loaded compression members; see notes in `IN/checks/__init__.py`
+# Written with NumPy ufuncs so one call evaluates a single member or a whole (section, length) sweep,
+# e.g. `design_compressive_stress(250.0, K * L / arrays["r_z"], 0.34)` over `section_arrays()` columns.
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from steelsnakes.IN.checks.constants import E_STEEL, GAMMA_M0
+
+# Table 7: imperfection factor alpha per buckling class
+IMPERFECTION_FACTORS: dict[str, float] = {"a": 0.21, "b": 0.34, "c": 0.49, "d": 0.76}
+
+
+def euler_buckling_stress(KL_r: ArrayLike, E: float = E_STEEL) -> np.ndarray:
+    """IS 800:2007 7.1.2.1: Euler buckling stress fcc = pi²E/(KL/r)².
+
+    Args:
+        KL_r: Effective slenderness ratio KL/r
+        E: Modulus of elasticity (N/mm²)
+
+    Returns:
+        fcc: Euler buckling stress (N/mm²)
+    """
+    with np.errstate(divide="ignore"): # KL/r = 0 gives fcc = inf, i.e. no buckling (chi = 1)
+        return np.pi**2 * E / np.square(KL_r)
+
+
+def nondimensional_slenderness(fy: ArrayLike, KL_r: ArrayLike, E: float = E_STEEL) -> np.ndarray:
+    """IS 800:2007 7.1.2.1: Non-dimensional effective slenderness ratio lambda = sqrt(fy/fcc).
+
+    Args:
+        fy: Yield stress (N/mm²)
+        KL_r: Effective slenderness ratio KL/r
+        E: Modulus of elasticity (N/mm²)
+
+    Returns:
+        lambda: Non-dimensional effective slenderness ratio
+    """
+    return np.sqrt(np.divide(fy, euler_buckling_stress(KL_r, E)))
+
+
+def stress_reduction_factor(fy: ArrayLike, KL_r: ArrayLike, alpha: ArrayLike, E: float = E_STEEL) -> np.ndarray:
+    """IS 800:2007 7.1.2.1: Stress reduction factor chi = 1/(phi + sqrt(phi² - lambda²)), capped at 1.0.
+
+    Args:
+        fy: Yield stress (N/mm²)
+        KL_r: Effective slenderness ratio KL/r
+        alpha: Imperfection factor from Table 7, see `IMPERFECTION_FACTORS`
+        E: Modulus of elasticity (N/mm²)
+
+    Returns:
+        chi: Stress reduction factor for the buckling class
+    """
+    lam = nondimensional_slenderness(fy, KL_r, E)
+    phi = 0.5 * (1.0 + np.multiply(alpha, lam - 0.2) + lam * lam)
+    return np.minimum(1.0 / (phi + np.sqrt(phi * phi - lam * lam)), 1.0)
+
+
+def design_compressive_stress(fy: ArrayLike, KL_r: ArrayLike, alpha: ArrayLike, E: float = E_STEEL, gamma_M0: float = GAMMA_M0) -> np.ndarray:
+    """IS 800:2007 7.1.2.1: Design compressive stress fcd = chi*fy/gamma_M0 <= fy/gamma_M0.
+    Arguments broadcast, so arrays of slenderness ratios (or yield stresses) are evaluated in one pass.
+
+    Args:
+        fy: Yield stress (N/mm²)
+        KL_r: Effective slenderness ratio KL/r
+        alpha: Imperfection factor from Table 7, see `IMPERFECTION_FACTORS`
+        E: Modulus of elasticity (N/mm²)
+        gamma_M0: Partial safety factor for material
+
+    Returns:
+        fcd: Design compressive stress (N/mm²)
+    """
+    return stress_reduction_factor(fy, KL_r, alpha, E) * np.divide(fy, gamma_M0)
+
+
+def design_compressive_strength(Ae: ArrayLike, fy: ArrayLike, KL_r: ArrayLike, alpha: ArrayLike, E: float = E_STEEL, gamma_M0: float = GAMMA_M0) -> np.ndarray:
+    """IS 800:2007 7.1.2: Design compressive strength Pd = Ae*fcd.
+
+    Args:
+        Ae: Effective sectional area (mm²), per 7.3.2
+        fy: Yield stress (N/mm²)
+        KL_r: Effective slenderness ratio KL/r
+        alpha: Imperfection factor from Table 7, see `IMPERFECTION_FACTORS`
+        E: Modulus of elasticity (N/mm²)
+        gamma_M0: Partial safety factor for material
+
+    Returns:
+        Pd: Design compressive strength (N)
+    """
+    return np.multiply(Ae, design_compressive_stress(fy, KL_r, alpha, E, gamma_M0))
+
+
+def design_compressive_strength_table(arrays: dict[str, np.ndarray], KL: ArrayLike, fy: ArrayLike, alpha: ArrayLike, E: float = E_STEEL, gamma_M0: float = GAMMA_M0) -> np.ndarray:
+    """Pd for every section in a family, read straight from `section_arrays()`/`as_arrays()` columns
+    (`area` in x100 mm², `r_y`/`r_z` in mm), buckling about the axis with the smaller radius of gyration.
+    Gross area is taken as Ae, i.e. plastic, compact and semi-compact sections (7.3.2).
+
+    Args:
+        arrays: Property columns for one section family, one entry per section
+        KL: Effective length (mm); a 1-D array gives an array of shape (sections, lengths)
+        fy: Yield stress (N/mm²)
+        alpha: Imperfection factor from Table 7, see `IMPERFECTION_FACTORS`
+        E: Modulus of elasticity (N/mm²)
+        gamma_M0: Partial safety factor for material
+
+    Returns:
+        Pd: Design compressive strength (N)
+    """
+    KL = np.asarray(KL, dtype=float)
+    Ae = 100.0 * np.asarray(arrays["area"], dtype=float)
+    r = np.minimum(arrays["r_y"], arrays["r_z"])
+    if KL.ndim: # sections down the rows, lengths across the columns
+        Ae, r = Ae[:, np.newaxis], r[:, np.newaxis]
+    return design_compressive_strength(Ae, fy, KL / r, alpha, E, gamma_M0)
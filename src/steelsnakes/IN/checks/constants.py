@@ -0,0 +1,4 @@
+# IS 800:2007 constants shared by the IN checks; see notes in `IN/checks/__init__.py`
+
+E_STEEL: float = 2.0e5 # Modulus of elasticity (N/mm²), IS 800:2007 clause 2.2.4.1
+GAMMA_M0: float = 1.10 # Partial safety factor for failure in tension by yielding, Table 5
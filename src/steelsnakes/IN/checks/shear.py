@@ -0,0 +1,104 @@
+# IS 800:2007 Section 8: Bending - 8.4 Shear
+# 8.4.1.1 Shear area Av; see notes in `IN/checks/__init__.py`
+# Written with NumPy ufuncs, so a family's shear areas are one array operation over `section_arrays()` columns
+# and can be kept as derived columns rather than recomputed per section per load case.
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from steelsnakes.IN.checks.constants import GAMMA_M0
+
+
+def shear_area_I_major(h: ArrayLike, tw: ArrayLike) -> np.ndarray:
+    """IS 800:2007 8.4.1.1: Shear area of hot-rolled I- and channel sections, load parallel to the web: Av = h*tw.
+
+    Args:
+        h: Overall depth (mm)
+        tw: Web thickness (mm)
+
+    Returns:
+        Av: Shear area (mm²)
+    """
+    return np.multiply(h, tw)
+
+
+def shear_area_I_minor(b: ArrayLike, tf: ArrayLike) -> np.ndarray:
+    """IS 800:2007 8.4.1.1: Shear area of I- and channel sections, load parallel to the flanges: Av = 2*b*tf.
+
+    Args:
+        b: Flange width (mm)
+        tf: Flange thickness (mm)
+
+    Returns:
+        Av: Shear area (mm²)
+    """
+    return 2.0 * np.multiply(b, tf)
+
+
+def shear_area_RHS(A: ArrayLike, h: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """IS 800:2007 8.4.1.1: Shear area of rectangular hollow sections of uniform thickness, load parallel
+    to the depth: Av = A*h/(b+h). Swap `h` and `b` for load parallel to the width.
+
+    Args:
+        A: Cross-sectional area (mm²)
+        h: Overall depth (mm)
+        b: Overall width (mm)
+
+    Returns:
+        Av: Shear area (mm²)
+    """
+    return np.multiply(A, h) / np.add(b, h)
+
+
+def shear_area_CHS(A: ArrayLike) -> np.ndarray:
+    """IS 800:2007 8.4.1.1: Shear area of circular hollow sections of uniform thickness: Av = 2*A/pi.
+
+    Args:
+        A: Cross-sectional area (mm²)
+
+    Returns:
+        Av: Shear area (mm²)
+    """
+    return 2.0 * np.asarray(A, dtype=float) / np.pi
+
+
+def I_section_shear_areas(arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Derived `Av_major`/`Av_minor` columns for IN beams and columns, from `section_arrays()` output
+    (`D` depth, `B` width, `t` web and `T` flange thickness, in mm). Merge them into the arrays once and
+    read them in every load case instead of recomputing.
+
+    Returns:
+        `{"Av_major": h*tw, "Av_minor": 2*b*tf}` (mm²)
+    """
+    return {
+        "Av_major": shear_area_I_major(arrays["D"], arrays["t"]),
+        "Av_minor": shear_area_I_minor(arrays["B"], arrays["T"]),
+    }
+
+
+def plastic_shear_resistance(Av: ArrayLike, fyw: ArrayLike) -> np.ndarray:
+    """IS 800:2007 8.4.1: Nominal plastic shear resistance Vp = Av*fyw/sqrt(3).
+
+    Args:
+        Av: Shear area (mm²)
+        fyw: Yield strength of the web (N/mm²)
+
+    Returns:
+        Vp: Nominal plastic shear resistance (N)
+    """
+    return np.multiply(Av, fyw) / np.sqrt(3.0)
+
+
+def design_shear_strength(Av: ArrayLike, fyw: ArrayLike, gamma_M0: float = GAMMA_M0) -> np.ndarray:
+    """IS 800:2007 8.4: Design shear strength Vd = Vn/gamma_M0, with Vn governed by plastic shear (8.4.1).
+
+    Args:
+        Av: Shear area (mm²)
+        fyw: Yield strength of the web (N/mm²)
+        gamma_M0: Partial safety factor for material
+
+    Returns:
+        Vd: Design shear strength (N)
+    """
+    return plastic_shear_resistance(Av, fyw) / gamma_M0
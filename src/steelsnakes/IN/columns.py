@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from steelsnakes.base import BaseSection, SectionType
 
-@dataclass
+@dataclass(slots=True)
 class Column(BaseSection):
     M: float = 0.0 # Mass per metre (kg/m)
     area: float = 0.0 # Area (x10² mm²)
@@ -28,20 +28,20 @@ class Column(BaseSection):
     I_w: float = 0.0 # Warping constant (x10⁶ mm⁶)
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardColumn(Column):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class HeavyWeightBeam(Column):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class SC(StandardColumn):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class HWB(HeavyWeightBeam):
     pass
\ No newline at end of file
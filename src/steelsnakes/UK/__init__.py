@@ -2,63 +2,61 @@
 UK Steel Sections Module.
 """
 
+import logging
 from typing import Optional
 
 # Import base infrastructure
 from steelsnakes.base.sections import BaseSection, SectionType
-from steelsnakes.UK.database import UKSectionDatabase, get_uk_database
+from steelsnakes.UK.database import UKSectionDatabase, get_uk_database, get_UK_database
 from steelsnakes.UK.factory import UKSectionFactory, get_UK_factory
 
-# Import Universal sections
-from steelsnakes.UK.universal import (
-    UniversalSection,
-    UniversalBeam,
-    UniversalColumn,
-    UniversalBearingPile,
-    UB,
-    UC,
-    UBP,
-)
+logger: logging.Logger = logging.getLogger(__name__)
 
-# Import Channel sections
-from steelsnakes.UK.channels import (
-    ParallelFlangeChannel,
-    PFC,
-)
+# --- Lazy exports ---
+# Section modules are only imported on first attribute access (PEP 562), so `import steelsnakes.UK`
+# doesn't import every section family; the factory itself is built by the first `create_section()`.
+from steelsnakes.base._lazy import install as _install_lazy
 
-# Import Angle sections
-from steelsnakes.UK.angles import (
-    EqualAngle,
-    UnequalAngle,
-    EqualAngleBackToBack,
-    UnequalAngleBackToBack,
-    L_EQUAL,
-    L_UNEQUAL,
-    L_EQUAL_B2B,
-    L_UNEQUAL_B2B,
-)
-
-# Import Cold Formed Hollow sections
-from steelsnakes.UK.cf_hollow import (
-    ColdFormedCircularHollowSection,
-    ColdFormedSquareHollowSection,
-    ColdFormedRectangularHollowSection,
-    CFCHS,
-    CFSHS,
-    CFRHS,
-)
+_LAZY: dict[str, str] = {
+    # Universal sections
+    "UniversalSection": "steelsnakes.UK.universal",
+    "UniversalBeam": "steelsnakes.UK.universal",
+    "UniversalColumn": "steelsnakes.UK.universal",
+    "UniversalBearingPile": "steelsnakes.UK.universal",
+    "UB": "steelsnakes.UK.universal",
+    "UC": "steelsnakes.UK.universal",
+    "UBP": "steelsnakes.UK.universal",
+    # Channel sections
+    "ParallelFlangeChannel": "steelsnakes.UK.channels",
+    "PFC": "steelsnakes.UK.channels",
+    # Angle sections
+    "EqualAngle": "steelsnakes.UK.angles",
+    "UnequalAngle": "steelsnakes.UK.angles",
+    "EqualAngleBackToBack": "steelsnakes.UK.angles",
+    "UnequalAngleBackToBack": "steelsnakes.UK.angles",
+    "L_EQUAL": "steelsnakes.UK.angles",
+    "L_UNEQUAL": "steelsnakes.UK.angles",
+    "L_EQUAL_B2B": "steelsnakes.UK.angles",
+    "L_UNEQUAL_B2B": "steelsnakes.UK.angles",
+    # Cold Formed Hollow sections
+    "ColdFormedCircularHollowSection": "steelsnakes.UK.cf_hollow",
+    "ColdFormedSquareHollowSection": "steelsnakes.UK.cf_hollow",
+    "ColdFormedRectangularHollowSection": "steelsnakes.UK.cf_hollow",
+    "CFCHS": "steelsnakes.UK.cf_hollow",
+    "CFSHS": "steelsnakes.UK.cf_hollow",
+    "CFRHS": "steelsnakes.UK.cf_hollow",
+    # Hot Finished Hollow sections
+    "HotFinishedCircularHollowSection": "steelsnakes.UK.hf_hollow",
+    "HotFinishedSquareHollowSection": "steelsnakes.UK.hf_hollow",
+    "HotFinishedRectangularHollowSection": "steelsnakes.UK.hf_hollow",
+    "HotFinishedEllipticalHollowSection": "steelsnakes.UK.hf_hollow",
+    "HFCHS": "steelsnakes.UK.hf_hollow",
+    "HFSHS": "steelsnakes.UK.hf_hollow",
+    "HFRHS": "steelsnakes.UK.hf_hollow",
+    "HFEHS": "steelsnakes.UK.hf_hollow",
+}
 
-# Import Hot Finished Hollow sections
-from steelsnakes.UK.hf_hollow import (
-    HotFinishedCircularHollowSection,
-    HotFinishedSquareHollowSection,
-    HotFinishedRectangularHollowSection,
-    HotFinishedEllipticalHollowSection,
-    HFCHS,
-    HFSHS,
-    HFRHS,
-    HFEHS,
-)
+_install_lazy(globals(), _LAZY)
 
 
 __all__ = [
@@ -68,6 +66,7 @@ __all__ = [
     "UKSectionDatabase",
     "UKSectionFactory",
     "get_uk_database",
+    "get_UK_database",
     "get_UK_factory",
     
     # Universal sections
@@ -113,21 +112,6 @@ __all__ = [
 ]
 
 
-# Auto-register all section classes on import
-def _register_all_uk_sections():
-    """Register all UK section classes with the global factory."""
-    try:
-        factory = get_UK_factory()
-        # Factory constructor automatically calls _register_default_classes()
-        # which registers all available section classes
-    except Exception as e:
-        print(f"Warning: Could not auto-register UK section classes: {e}")
-
-
-# Initialize on import
-_register_all_uk_sections()
-
-
 # Convenience function for creating sections without specifying type
 def create_section(designation: str, section_type: Optional[SectionType] = None):
     """
@@ -7,13 +7,13 @@ TODO: Fix UK/EU angle classes and properties; do dataprep again for UK sections
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Any, cast
+from typing import Optional, Any
 
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.UK.factory import UKSectionFactory, get_UK_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class EqualAngle(BaseSection):
     """
     Equal Angle (L_EQUAL) section.
@@ -63,13 +63,9 @@ class EqualAngle(BaseSection):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L_EQUAL
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return vars(self).copy()
 
 
-@dataclass
+@dataclass(slots=True)
 class UnequalAngle(BaseSection):
     """
     Unequal Angle (L_UNEQUAL) section.
@@ -123,13 +119,9 @@ class UnequalAngle(BaseSection):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L_UNEQUAL
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return vars(self).copy()
 
 
-@dataclass
+@dataclass(slots=True)
 class EqualAngleBackToBack(BaseSection):
     """
     Back-to-Back Equal Angles (L_EQUAL_B2B) section.
@@ -153,13 +145,9 @@ class EqualAngleBackToBack(BaseSection):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L_EQUAL_B2B
-    
-    def get_properties(self) -> dict[str,Any]:
-        """Return all section properties as a dictionary."""
-        return vars(self).copy()
 
 
-@dataclass
+@dataclass(slots=True)
 class UnequalAngleBackToBack(BaseSection):
     """
     Back-to-Back Unequal Angles (L_UNEQUAL_B2B) section.
@@ -185,37 +173,29 @@ class UnequalAngleBackToBack(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.L_UNEQUAL_B2B
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return vars(self).copy()
-
 # Convenience functions for direct instantiation
 def L_EQUAL(designation: str, data_directory: Optional[Path] = None) -> EqualAngle:
     """Create an Equal Angle section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.L_EQUAL)
-    return cast(EqualAngle, factory.create_section(designation, SectionType.L_EQUAL))
+    return factory.create_section(designation, SectionType.L_EQUAL)
 
 
 def L_UNEQUAL(designation: str, data_directory: Optional[Path] = None) -> UnequalAngle:
     """Create an Unequal Angle section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.L_UNEQUAL)
-    return cast(UnequalAngle, factory.create_section(designation, SectionType.L_UNEQUAL))
+    return factory.create_section(designation, SectionType.L_UNEQUAL)
 
 
 def L_EQUAL_B2B(designation: str, data_directory: Optional[Path] = None) -> EqualAngleBackToBack:
     """Create a Back-to-Back Equal Angles section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.L_EQUAL_B2B)
-    return cast(EqualAngleBackToBack, factory.create_section(designation, SectionType.L_EQUAL_B2B))
+    return factory.create_section(designation, SectionType.L_EQUAL_B2B)
 
 
 def L_UNEQUAL_B2B(designation: str, data_directory: Optional[Path] = None) -> UnequalAngleBackToBack:
     """Create a Back-to-Back Unequal Angles section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.L_UNEQUAL_B2B)
-    return cast(UnequalAngleBackToBack, factory.create_section(designation, SectionType.L_UNEQUAL_B2B))
+    return factory.create_section(designation, SectionType.L_UNEQUAL_B2B)
 
 if __name__ == "__main__":
     # factory = get_UK_factory()
@@ -6,13 +6,13 @@ This module implements Cold Formed Circular, Square, and Rectangular Hollow Sect
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Any, cast
+from typing import Optional, Any
 
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.UK.factory import UKSectionFactory, get_UK_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class ColdFormedCircularHollowSection(BaseSection):
     """Cold Formed Circular Hollow Section (CFCHS)."""
     
@@ -36,13 +36,9 @@ class ColdFormedCircularHollowSection(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.CFCHS
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ColdFormedSquareHollowSection(BaseSection):
     """Cold Formed Square Hollow Section (CFSHS)."""
     
@@ -66,13 +62,9 @@ class ColdFormedSquareHollowSection(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.CFSHS
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ColdFormedRectangularHollowSection(BaseSection):
     """Cold Formed Rectangular Hollow Section (CFRHS)."""
     
@@ -101,31 +93,24 @@ class ColdFormedRectangularHollowSection(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.CFRHS
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 # Convenience functions
 def CFCHS(designation: str, data_directory: Optional[Path] = None) -> ColdFormedCircularHollowSection:
     """Create a Cold Formed Circular Hollow Section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.CFCHS)
-    return cast(ColdFormedCircularHollowSection, factory.create_section(designation, SectionType.CFCHS))
+    return factory.create_section(designation, SectionType.CFCHS)
 
 
 def CFSHS(designation: str, data_directory: Optional[Path] = None) -> ColdFormedSquareHollowSection:
     """Create a Cold Formed Square Hollow Section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.CFSHS)
-    return cast(ColdFormedSquareHollowSection, factory.create_section(designation, SectionType.CFSHS))
+    return factory.create_section(designation, SectionType.CFSHS)
 
 
 def CFRHS(designation: str, data_directory: Optional[Path] = None) -> ColdFormedRectangularHollowSection:
     """Create a Cold Formed Rectangular Hollow Section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.CFRHS)
-    return cast(ColdFormedRectangularHollowSection, factory.create_section(designation, SectionType.CFRHS))
+    return factory.create_section(designation, SectionType.CFRHS)
 
 
 if __name__ == "__main__":
@@ -6,13 +6,13 @@ This module implements Parallel Flange Channels (PFC).
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Any, cast
+from typing import Optional, Any
 
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.UK.factory import UKSectionFactory, get_UK_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class ParallelFlangeChannel(BaseSection):
     """
     Parallel Flange Channel (PFC) section.
@@ -56,10 +56,6 @@ class ParallelFlangeChannel(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.PFC
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
 
@@ -67,8 +63,7 @@ class ParallelFlangeChannel(BaseSection):
 def PFC(designation: str, data_directory: Optional[Path] = None) -> ParallelFlangeChannel:
     """Create a Parallel Flange Channel section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.PFC)
-    return cast(ParallelFlangeChannel, factory.create_section(designation, SectionType.PFC))
+    return factory.create_section(designation, SectionType.PFC)
 
 if __name__ == "__main__":
     print(PFC("430x100x64").get_properties())
@@ -1,4 +1,15 @@
 # Cl. 6.3 Buckling
+# Written with NumPy ufuncs so one call evaluates a single member or every (section, length) combination at once,
+# e.g. over `SectionDatabase.as_arrays()` / `section_arrays()` columns.
+
+from __future__ import annotations
+from enum import IntEnum
+import math
+import numpy as np
+from numpy.typing import ArrayLike
+
+from steelsnakes.UK.checks.uls import gamma_m1
+
 
 # Cl. 6.3.1 Uniform members in compression
 # Cl. 6.3.1.1(3) - design buckling resistance for Class 1, 2 & 3 cross-sections N_bRd
@@ -11,14 +22,149 @@
 # alpha (!= alpha in biaxial bending) is imperfection factor # TODO: IMPORTANT: delineate shared values/variables like alpha
 # Ncr is elastic critical force for given buckling mode
 # alpha is read off from Table 6.1 corresponding to buckling curve which is read off from Table 6.2
-# TODO: table 6.1 is simple dictionary: {'curve': alpha} = {'a0': 0.13, 'a': 0.21, 'b': 0.34, 'c': 0.49, 'd': 0.76}
+# Table 6.1 is {'curve': alpha} = {'a0': 0.13, 'a': 0.21, 'b': 0.34, 'c': 0.49, 'd': 0.76}; stored below as a tuple indexed by `BucklingCurve`
 # TODO: implement Table 6.2; specify also rolled/welded. See if table is flattenable; check Members.md
 
+class BucklingCurve(IntEnum):
+    """EN 1993-1-1:2005 Table 6.1 buckling curves; the value indexes `_ALPHA`."""
+    a0 = 0
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+
+
+# Table 6.1: imperfection factor alpha, indexed by `BucklingCurve`
+_ALPHA: tuple[float, ...] = (0.13, 0.21, 0.34, 0.49, 0.76)
+_ALPHA_ARRAY: np.ndarray = np.array(_ALPHA) # `_ALPHA_ARRAY[curves]` for an integer array of curves
+
+
+def imperfection_factor(curve: BucklingCurve | ArrayLike) -> float | np.ndarray:
+    """EN 1993-1-1:2005 Table 6.1: Imperfection factor alpha for a buckling curve, or an array of them.
+
+    Args:
+        curve: `BucklingCurve`, or an integer array of curves for vectorised member checks
+
+    Returns:
+        alpha: Imperfection factor
+    """
+    if isinstance(curve, int):
+        return _ALPHA[curve]
+    return _ALPHA_ARRAY[np.asarray(curve, dtype=np.intp)]
+
+
+def reduction_factor(lambda_bar: ArrayLike, alpha: ArrayLike) -> float | np.ndarray:
+    """EN 1993-1-1:2005 equation 6.49: Reduction factor for the relevant buckling mode.
+    chi = 1/(phi + sqrt(phi² - lambda_bar²)) <= 1.0; phi = 0.5[1 + alpha(lambda_bar - 0.2) + lambda_bar²].
+    Scalar arguments give a float; array arguments broadcast to an array.
+
+    Args:
+        lambda_bar: Non-dimensional slenderness
+        alpha: Imperfection factor from Table 6.1
+
+    Returns:
+        chi: Reduction factor
+    """
+    lambda_bar = np.asarray(lambda_bar, dtype=float)
+    lambda_sq = lambda_bar * lambda_bar
+    phi = 0.5 * (1.0 + np.multiply(alpha, lambda_bar - 0.2) + lambda_sq)
+    chi = np.minimum(1.0 / (phi + np.sqrt(phi * phi - lambda_sq)), 1.0)
+    return chi if chi.ndim else float(chi)
+
+
+def chi_flexural(A: ArrayLike, f_y: ArrayLike, N_cr: ArrayLike, alpha: ArrayLike) -> float | np.ndarray:
+    """EN 1993-1-1:2005 equations 6.49 & 6.50: Flexural buckling reduction factor for Class 1, 2 & 3 sections.
+    Arguments broadcast.
+
+    Args:
+        A: Cross-sectional area (mm²)
+        f_y: Yield strength (N/mm²)
+        N_cr: Elastic critical force for the relevant buckling mode (N)
+        alpha: Imperfection factor from Table 6.1
+
+    Returns:
+        chi: Reduction factor
+    """
+    return reduction_factor(non_dimensional_slenderness(A, f_y, N_cr), alpha)
+
+
+def buckling_resistance(chi: ArrayLike, A: ArrayLike, f_y: ArrayLike, gamma_M1: float = gamma_m1) -> np.ndarray:
+    """EN 1993-1-1:2005 equation 6.47: Design buckling resistance N_bRd = chi*A*f_y/gamma_M1 for Class 1, 2 & 3 sections.
+
+    Args:
+        chi: Reduction factor for the relevant buckling mode
+        A: Cross-sectional area (mm²)
+        f_y: Yield strength (N/mm²)
+        gamma_M1: Partial factor for resistance of members to instability
+
+    Returns:
+        N_bRd: Design buckling resistance (N)
+    """
+    return np.multiply(chi, np.multiply(A, f_y)) / gamma_M1
+
 # Cl. 6.3.1.3 Slenderness for flexural buckling
 # eq. 6.50 lambda_bar for Class 1, 2 & 3 cross-sections
 # lambda_bar = sqrt(A*f_y/N_cr) = Lcr/i * 1/lambda_1; Lcr is critical buckling length; i is radius of gyration about relevant axis
 # lambda_1 = pi*sqrt(E/f_y) = 93.9*epsilon; epsilon = sqrt(235/f_y)
 
+E_STEEL: float = 210_000.0 # Modulus of elasticity (N/mm²), Cl. 3.2.6
+
+# epsilon and lambda_1 for the yield strengths of the standard grades (N/mm²), looked up rather than recomputed per member
+_EPSILON: dict[float, float] = {f_y: math.sqrt(235.0 / f_y) for f_y in (235, 275, 355, 420, 460)}
+_LAMBDA_1: dict[float, float] = {f_y: math.pi * math.sqrt(E_STEEL / f_y) for f_y in (235, 275, 355, 420, 460)}
+_INV_LAMBDA_1: dict[float, float] = {f_y: 1.0 / value for f_y, value in _LAMBDA_1.items()} # so eq. 6.50 is a multiply
+
+
+def epsilon(f_y: ArrayLike) -> float | np.ndarray:
+    """EN 1993-1-1:2005 Table 5.2: epsilon = sqrt(235/f_y), with f_y in N/mm². An array of f_y gives an array."""
+    if np.ndim(f_y) == 0:
+        try:
+            return _EPSILON[float(f_y)]
+        except KeyError:
+            return math.sqrt(235.0 / f_y)
+    return np.sqrt(235.0 / np.asarray(f_y, dtype=float))
+
+
+def lambda_1(f_y: ArrayLike) -> float | np.ndarray:
+    """EN 1993-1-1:2005 Cl. 6.3.1.3: lambda_1 = pi*sqrt(E/f_y) = 93.9*epsilon, with f_y in N/mm². An array of f_y gives an array."""
+    if np.ndim(f_y) == 0:
+        try:
+            return _LAMBDA_1[float(f_y)]
+        except KeyError:
+            return math.pi * math.sqrt(E_STEEL / f_y)
+    return np.pi * np.sqrt(E_STEEL / np.asarray(f_y, dtype=float))
+
+
+def flexural_slenderness(L_cr: ArrayLike, i: ArrayLike, f_y: ArrayLike) -> np.ndarray:
+    """EN 1993-1-1:2005 equation 6.50: lambda_bar = L_cr/(i*lambda_1) for Class 1, 2 & 3 sections.
+    Arguments broadcast, so a grid of buckling lengths, radii of gyration and yield strengths is evaluated in one pass.
+
+    Args:
+        L_cr: Buckling length in the plane considered (mm)
+        i: Radius of gyration about the relevant axis (mm)
+        f_y: Yield strength (N/mm²); the standard grades are looked up, other values computed
+
+    Returns:
+        lambda_bar: Non-dimensional slenderness
+    """
+    inv_lambda_1 = _INV_LAMBDA_1.get(float(f_y)) if np.ndim(f_y) == 0 else None
+    if inv_lambda_1 is None:
+        inv_lambda_1 = 1.0 / lambda_1(f_y)
+    return np.divide(L_cr, i) * inv_lambda_1
+
+def non_dimensional_slenderness(A: ArrayLike, f_y: ArrayLike, N_cr: ArrayLike) -> np.ndarray:
+    """EN 1993-1-1:2005 equation 6.50: lambda_bar = sqrt(A*f_y/N_cr) for Class 1, 2 & 3 sections.
+
+    Args:
+        A: Cross-sectional area (mm²)
+        f_y: Yield strength (N/mm²)
+        N_cr: Elastic critical force for the relevant buckling mode (N)
+
+    Returns:
+        lambda_bar: Non-dimensional slenderness
+    """
+    return np.sqrt(np.multiply(A, f_y) / N_cr)
+
 # Cl. 6.3.1.4 Slenderness for torsional and torsional-flexural buckling
 # eq. 6.52 lambdaT_bar for Class 1, 2 & 3 cross-sections
 # lambdaT_bar = sqrt(A*f_y/N_cr); N_cr = N_crTF but N_cr < N_crT; N_crT: elastic torsional buckling force; N_crTF: elastic torsional-flexural buckling force
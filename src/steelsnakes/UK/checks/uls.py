@@ -1,7 +1,12 @@
-import numpy as np
-from typing import Any, Optional, Union, Literal, cast
-from steelsnakes.base.checks import UtilisationCheck, Scalar, Reference, SectionClass
-from steelsnakes.base.sections import BaseSection, SectionType
+from __future__ import annotations
+import math
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, Literal, cast
+from steelsnakes.base.checks import UtilisationCheck, UtilisationCheckArray, Scalar, Reference, SectionClass, compute_utilisation
+from steelsnakes.base.sections import BaseSection, SectionType, parse_designation
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
 
 # from steelsnakes.base.checks import BaseCheck   
 # TODO: Write equations with clauses
@@ -13,6 +18,21 @@ gamma_m0 = 1.0 # x-section resistance, whatever the class
 gamma_m1 = 1.0 # resistance of members to instability assessed by member checks
 gamma_m2 = 1.25 # resistance of x-sections in tension to fracture; is 1.10 in UK NA to EN 1993-1-1:2005 
 
+# Clause references returned with every check; built once and shared (`Reference` is frozen)
+_REF_6_5 = Reference(code="EN_1993", clause="6.2.3", equation="6.5")
+_REF_6_9 = Reference(code="EN_1993", clause="6.2.4", equation="6.9")
+_REF_6_12 = Reference(code="EN_1993", clause="6.2.5", equation="6.12")
+_REF_6_17 = Reference(code="EN_1993", clause="6.2.6", equation="6.17")
+_REF_6_41 = Reference(code="EN_1993", clause="6.2.9.1", equation="6.41")
+
+# The `*_batch` variants take arrays of design forces and resistances (broadcast against each other), e.g. every
+# member x load case of a design sweep, and return one `UtilisationCheckArray` instead of a `UtilisationCheck` each.
+# NumPy is imported inside them, so the scalar checks stay importable without it.
+def _batch_check(utilisation: np.ndarray, reference: Reference) -> UtilisationCheckArray:
+    """Wrap full-precision utilisation ratios with their adequacy mask."""
+    return UtilisationCheckArray(utilisation=utilisation, adequate=utilisation <= 1.0, reference=reference)
+
+
 # --------------------------------------------------------------------------------------
 # eq. 6.2; for Class 1, 2, 3 sections
 # (N_Ed/N_Rd + My_Ed/My_Rd + Mz_Ed/Mz_Rd) <= 1.0
@@ -31,14 +51,21 @@ def tension_utilisation(N_Ed: float, N_tRd: float) -> UtilisationCheck:
     Returns:
         Tension utilisation (N_Ed / N_tRd)
     """
-    utilisation = np.divide(N_Ed, N_tRd) # N_Ed / N_tRd
+    utilisation = compute_utilisation(N_Ed, N_tRd) # N_Ed / N_tRd; inf for a zero resistance, as in the batch check
     return UtilisationCheck(
-        utilisation=round(utilisation, ndigits=3),
+        utilisation=utilisation,
         metadata={},
         adequacy="OK" if utilisation <= 1.0 else "FAILS",  # TODO: improve, check against tolerances using numpy
-        reference=Reference(code="EN_1993", clause="6.2.3", equation="6.5")
+        reference=_REF_6_5
     )
 
+def tension_utilisation_batch(N_Ed: ArrayLike, N_tRd: ArrayLike) -> UtilisationCheckArray:
+    """EN 1993-1-1:2005 equation 6.5: `tension_utilisation` over arrays of design axial forces and resistances (N)."""
+    import numpy as np
+
+    utilisation = np.atleast_1d(np.divide(N_Ed, N_tRd, dtype=float))
+    return _batch_check(utilisation, _REF_6_5)
+
 # --------------------------------------------------------------------------------------
 
 # Cl. 6.2.4 Compression (Axial)
@@ -55,7 +82,7 @@ def compression_utilisation(N_Ed: float, N_cRd: float) -> UtilisationCheck:
     Returns:
         Compression utilisation (N_Ed / N_cRd)
     """
-    utilisation = np.divide(N_Ed, N_cRd) # N_Ed / N_cRd
+    utilisation = compute_utilisation(N_Ed, N_cRd) # N_Ed / N_cRd
     # return {
     #     "Utilisation": np.round(utilisation, ndigits=3),
     #     "Adequacy": "OK" if utilisation <= 1.0 else "FAILS", # TODO: improve, check against tolerances using numpy
@@ -64,7 +91,14 @@ def compression_utilisation(N_Ed: float, N_cRd: float) -> UtilisationCheck:
 
     # }
 
-    return UtilisationCheck(utilisation=utilisation, metadata={}, adequacy="OK" if utilisation <= 1.0 else "FAILS", reference=Reference(code="EN_1993", clause="6.2.4", equation="6.9"))
+    return UtilisationCheck(utilisation=utilisation, metadata={}, adequacy="OK" if utilisation <= 1.0 else "FAILS", reference=_REF_6_9)
+
+def compression_utilisation_batch(N_Ed: ArrayLike, N_cRd: ArrayLike) -> UtilisationCheckArray:
+    """EN 1993-1-1:2005 equation 6.9: `compression_utilisation` over arrays of design axial forces and resistances (N)."""
+    import numpy as np
+
+    utilisation = np.atleast_1d(np.divide(N_Ed, N_cRd, dtype=float))
+    return _batch_check(utilisation, _REF_6_9)
 
 # eq. 6.10, for Class 1, 2, 3 sections
 # N_cRd = A * f_y / gamma_M0; f_y = design yield strength
@@ -80,10 +114,9 @@ def design_axial_compression_resistance(A: float, fy: float, gamma_M0: float = 1
     Returns:
         Design axial compression resistance N_cRd (N)
     """
-    N_cRd = np.divide(A*fy, gamma_M0)
+    N_cRd = A*fy / gamma_M0
     # return Scalar(value=N_cRd, units="N") # TODO: will other programs/apps break when Scalar type is used?
-    return round(N_cRd, ndigits=4) # TODO: resolve in design
-    # FIXME: round everything to 4 decimal places? probably unnecessary.
+    return N_cRd # TODO: resolve in design
 
 
 # --------------------------------------------------------------------------------------
@@ -101,15 +134,30 @@ def moment_utilisation(M_Ed: float, M_cRd: float) -> UtilisationCheck | dict[str
     Returns:
         Moment utilisation (M_Ed / M_cRd)
     """
-    utilisation = np.divide(M_Ed, M_cRd) # M_Ed / M_cRd
+    utilisation = compute_utilisation(M_Ed, M_cRd) # M_Ed / M_cRd
     return {
-        "Utilisation": round(utilisation, ndigits=3),
+        "Utilisation": utilisation,
         "Metadata": {}
     }
 
+def moment_utilisation_batch(M_Ed: ArrayLike, M_cRd: ArrayLike) -> UtilisationCheckArray:
+    """EN 1993-1-1:2005 equation 6.12: Bending moment utilisation over arrays of design moments and resistances (Nm)."""
+    import numpy as np
+
+    utilisation = np.atleast_1d(np.divide(M_Ed, M_cRd, dtype=float))
+    return _batch_check(utilisation, _REF_6_12)
+
 
 # eq 6.13, for Class 1 & 2 sections
 # M_cRd = M_plRd = W_pl * f_y / gamma_M0; W_pl = plastic section modulus
+
+# Section class -> (uses plastic modulus, error if that modulus is missing); Class 4 and others are not implemented
+_MOMENT_RESISTANCE_MODULUS: dict[SectionClass, tuple[bool, str]] = {
+    SectionClass.CLASS_1: (True, "Plastic section modulus W_pl is required for Class 1 and Class 2 sections."),
+    SectionClass.CLASS_2: (True, "Plastic section modulus W_pl is required for Class 1 and Class 2 sections."),
+    SectionClass.CLASS_3: (False, "Elastic section modulus W_el is required for Class 3 sections."),
+}
+
 def design_moment_resistance(section_class: SectionClass, W_el: Optional[float], W_pl: Optional[float], fy: float, gamma_M0: float = 1.0) -> Scalar | float: # FIXME: resolve in design
     # FIXME: should take 1, class 1, class 2, CLASS 2 etc
     """EN 1993-1-1:2005 equation 6.13: Design moment resistance M_cRd for Class 1, 2 sections. Class 4 sections are not implemented in `steelsnakes`.
@@ -124,23 +172,20 @@ def design_moment_resistance(section_class: SectionClass, W_el: Optional[float],
     Returns:
         Design moment resistance M_cRd (Nmm)
     """
-    match section_class:
-        case SectionClass.CLASS_1 | SectionClass.CLASS_2:
-            if W_pl is None:
-                raise ValueError("Plastic section modulus W_pl is required for Class 1 and Class 2 sections.")
-            M_cRd = np.divide(W_pl*fy, gamma_M0) # FIXME: assuming data from tables is used directly, check units...
-        case SectionClass.CLASS_3:
-            if W_el is None:
-                raise ValueError("Elastic section modulus W_el is required for Class 3 sections.")
-            M_cRd = np.divide(W_el*fy, gamma_M0) # FIXME: assuming data from tables is used directly, check units...
-        case SectionClass.CLASS_4:
+    modulus = _MOMENT_RESISTANCE_MODULUS.get(section_class)
+    if modulus is None:
+        if section_class is SectionClass.CLASS_4:
             raise NotImplementedError("Class 4 sections are not implemented in `steelsnakes`.")
-        case _:
-            raise ValueError(f"Section class {section_class} is not implemented in `steelsnakes`.")
+        raise ValueError(f"Section class {section_class} is not implemented in `steelsnakes`.")
+    plastic, missing_message = modulus
+    W = W_pl if plastic else W_el
+    if W is None:
+        raise ValueError(missing_message)
+    M_cRd = W*fy / gamma_M0 # FIXME: assuming data from tables is used directly, check units...
     
     # TODO: steelsnakes 2.0 should ship units in code and database
     # return Scalar(value=round(M_cRd, ndigits=4), units="Nmm", metadata={"section_class": section_class}) # TODO: will other programs/apps break when Scalar type is used?
-    return round(M_cRd, ndigits=4)
+    return M_cRd
 
 
 # eq 6.14, for Class 3 sections
@@ -165,9 +210,16 @@ def shear_utilisation(V_Ed: float, V_cRd: float) -> UtilisationCheck:
     Returns:
         Shear utilisation (V_Ed / V_cRd)
     """
-    utilisation = np.divide(V_Ed, V_cRd) # V_Ed / V_cRd
+    utilisation = compute_utilisation(V_Ed, V_cRd) # V_Ed / V_cRd
     # return {"Utilisation": np.round(utilisation, ndigits=3), "Metadata": {}}
-    return UtilisationCheck(utilisation=utilisation, metadata={}, adequacy="OK" if utilisation <= 1.0 else "FAILS", reference=Reference(code="EN_1993", clause="6.2.6", equation="6.17"))
+    return UtilisationCheck(utilisation=utilisation, metadata={}, adequacy="OK" if utilisation <= 1.0 else "FAILS", reference=_REF_6_17)
+
+def shear_utilisation_batch(V_Ed: ArrayLike, V_cRd: ArrayLike) -> UtilisationCheckArray:
+    """EN 1993-1-1:2005 equation 6.17: `shear_utilisation` over arrays of design shear forces and resistances (N)."""
+    import numpy as np
+
+    utilisation = np.atleast_1d(np.divide(V_Ed, V_cRd, dtype=float))
+    return _batch_check(utilisation, _REF_6_17)
 
 
 # eq. 6.18, in absence of torsion
@@ -181,9 +233,9 @@ def design_shear_resistance(Av: float, fy: float, gamma_M0: float = 1.0) -> Scal
         fy: Design yield strength (N/mm²)
         gamma_M0: Partial safety factor for resistance of x-sections. Default is 1.0.
     """
-    V_cRd = np.divide(Av*100 * fy, gamma_M0)
+    V_cRd = Av*100 * fy / gamma_M0
     # return Scalar(value=V_cRd, units="N")
-    return round(V_cRd, ndigits=4)
+    return V_cRd
 
 # Cl 6.2.6.3 Shear Area Av
 # Cl 6.2.6.3(a) - Rolled I/H sections - Av = A - 2*b*tf + (tw + 2*r)*tf, but > eta*hw*tw # TODO: perform this check... but take eta conservatively as zero; make sure to include all conservative values in docs/specs
@@ -192,6 +244,46 @@ def design_shear_resistance(Av: float, fy: float, gamma_M0: float = 1.0) -> Scal
 # Cl 6.2.6.3(f) - Rolled RHS: load // d and load // b - 
 # Cl 6.2.6.3(g) - All CHS - Av = 2 * A / pi
 
+# Rolled I/H sections: UB, UC, UBP, HE, IPE, HE, HL, HLZ, HD, HP, 
+_I_H_TYPES: tuple[SectionType, ...] = (SectionType.IPE, SectionType.HE, SectionType.HL, SectionType.HLZ, SectionType.HD, SectionType.HP, SectionType.UB, SectionType.UC, SectionType.UBP)
+
+def _shear_area_I_H(section: Any) -> dict[str, float]:
+    Av = section.A*100 - 2*section.b*section.tf + (section.tw + 2*section.r)*section.tf # FIXME: Because in A (cm2) in EU/UK tables
+    eta = 1.00 # in Clause NA.2.4 of UK NA to EN 1993-1-1:2005
+    # if section.hw is None:
+    #     hw = section.h - 2*section.tf - 2*section.r # clear height of web
+    #     Av_min = eta*hw*section.tw # for rolled I/H sections only, loaded parallel to web
+    # else:
+    #     Av_min = eta*section.hw*section.tw # FIXME: unlikely, handle as edge case e.g user added custom section and included hw in parameters
+    hw = section.h - 2*section.tf - 2*section.r # clear height of web
+    Av_min = eta*hw*section.tw # for rolled I/H sections only, loaded parallel to web
+    return {"Av": Av, "Av_min": Av_min}
+
+# Rolled Channels: PFC, UPE, UPN; loaded parallel to web
+def _shear_area_channel(section: Any) -> float:
+    return section.A*100 - 2*section.b*section.tf + (section.tw + section.r)*section.tf
+
+# RHS and SHS of uniform thickness: // depth and // width; depth and width read from the "hxb"/"hxh" column, e.g. "200x100"
+def _shear_area_RHS(section: Any) -> dict[str, float]:
+    h, b = parse_designation(getattr(section, "hxb", None) or section.hxh)[:2] # SHS have `hxh`, RHS `hxb`
+    return {
+        "// depth": section.A*100*h / (b + h),
+        "// width": section.A*100*b / (b + h)
+    }
+
+# CHS: loaded parallel to depth
+def _shear_area_CHS(section: Any) -> float:
+    return 2*section.A*100 / math.pi
+
+# Section type -> shear area formula; one dict lookup per call instead of walking `match` alternatives
+# NO IMPLEMENTATION FOR WELDED/BUILT-UP SECTIONs, nor elliptical hollow sections (HFEHS)
+_SHEAR_AREA_HANDLERS: dict[SectionType, Callable[[Any], Any]] = {
+    **dict.fromkeys(_I_H_TYPES, _shear_area_I_H),
+    **dict.fromkeys((SectionType.PFC, SectionType.UPE, SectionType.UPN), _shear_area_channel),
+    **dict.fromkeys((SectionType.CFRHS, SectionType.CFSHS, SectionType.HFRHS, SectionType.HFSHS), _shear_area_RHS),
+    **dict.fromkeys((SectionType.CFCHS, SectionType.HFCHS), _shear_area_CHS),
+}
+
 def shear_area(section: Optional[BaseSection] = None, properties: Optional[dict[str, Any]] = None) -> Any:
     """
     EN 1993-1-1:2005 clause 6.2.6.3: Shear area Av.
@@ -213,36 +305,10 @@ def shear_area(section: Optional[BaseSection] = None, properties: Optional[dict[
         case (_, None):
             # section = BaseSection.from_section(section) #FIXME: should be a check if section is/abstracts BaseSection
             section_type: SectionType = section.get_section_type()
-            match section_type:
-                # Rolled I/H sections: UB, UC, UBP, HE, IPE, HE, HL, HLZ, HD, HP, 
-                case SectionType.IPE | SectionType.HE | SectionType.HL | SectionType.HLZ | SectionType.HD | SectionType.HP | SectionType.UB | SectionType.UC | SectionType.UBP:
-                    Av = section.A*100 - 2*section.b*section.tf + (section.tw + 2*section.r)*section.tf # FIXME: Because in A (cm2) in EU/UK tables
-                    eta = 1.00 # in Clause NA.2.4 of UK NA to EN 1993-1-1:2005
-                    # if section.hw is None:
-                    #     hw = section.h - 2*section.tf - 2*section.r # clear height of web
-                    #     Av_min = eta*hw*section.tw # for rolled I/H sections only, loaded parallel to web
-                    # else:
-                    #     Av_min = eta*section.hw*section.tw # FIXME: unlikely, handle as edge case e.g user added custom section and included hw in parameters
-                    hw = section.h - 2*section.tf - 2*section.r # clear height of web
-                    Av_min = eta*hw*section.tw # for rolled I/H sections only, loaded parallel to web
-                    return {"Av": Av, "Av_min": Av_min}
-        
-                # Rolled Channels: PFC, UPE, UPN; loaded parallel to web
-                case SectionType.PFC | SectionType.UPE | SectionType.UPN:
-                    return section.A*100 - 2*section.b*section.tf + (section.tw + section.r)*section.tf
-
-                # Rolled RHS: // depth and // width
-                case SectionType.RHS:
-                    return {
-                        "// depth": section.A*100*section.h / (section.b + section.h),
-                        "// width": section.A*100*section.b / (section.b + section.h)
-                    }
-
-                # CHS: loaded parallel to depth
-                case SectionType.CFCHS | SectionType.CFRHS | SectionType.CFSHS | SectionType.HFCHS | SectionType.HFRHS | SectionType.HFSHS | SectionType.HFEHS:
-                    return 2*section.A*100 / np.pi
-                
-                # NO IMPLEMENTATION FOR WELDED/BUILT-UP SECTIONs
+            handler = _SHEAR_AREA_HANDLERS.get(section_type)
+            if handler is None:
+                raise NotImplementedError(f"Shear area (cl. 6.2.6.3) is not implemented in `steelsnakes` for {section_type.value} sections.")
+            return handler(section)
         
         # Both section and properties provided, raise error
         case (_, _):
@@ -259,6 +325,15 @@ def shear_area(section: Optional[BaseSection] = None, properties: Optional[dict[
 # Cl. 6.2.6.5; shear stress in web for I/H sections
 # eq. 6.21
 # tau_Ed = (V_Ed * Aw) if Af >= 0.6Aw; Af is area in one flange, Aw is area in the web i.e hw*tw
+def _web_shear_stress_I_H(section: Any, V_Ed: float) -> float:
+    hw = section.h - 2*section.tf - 2*section.r # clear height of web
+    Aw = hw*section.tw
+    # Af = section.b*section.tf # TODO: check Af >= 0.6*Aw before applying eq. 6.21
+    return V_Ed * Aw
+
+# Section type -> web shear stress; eq. 6.21 is for I/H sections only
+_WEB_SHEAR_STRESS_HANDLERS: dict[SectionType, Callable[[Any, float], float]] = dict.fromkeys(_I_H_TYPES, _web_shear_stress_I_H)
+
 def web_shear_stress(
     V_Ed: float, 
     section: Optional[BaseSection] = None,
@@ -276,11 +351,11 @@ def web_shear_stress(
         case (None, None):
             raise ValueError("Either section or properties must be provided.")
         case (_, None):
-            hw = section.h - 2*section.tf - 2*section.r # clear height of web
-            Aw = hw*section.tw
-            Af = section.b*section.tf
-            tau_Ed = np.multiply(V_Ed, Aw)
-            return round(tau_Ed, ndigits=4)
+            section_type: SectionType = section.get_section_type()
+            handler = _WEB_SHEAR_STRESS_HANDLERS.get(section_type)
+            if handler is None:
+                raise ValueError(f"Web shear stress (eq. 6.21) applies to I/H sections only, not {section_type.value}.")
+            return handler(section, V_Ed)
         case (_, _):
             raise ValueError("Either section or properties must be provided, not both.")
 
@@ -305,9 +380,9 @@ def reduced_yield_strength(fy: float, V_Ed: float, V_plRd: float) -> Scalar:
         V_Ed: Design shear force (N)
         V_plRd: Design plastic shear resistance (N)
     """
-    rho = np.power(2*V_Ed / V_plRd - 1, 2)
+    rho = (2*V_Ed / V_plRd - 1) ** 2
     fy_reduced = fy * (1 - rho)
-    return round(fy_reduced, ndigits=4)
+    return fy_reduced
 
 # TODO: implement effect on torsion [not urgent]
 # eq. 6.30 - reduced design plastic resistance moment for I/H sections with equal flanges and bending about major axis
@@ -345,7 +420,15 @@ def biaxial_bending_utilisation(My_Ed: float, Mz_Ed: float, M_NyRd: float, M_NzR
     """
     # TODO: implemetation with section type not necessary; simply pass in required values
     utilisation = (My_Ed/M_NyRd)**alpha + (Mz_Ed/M_NzRd)**beta
-    return UtilisationCheck(utilisation=utilisation, metadata={}, adequacy="OK" if utilisation <= 1.0 else "FAILS", reference=Reference(code="EN_1993", clause="6.2.9.1", equation="6.41"))
+    return UtilisationCheck(utilisation=utilisation, metadata={}, adequacy="OK" if utilisation <= 1.0 else "FAILS", reference=_REF_6_41)
+
+def biaxial_bending_utilisation_batch(My_Ed: ArrayLike, Mz_Ed: ArrayLike, M_NyRd: ArrayLike, M_NzRd: ArrayLike, alpha: ArrayLike = 1.0, beta: ArrayLike = 1.0) -> UtilisationCheckArray:
+    """EN 1993-1-1:2005 equation 6.41: `biaxial_bending_utilisation` over arrays of moments and resistances (Nm).
+    `alpha` and `beta` broadcast too, e.g. beta = 5n per member for I/H sections."""
+    import numpy as np
+
+    utilisation = np.atleast_1d(np.power(np.divide(My_Ed, M_NyRd, dtype=float), alpha) + np.power(np.divide(Mz_Ed, M_NzRd, dtype=float), beta))
+    return _batch_check(utilisation, _REF_6_41)
 
 # conservatively, alpha = beta = 1.0 # TODO: implement more accurate values from code per section
 # I/H sections: alpha = 2.0, beta = 5n but >= 1.0;
@@ -366,19 +449,3 @@ def biaxial_bending_utilisation(My_Ed: float, Mz_Ed: float, M_NyRd: float, M_NzR
 # TODO: do worked example and implement
 
 # --------------------------------------------------------------------------------------
-
-
-if __name__ == "__main__":
-    # check = BaseCheck()
-    # print(check)
-    print("")
-    from steelsnakes.UK import UB
-    from steelsnakes.EU.beams import IPE
-    from steelsnakes.EU.channels import UPN, PFC
-    from steelsnakes.UK.cf_hollow import CFCHS
-    # element = IPE("IPE-500")
-    element = UB("457x191x67")
-    # element = PFC("430x100x64")
-    # element = CFCHS("300x300x10")
-    print(shear_area(element))
-    print(web_shear_stress(1000, element))
\ No newline at end of file
@@ -1,6 +1,7 @@
 """UK-specific database implementation."""
 
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any
 
@@ -9,6 +10,58 @@ from steelsnakes.base.sections import SectionType
 
 # TODO: do the uppercase renaming _uk_ to _UK_ later...
 
+# All UK-supported section types, in lookup order
+_UK_SUPPORTED_TYPES: tuple[SectionType, ...] = (
+    # Universal sections
+    SectionType.UB,
+    SectionType.UC,
+    SectionType.UBP,
+
+    # Channel sections
+    SectionType.PFC,
+
+    # Angle sections
+    SectionType.L_EQUAL,
+    SectionType.L_UNEQUAL,
+    SectionType.L_EQUAL_B2B,
+    SectionType.L_UNEQUAL_B2B,
+
+    # Hot Finished Hollow sections
+    SectionType.HFCHS,
+    SectionType.HFRHS,
+    SectionType.HFSHS,
+    SectionType.HFEHS,
+
+    # Cold Formed Hollow sections
+    SectionType.CFCHS,
+    SectionType.CFRHS,
+    SectionType.CFSHS,
+)
+
+_CURRENT_FILE: Path = Path(__file__).resolve()
+
+
+@lru_cache(maxsize=None)
+def _discover_UK_data_directory(cwd: str) -> Path:
+    """Return the first existing UK data directory, searched from `cwd` and the package location.
+    Memoized, so repeated `UKSectionDatabase()` constructions skip the `resolve()`/`is_dir()` probes."""
+    possible_paths: list[Path] = [          
+        Path(cwd) / "src/steelsnakes/UK/data/", # from project root
+        _CURRENT_FILE.parent / "data/", # from package installation
+        _CURRENT_FILE.parent.parent.parent / "data/UK/", # from development environment
+        _CURRENT_FILE.parent.parent.parent / "src/steelsnakes/UK/data/", # from source directory
+        _CURRENT_FILE.parent.parent.parent.parent / "data/UK/" # from parent directory
+    ]
+    
+    for path in possible_paths:
+        resolved_path: Path = path.resolve()
+        if resolved_path.is_dir(): # .is_dir() implies .exists()
+            return resolved_path
+            
+    # Fallback
+    return _CURRENT_FILE.parent / "data/"
+
+
 class UKSectionDatabase(SectionDatabase):
     """
     UK-specific steel section database.
@@ -19,57 +72,72 @@ class UKSectionDatabase(SectionDatabase):
     Uses JSON files by default for maximum compatibility and simplicity.
     """
 
+    # Section types are only read from disk when first looked up, e.g. `PFC(...)` parses only the PFC file
+    lazy_load = True
+
+    # Designation -> (type, data) over every type, first type wins; built on first lookup, reset on load
+    _designation_index: Optional[dict[str, tuple[SectionType, dict[str, Any]]]] = None
+
+    # Fuzzy keys -> (position, type, data), built on first fuzzy lookup, reset on load: lowercased designations,
+    # the same without spaces, and without 'x' separators. The position keeps the first match in `get_supported_types()` order.
+    _exact_lower: Optional[dict[str, tuple[int, SectionType, dict[str, Any]]]] = None
+    _normalized: dict[str, tuple[int, SectionType, dict[str, Any]]]
+    _normalized_no_x: dict[str, tuple[int, SectionType, dict[str, Any]]]
+
     def _resolve_data_directory(self, data_directory: Optional[Path]) -> Path:
         """Resolve the UK data directory path."""
         if data_directory is not None:
             return data_directory
             
-        # Auto-discovery for UK sections
-        current_file: Path = Path(__file__).resolve()
-        possible_paths: list[Path] = [          
-            Path.cwd() / "src/steelsnakes/UK/data/", # from project root
-            current_file.parent / "data/", # from package installation
-            current_file.parent.parent.parent / "data/UK/", # from development environment
-            current_file.parent.parent.parent / "src/steelsnakes/UK/data/", # from source directory
-            current_file.parent.parent.parent.parent / "data/UK/" # from parent directory
-        ]
-        
-        for path in possible_paths:
-            resolved_path = path.resolve()
-            if resolved_path.exists() and resolved_path.is_dir():
-                return resolved_path
-                
-        # Fallback
-        return current_file.parent / "data/"
-
-    def get_supported_types(self) -> list[SectionType]:
-        """Return all UK-supported section types."""
-        return [
-            # Universal sections
-            SectionType.UB,
-            SectionType.UC, 
-            SectionType.UBP,
-            
-            # Channel sections
-            SectionType.PFC,
-            
-            # Angle sections
-            SectionType.L_EQUAL,
-            SectionType.L_UNEQUAL,
-            SectionType.L_EQUAL_B2B,
-            SectionType.L_UNEQUAL_B2B,
-            
-            # Hot Finished Hollow sections
-            SectionType.HFCHS,
-            SectionType.HFRHS,
-            SectionType.HFSHS,
-            SectionType.HFEHS,
-            
-            # Cold Formed Hollow sections
-            SectionType.CFCHS,
-            SectionType.CFRHS,
-            SectionType.CFSHS,
-        ]
+        # Auto-discovery for UK sections, probed once per working directory
+        return _discover_UK_data_directory(str(Path.cwd()))
+
+    def get_supported_types(self) -> tuple[SectionType, ...]:
+        """Return all UK-supported section types (a shared constant, not a fresh list per call)."""
+        return _UK_SUPPORTED_TYPES
+
+    def _cache_section_type(self, section_type: SectionType) -> dict[str, dict[str, Any]]:
+        """Load a single section type into the cache, dropping the now stale designation and fuzzy indexes."""
+        self._designation_index = None
+        self._exact_lower = None
+        return super()._cache_section_type(section_type)
+
+    def _build_designation_index(self) -> dict[str, tuple[SectionType, dict[str, Any]]]:
+        """Index every designation across all types in `get_supported_types()` order, so the first
+        type holding a designation wins, as in a type-by-type probe."""
+        index: dict[str, tuple[SectionType, dict[str, Any]]] = {}
+        for section_type in self.get_supported_types():
+            for stored_designation, section_data in self._get_sections(section_type).items():
+                index.setdefault(stored_designation, (section_type, section_data))
+        self._designation_index = index
+        return index
+
+    # 🌟 - Find section
+    def find_section(self, designation: str) -> Optional[tuple[SectionType, dict[str, Any]]]:
+        """Find a section by designation across all types.
+        An exact hit is one lookup in a flat designation index instead of a probe of every type."""
+        index = self._designation_index if self._designation_index is not None else self._build_designation_index()
+        match = index.get(designation)
+        return match if match is not None else self._fuzzy_find_section(designation)
+
+    def _build_fuzzy_index(self) -> dict[str, tuple[int, SectionType, dict[str, Any]]]:
+        """Lowercase every stored designation once, so a fuzzy lookup is a few dict probes instead of a scan."""
+        exact_lower: dict[str, tuple[int, SectionType, dict[str, Any]]] = {}
+        normalized: dict[str, tuple[int, SectionType, dict[str, Any]]] = {}
+        normalized_no_x: dict[str, tuple[int, SectionType, dict[str, Any]]] = {}
+        position = 0
+        for section_type in self.get_supported_types():
+            for stored_designation, section_data in self._get_sections(section_type).items():
+                entry = (position, section_type, section_data)
+                stored_lower = stored_designation.lower()
+                exact_lower.setdefault(stored_lower, entry)
+                normalized.setdefault(stored_lower.replace(" ", ""), entry)
+                if "x" in stored_lower:
+                    normalized_no_x.setdefault(stored_lower.replace("x", ""), entry)
+                position += 1
+        self._normalized, self._normalized_no_x = normalized, normalized_no_x
+        self._exact_lower = exact_lower
+        return exact_lower
 
     def _fuzzy_find_section(self, designation: str) -> Optional[tuple[SectionType, dict[str, Any]]]:
         """
@@ -77,45 +145,48 @@ class UKSectionDatabase(SectionDatabase):
         
         Handles common UK designation variations and formats.
         """
+        exact_lower = self._exact_lower if self._exact_lower is not None else self._build_fuzzy_index()
         designation_lower = designation.lower().strip()
-        
-        # Try case-insensitive search across all types
-        for section_type in self.get_supported_types():
-            sections = self._cache.get(section_type, {})
-            
-            for stored_designation, section_data in sections.items():
-                if stored_designation.lower() == designation_lower:
-                    return section_type, section_data
-                    
-        # Try partial matches for common patterns
-        for section_type in self.get_supported_types():
-            sections = self._cache.get(section_type, {})
-            
-            for stored_designation, section_data in sections.items():
-                # Remove spaces and try again
-                if stored_designation.lower().replace(" ", "") == designation_lower.replace(" ", ""):
-                    return section_type, section_data
-                    
-                # Try without 'x' separators (e.g., "457191x67" vs "457x191x67")
-                if "x" in designation_lower and "x" in stored_designation.lower():
-                    clean_input = designation_lower.replace("x", "")
-                    clean_stored = stored_designation.lower().replace("x", "")
-                    if clean_input == clean_stored:
-                        return section_type, section_data
-        
-        return None
+
+        # Case-insensitive match across all types
+        entry = exact_lower.get(designation_lower)
+        if entry is None:
+            # Partial matches for common patterns: spaces removed, or without 'x' separators (e.g., "457191x67" vs "457x191x67")
+            entry = self._normalized.get(designation_lower.replace(" ", ""))
+            if "x" in designation_lower:
+                no_x = self._normalized_no_x.get(designation_lower.replace("x", ""))
+                if no_x is not None and (entry is None or no_x[0] < entry[0]):
+                    entry = no_x
+        return None if entry is None else (entry[1], entry[2])
 
 
 # Global instance for convenience
 _global_uk_database: Optional[UKSectionDatabase] = None
+# Databases for an explicit data directory or backend, built once per `(data_directory, use_sqlite)`
+_uk_databases: dict[tuple[Optional[Path], bool], UKSectionDatabase] = {}
 
 
 def get_uk_database(data_directory: Optional[Path] = None, use_sqlite: bool = False) -> UKSectionDatabase:
-    """Get or create global UK database instance. Uses JSON by default."""
+    """Get or create global UK database instance. Uses JSON by default.
+
+    Databases for an explicit `data_directory` (or SQLite backend) are memoized, so asking
+    again for the same directory returns the loaded instance instead of re-reading its data.
+    """
     global _global_uk_database
-    if _global_uk_database is None or data_directory is not None:
-        _global_uk_database = UKSectionDatabase(data_directory, use_sqlite=use_sqlite)
-    return _global_uk_database
+    if data_directory is None and not use_sqlite:
+        if _global_uk_database is None:
+            _global_uk_database = UKSectionDatabase()
+        return _global_uk_database
+
+    key = (Path(data_directory) if data_directory is not None else None, use_sqlite)
+    database: Optional[UKSectionDatabase] = _uk_databases.get(key)
+    if database is None:
+        database = _uk_databases[key] = UKSectionDatabase(key[0], use_sqlite=use_sqlite)
+    return database
+
+
+# Region-cased alias matching `get_UK_factory()` and the other regions' `get_<REGION>_database()`
+get_UK_database = get_uk_database
 
 if __name__ == "__main__":
     db = get_uk_database()
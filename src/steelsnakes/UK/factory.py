@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Literal, Optional, overload
 import logging
 
 from steelsnakes.base.factory import SectionFactory
-from steelsnakes.base.sections import SectionType
+from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.UK.database import UKSectionDatabase, get_uk_database
 
+if TYPE_CHECKING: # for the `create_section()` overloads only; the factory imports these when it registers them
+    from steelsnakes.UK.universal import UniversalBeam, UniversalColumn, UniversalBearingPile
+    from steelsnakes.UK.channels import ParallelFlangeChannel
+    from steelsnakes.UK.angles import EqualAngle, UnequalAngle, EqualAngleBackToBack, UnequalAngleBackToBack
+    from steelsnakes.UK.hf_hollow import HotFinishedCircularHollowSection, HotFinishedSquareHollowSection, HotFinishedRectangularHollowSection, HotFinishedEllipticalHollowSection
+    from steelsnakes.UK.cf_hollow import ColdFormedCircularHollowSection, ColdFormedSquareHollowSection, ColdFormedRectangularHollowSection
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 class UKSectionFactory(SectionFactory):
@@ -23,6 +30,46 @@ class UKSectionFactory(SectionFactory):
             database = get_uk_database()
         super().__init__(database)
 
+    # 🌟 - Create section
+    # Overloads give the convenience functions (`UB`, `PFC`, ...) their concrete return types without a `cast()` call;
+    # typing only: at runtime `SectionFactory.create_section()` (with its instance cache) is used as is
+    if TYPE_CHECKING:
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.UB]) -> UniversalBeam: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.UC]) -> UniversalColumn: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.UBP]) -> UniversalBearingPile: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.PFC]) -> ParallelFlangeChannel: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.L_EQUAL]) -> EqualAngle: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.L_UNEQUAL]) -> UnequalAngle: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.L_EQUAL_B2B]) -> EqualAngleBackToBack: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.L_UNEQUAL_B2B]) -> UnequalAngleBackToBack: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.HFCHS]) -> HotFinishedCircularHollowSection: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.HFSHS]) -> HotFinishedSquareHollowSection: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.HFRHS]) -> HotFinishedRectangularHollowSection: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.HFEHS]) -> HotFinishedEllipticalHollowSection: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.CFCHS]) -> ColdFormedCircularHollowSection: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.CFSHS]) -> ColdFormedSquareHollowSection: ...
+        @overload
+        def create_section(self, designation: str, section_type: Literal[SectionType.CFRHS]) -> ColdFormedRectangularHollowSection: ...
+        @overload
+        def create_section(self, designation: str, section_type: Optional[SectionType] = None) -> BaseSection: ...
+
+        def create_section(self, designation: str, section_type: Optional[SectionType] = None) -> BaseSection:
+            return super().create_section(designation, section_type)
+
     def _register_default_classes(self) -> None:
         """Register all UK section classes automatically."""
         # Import and register all UK section classes
@@ -77,15 +124,28 @@ class UKSectionFactory(SectionFactory):
 
 # Global instance for convenience
 _global_uk_factory: Optional[UKSectionFactory] = None
+# Factories for explicit data directories, built once per directory
+_uk_factories: dict[Path, UKSectionFactory] = {}
 
 
 def get_UK_factory(data_directory: Optional[Path] = None) -> UKSectionFactory:
-    """Get or create global UK factory instance."""
+    """Get or create global UK factory instance.
+
+    Factories for an explicit `data_directory` are memoized per directory, so the
+    convenience functions (`UB`, `PFC`, `L_EQUAL`, ...) don't rebuild the factory
+    and reload its database on every call.
+    """
     global _global_uk_factory
-    if _global_uk_factory is None or data_directory is not None:
-        database = get_uk_database(data_directory) if data_directory else None
-        _global_uk_factory = UKSectionFactory(database)
-    return _global_uk_factory
+    if data_directory is None:
+        if _global_uk_factory is None:
+            _global_uk_factory = UKSectionFactory()
+        return _global_uk_factory
+
+    key = Path(data_directory)
+    factory: Optional[UKSectionFactory] = _uk_factories.get(key)
+    if factory is None:
+        factory = _uk_factories[key] = UKSectionFactory(get_uk_database(key))
+    return factory
 
 if __name__ == "__main__":
     from steelsnakes.base.exceptions import SectionNotFoundError
@@ -7,13 +7,13 @@ and Elliptical Hollow Sections.
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Any, cast
+from typing import Optional, Any
 
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.UK.factory import UKSectionFactory, get_UK_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class HotFinishedCircularHollowSection(BaseSection):
     """Hot Finished Circular Hollow Section (HFCHS)."""
     
@@ -39,13 +39,9 @@ class HotFinishedCircularHollowSection(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.HFCHS
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class HotFinishedSquareHollowSection(BaseSection):
     """Hot Finished Square Hollow Section (HFSHS)."""
     
@@ -69,13 +65,9 @@ class HotFinishedSquareHollowSection(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.HFSHS
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class HotFinishedRectangularHollowSection(BaseSection):
     """Hot Finished Rectangular Hollow Section (HFRHS)."""
     
@@ -104,13 +96,9 @@ class HotFinishedRectangularHollowSection(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.HFRHS
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class HotFinishedEllipticalHollowSection(BaseSection):
     """Hot Finished Elliptical Hollow Section (HFEHS)."""
     
@@ -137,39 +125,31 @@ class HotFinishedEllipticalHollowSection(BaseSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.HFEHS
     
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self)
 
 
 # Convenience functions
 def HFCHS(designation: str, data_directory: Optional[Path] = None) -> HotFinishedCircularHollowSection:
     """Create a Hot Finished Circular Hollow Section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.HFCHS) # Older implementation; raised Pylance[reportReturnType]
-    return cast(HotFinishedCircularHollowSection, factory.create_section(designation, SectionType.HFCHS))
+    return factory.create_section(designation, SectionType.HFCHS) # typed by the `UKSectionFactory.create_section()` overloads
 
 
 def HFSHS(designation: str, data_directory: Optional[Path] = None) -> HotFinishedSquareHollowSection:
     """Create a Hot Finished Square Hollow Section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.HFSHS)
-    return cast(HotFinishedSquareHollowSection, factory.create_section(designation, SectionType.HFSHS))
+    return factory.create_section(designation, SectionType.HFSHS)
 
 
 def HFRHS(designation: str, data_directory: Optional[Path] = None) -> HotFinishedRectangularHollowSection:
     """Create a Hot Finished Rectangular Hollow Section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.HFRHS)
-    return cast(HotFinishedRectangularHollowSection, factory.create_section(designation, SectionType.HFRHS))
+    return factory.create_section(designation, SectionType.HFRHS)
 
 
 def HFEHS(designation: str, data_directory: Optional[Path] = None) -> HotFinishedEllipticalHollowSection:
     """Create a Hot Finished Elliptical Hollow Section by designation."""
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.HFEHS)
-    return cast(HotFinishedEllipticalHollowSection, factory.create_section(designation, SectionType.HFEHS))
+    return factory.create_section(designation, SectionType.HFEHS)
 
 if __name__ == "__main__":
     print(HFCHS("48.3x3.6").get_properties())
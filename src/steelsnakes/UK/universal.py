@@ -8,12 +8,12 @@ using the new base system architecture.
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Any, cast
+from typing import Optional, Any
 
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.UK.factory import UKSectionFactory, get_UK_factory
 
-@dataclass
+@dataclass(slots=True)
 class UniversalSection(BaseSection):
     """Base class for all universal steel sections (UB, UC, UBP)."""
     
@@ -63,18 +63,10 @@ class UniversalSection(BaseSection):
     I_w: float = 0.0  # Warping constant (cm⁶)
     I_t: float = 0.0  # Torsional constant (cm⁴)
     A: float = 0.0  # Cross-sectional area (cm²)
-    
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-
-        # return self.__dict__ # DANGEROUS: live reference; caller can modify internal state
-        # return vars(self).copy() # SAFE: returns a shallow copy, doesn't expose live references to the instance
-        from dataclasses import asdict
-        return asdict(self) # SAFE: applies recursively to field values that are dataclass instances.
+    # get_properties(): BaseSection's cached, read-only mapping; no live reference to internal state
 
-        
 
-@dataclass
+@dataclass(slots=True)
 class UniversalBeam(UniversalSection):
     """Universal Beam (UB) section."""
     
@@ -83,7 +75,7 @@ class UniversalBeam(UniversalSection):
         return SectionType.UB
 
 
-@dataclass  
+@dataclass(slots=True)
 class UniversalColumn(UniversalSection):
     """Universal Column (UC) section."""
     
@@ -92,7 +84,7 @@ class UniversalColumn(UniversalSection):
         return SectionType.UC
 
 
-@dataclass
+@dataclass(slots=True)
 class UniversalBearingPile(UniversalSection):
     """Universal Bearing Pile (UBP) section."""
     
@@ -113,8 +105,7 @@ def UB(designation: str, data_directory: Optional[Path] = None) -> UniversalBeam
         UniversalBeam instance with actual values from database
     """
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.UB)
-    return cast(UniversalBeam, factory.create_section(designation, SectionType.UB))
+    return factory.create_section(designation, SectionType.UB)
 
 
 def UC(designation: str, data_directory: Optional[Path] = None) -> UniversalColumn:
@@ -128,8 +119,7 @@ def UC(designation: str, data_directory: Optional[Path] = None) -> UniversalColu
         UniversalColumn instance with actual values from database
     """
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.UC)
-    return cast(UniversalColumn, factory.create_section(designation, SectionType.UC))
+    return factory.create_section(designation, SectionType.UC)
 
 
 def UBP(designation: str, data_directory: Optional[Path] = None) -> UniversalBearingPile:
@@ -143,8 +133,7 @@ def UBP(designation: str, data_directory: Optional[Path] = None) -> UniversalBea
         UniversalBearingPile instance with actual values from database
     """
     factory: UKSectionFactory = get_UK_factory(data_directory)
-    # return factory.create_section(designation, SectionType.UBP)
-    return cast(UniversalBearingPile, factory.create_section(designation, SectionType.UBP))
+    return factory.create_section(designation, SectionType.UBP)
 
 if __name__ == "__main__":
     # print(UB("457x191x67"))
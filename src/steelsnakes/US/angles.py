@@ -1,9 +1,9 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from steelsnakes.base import BaseSection, SectionType
 from typing import Any, Optional, cast
 from steelsnakes.US.factory import get_US_factory, USSectionFactory
 
-@dataclass
+@dataclass(slots=True)
 class Angle(BaseSection):
     section_type: float = 0.0
     EDI_Std_Nomenclature: float = 0.0
@@ -52,11 +52,8 @@ class Angle(BaseSection):
     PA2: float = 0.0
     PB: float = 0.0
 
-    def get_properties(self) -> dict[str, float]:
-        """Return all section properties as a dictionary."""
-        return asdict(self)
 
-@dataclass
+@dataclass(slots=True)
 class DoubleAngle(BaseSection):
     section_type: str = ""
     EDI_Std_Nomenclature: str = ""
@@ -79,12 +76,9 @@ class DoubleAngle(BaseSection):
     ro: float = 0.0
     H: float = 0.0
 
-    def get_properties(self) -> dict[str, float]:
-        """Return all section properties as a dictionary."""
-        return asdict(self)
     
 
-@dataclass
+@dataclass(slots=True)
 class EqualAngle(Angle):
     H: float = 0.0
    
@@ -92,7 +86,7 @@ class EqualAngle(Angle):
     def get_section_type(cls) -> SectionType:
         return SectionType.L_EQUAL
 
-@dataclass
+@dataclass(slots=True)
 class UnequalAngle(Angle):
     SwB: float = 0.0
 
@@ -101,19 +95,19 @@ class UnequalAngle(Angle):
         return SectionType.L_UNEQUAL
 
 
-@dataclass
+@dataclass(slots=True)
 class BackToBackEqualAngle(DoubleAngle):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L2L_EQUAL
     
-@dataclass
+@dataclass(slots=True)
 class LongLegBackToBackUnequalAngle(DoubleAngle):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.L2L_LLBB
     
-@dataclass
+@dataclass(slots=True)
 class ShortLegBackToBackUnequalAngle(DoubleAngle):
     @classmethod
     def get_section_type(cls) -> SectionType:
@@ -3,7 +3,7 @@ from typing import Any, Optional, cast
 from steelsnakes.base import BaseSection, SectionType
 from steelsnakes.US.factory import USSectionFactory, get_US_factory
 
-@dataclass
+@dataclass(slots=True)
 class Beam(BaseSection):
     # Identification
     section_type: str # implement section type in all json
@@ -56,26 +56,22 @@ class Beam(BaseSection):
     WGi: float = 0.0
     WGo: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self) # SAFE: applies recursively to field values that are dataclass instances.
 
 
-@dataclass
+@dataclass(slots=True)
 class WideFlangeBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.W
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.S
 
-@dataclass
+@dataclass(slots=True)
 class MiscellaneousBeam(Beam):
     @classmethod
     def get_section_type(cls) -> SectionType:
@@ -1,9 +1,9 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from steelsnakes.base import BaseSection, SectionType
 from typing import Any, cast, Optional
 from steelsnakes.US.factory import USSectionFactory, get_US_factory
 
-@dataclass
+@dataclass(slots=True)
 class Channel(BaseSection):
     # Identification
     designation: str
@@ -57,30 +57,27 @@ class Channel(BaseSection):
     T: float = 0.0 #
     WGi: float = 0.0 #
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return asdict(self)
 
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardChannel(Channel):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.C
 
-@dataclass
+@dataclass(slots=True)
 class MiscellaneousChannel(Channel):
     @classmethod
     def get_section_type(cls) -> SectionType:
         return SectionType.MC
 
-@dataclass
+@dataclass(slots=True)
 class DoubleStandardChannel(Channel):
     # TODO: Find way to implement Double Channel properties
     pass
 
-@dataclass
+@dataclass(slots=True)
 class DoubleMiscellaneousChannel(Channel):
     pass
 
@@ -7,10 +7,66 @@ from typing import Optional, Any
 from steelsnakes.base.database import SectionDatabase
 from steelsnakes.base.sections import SectionType
 
+# Separators tried one at a time by the fuzzy matcher, with the bit recording each in a designation
+_SEPARATOR_BITS: tuple[tuple[str, int], ...] = (("x", 1), (".", 2), ("-", 4))
+
+
+def _separator_mask(designation: str) -> int:
+    """Return a bitmask of the `_SEPARATOR_BITS` separators present in `designation`."""
+    mask = 0
+    for separator, bit in _SEPARATOR_BITS:
+        if separator in designation:
+            mask |= bit
+    return mask
+
+
+# All US-supported section types, in lookup order
+_US_SUPPORTED_TYPES: tuple[SectionType, ...] = (
+    # Beams
+    SectionType.W,  # Wide Flange Beas
+    SectionType.S,  # Standard Beams
+    SectionType.M,  # Miscellaneous Beams #
+    # SectionType.HP, # Bearing Piles # TODO: decide whether in Beams or Bearing Piles
+
+    # Channels
+    SectionType.C,  # Standard Channels
+    SectionType.MC, # Miscellaneous Channels
+    SectionType.C2C, # Back-to-Back Channels # TODO: propagate C2C throughout the codebase
+    SectionType.MC2C, # Back-to-back Channels # TODO: propagate MC2C throughout the codebase
+
+    # Angles
+    SectionType.L_EQUAL, # Standard Angles, Equal legs
+    SectionType.L_UNEQUAL, # Standard Angles, Unequal legs
+    SectionType.L2L_EQUAL, # Back-to-back Standard Angles, Equal legs
+    SectionType.L2L_LLBB, # Back-to-back Standard Angles, Unequal legs, Long Leg Back-to-Back
+    SectionType.L2L_SLBB, # Back-to-back Standard Angles, Unequal legs, Short Leg Back-to-Back
+
+    # Tees
+    SectionType.WT, # cut from W shapes
+    SectionType.ST, # cut from S shapes
+    SectionType.MT, # cut from M shapes
+
+    # Bearing Piles
+    SectionType.HP, # Bearing Piles # also in Beams # TODO: resolve this with EU vs US
+
+    # Hollow sections
+    # SectionType.HSS, # Hollow Structural Sections --- IGNORE ---
+    SectionType.HSS_RCT, # Rectangular Hollow Structural Sections
+    SectionType.HSS_SQR, # Square Hollow Structural Sections
+    SectionType.HSS_RND, # Round Hollow Structural Sections
+
+    # Pipes
+    SectionType.PIPE, # Pipes
+)
+
 
 class USSectionDatabase(SectionDatabase):
     """US-specific steel section database. EN 10365:2017"""
 
+    def __init__(self, data_directory: Optional[Path] = None, use_sqlite: bool = False) -> None:
+        self._fuzzy_rows: Optional[list[tuple[SectionType, str, str, int, dict[str, Any]]]] = None # see `_get_fuzzy_rows()`
+        super().__init__(data_directory, use_sqlite=use_sqlite)
+
     def _resolve_data_directory(self, data_directory: Optional[Path]) -> Path:
         """Resolve the US data directory path."""
         if data_directory is not None:
@@ -34,90 +90,64 @@ class USSectionDatabase(SectionDatabase):
         # Fallback
         return current_file.parent / "data/"
 
-    def get_supported_types(self) -> list[SectionType]:
-        """Return all US-supported section types."""
-        return [
-            # Beams
-            SectionType.W,  # Wide Flange Beas
-            SectionType.S,  # Standard Beams
-            SectionType.M,  # Miscellaneous Beams #
-            # SectionType.HP, # Bearing Piles # TODO: decide whether in Beams or Bearing Piles
-           
-            # Channels
-            SectionType.C,  # Standard Channels
-            SectionType.MC, # Miscellaneous Channels
-            SectionType.C2C, # Back-to-Back Channels # TODO: propagate C2C throughout the codebase
-            SectionType.MC2C, # Back-to-back Channels # TODO: propagate MC2C throughout the codebase
-
-            # Angles
-            SectionType.L_EQUAL, # Standard Angles, Equal legs
-            SectionType.L_UNEQUAL, # Standard Angles, Unequal legs
-            SectionType.L2L_EQUAL, # Back-to-back Standard Angles, Equal legs
-            SectionType.L2L_LLBB, # Back-to-back Standard Angles, Unequal legs, Long Leg Back-to-Back
-            SectionType.L2L_SLBB, # Back-to-back Standard Angles, Unequal legs, Short Leg Back-to-Back
-            
-            # Tees
-            SectionType.WT, # cut from W shapes
-            SectionType.ST, # cut from S shapes
-            SectionType.MT, # cut from M shapes
-            
-            # Bearing Piles
-            SectionType.HP, # Bearing Piles # also in Beams # TODO: resolve this with EU vs US
-            
-            # Hollow sections
-            # SectionType.HSS, # Hollow Structural Sections --- IGNORE ---
-            SectionType.HSS_RCT, # Rectangular Hollow Structural Sections
-            SectionType.HSS_SQR, # Square Hollow Structural Sections
-            SectionType.HSS_RND, # Round Hollow Structural Sections
-
-            # Pipes
-            SectionType.PIPE, # Pipes
-
-            ]
+    def get_supported_types(self) -> tuple[SectionType, ...]:
+        """Return all US-supported section types (a shared constant, not a fresh list per call)."""
+        return _US_SUPPORTED_TYPES
+
+    def _cache_section_type(self, section_type: SectionType) -> dict[str, dict[str, Any]]:
+        """Load a single section type into the cache, dropping the now stale fuzzy rows."""
+        self._fuzzy_rows = None
+        return super()._cache_section_type(section_type)
+
+    def _get_fuzzy_rows(self) -> list[tuple[SectionType, str, str, int, dict[str, Any]]]:
+        """Return `(type, upper-cased, without spaces, separator mask, data)` for every section, flattened
+        in `get_supported_types()` order and computed once, so fuzzy queries make a single pass with no
+        per-type cache lookups or repeated string work."""
+        rows = self._fuzzy_rows
+        if rows is None:
+            rows = []
+            for section_type in self.get_supported_types():
+                for stored_designation, section_data in self._cache.get(section_type, {}).items():
+                    stored_upper: str = stored_designation.upper()
+                    rows.append((section_type, stored_upper, stored_upper.replace(" ", ""), _separator_mask(stored_upper), section_data))
+            self._fuzzy_rows = rows
+        return rows
 
     def _fuzzy_find_section(self, designation: str) -> Optional[tuple[SectionType, dict[str, Any]]]:
         """
         US-specific fuzzy section finding with case-insensitive matching.
         
-        Handles common US designation variations and formats.
+        Handles common US designation variations and formats. Stored designations are compared through
+        precomputed rows, and a separator is only stripped when both sides contain it (per the masks).
         """
         designation_upper: str = designation.upper().strip()
         
+        rows = self._get_fuzzy_rows()
+
         # Try case-insensitive search across all types
-        for section_type in self.get_supported_types():
-            sections = self._cache.get(section_type, {})
-            
-            for stored_designation, section_data in sections.items():
-                if stored_designation.upper() == designation_upper:
-                    return section_type, section_data
+        for section_type, stored_upper, _, _, section_data in rows:
+            if stored_upper == designation_upper:
+                return section_type, section_data
                     
         # Try partial matches for common patterns
-        for section_type in self.get_supported_types():
-            sections: dict[str, dict[str, Any]] = self._cache.get(section_type, {})
-            
-            for stored_designation, section_data in sections.items():
-                # Remove spaces and try again
-                if stored_designation.upper().replace(" ", "") == designation_upper.replace(" ", ""):
+        input_without_spaces: str = designation_upper.replace(" ", "")
+        input_mask: int = _separator_mask(designation_upper)
+        input_without: dict[int, str] = {
+            bit: designation_upper.replace(separator, "")
+            for separator, bit in _SEPARATOR_BITS if input_mask & bit
+        }
+        for section_type, stored_upper, stored_without_spaces, stored_mask, section_data in rows:
+            # Remove spaces and try again
+            if stored_without_spaces == input_without_spaces:
+                return section_type, section_data
+
+            # Try without each separator both designations contain
+            shared_mask: int = stored_mask & input_mask
+            if not shared_mask:
+                continue
+            for separator, bit in _SEPARATOR_BITS:
+                if shared_mask & bit and stored_upper.replace(separator, "") == input_without[bit]:
                     return section_type, section_data
-                    
-                # Try without 'x' separators (e.g., "457191x67" vs "457x191x67")
-                if "x" in designation_upper and "x" in stored_designation.upper():
-                    clean_input: str = designation_upper.replace("x", "")
-                    clean_stored: str = stored_designation.upper().replace("x", "")
-                    if clean_input == clean_stored:
-                        return section_type, section_data
-
-                if "." in designation_upper and "." in stored_designation.upper():
-                    clean_input = designation_upper.replace(".", "")
-                    clean_stored = stored_designation.upper().replace(".", "")
-                    if clean_input == clean_stored:
-                        return section_type, section_data
-
-                if "-" in designation_upper and "-" in stored_designation.upper():
-                    clean_input = designation_upper.replace("-", "")
-                    clean_stored = stored_designation.upper().replace("-", "")
-                    if clean_input == clean_stored:
-                        return section_type, section_data
 
         return None
 
@@ -1,9 +1,9 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, cast, Optional
 from steelsnakes.base import BaseSection, SectionType
 from steelsnakes.US.factory import get_US_factory, USSectionFactory
 
-@dataclass
+@dataclass(slots=True)
 class HollowStructuralSection(BaseSection):
     designation: str
     section_type: str # read as 'type' in database # TODO: change to section_type in database
@@ -25,11 +25,8 @@ class HollowStructuralSection(BaseSection):
     J: float = 0.0
     C: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return a dictionary of all section properties."""
-        return asdict(self)
     
-@dataclass
+@dataclass(slots=True)
 class RectangularHSS(HollowStructuralSection):
     Ht: float = 0.0
     h: float = 0.0
@@ -43,7 +40,7 @@ class RectangularHSS(HollowStructuralSection):
         return SectionType.HSS_RCT
 
 
-@dataclass
+@dataclass(slots=True)
 class SquareHSS(HollowStructuralSection):
     Ht: float = 0.0
     h: float = 0.0
@@ -56,7 +53,7 @@ class SquareHSS(HollowStructuralSection):
     def get_section_type(cls) -> SectionType:
         return SectionType.HSS_SQR
 
-@dataclass
+@dataclass(slots=True)
 class RoundHSS(HollowStructuralSection):
     OD: float = 0.0
     D_t: float = 0.0
@@ -1,10 +1,10 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Optional, cast
 from steelsnakes.base import BaseSection, SectionType
 from steelsnakes.US.factory import USSectionFactory, get_US_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class Pile(BaseSection):
     # Identification
     section_type: str #
@@ -57,11 +57,8 @@ class Pile(BaseSection):
     WGi: float = 0.0
     WGo: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return asdict(self) # SAFE: applies recursively to field values that are dataclass instances.
 
-@dataclass
+@dataclass(slots=True)
 class BearingPile(Pile):
     @classmethod
     def get_section_type(cls) -> SectionType:
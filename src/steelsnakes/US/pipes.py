@@ -1,10 +1,10 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Optional, cast
 from steelsnakes.base import BaseSection, SectionType
 from steelsnakes.US.factory import USSectionFactory, get_US_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class SteelPipe(BaseSection):
     section_type: str = ""
     EDI_Std_Nomenclature: str = ""
@@ -25,11 +25,8 @@ class SteelPipe(BaseSection):
     ry: float = 0.0
     J: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return asdict(self) # SAFE: applies recursively to field values that are dataclass instances.
 
-@dataclass
+@dataclass(slots=True)
 class Pipe(SteelPipe):
     @classmethod
     def get_section_type(cls) -> SectionType:
@@ -1,9 +1,9 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Optional, cast
 from steelsnakes.base import BaseSection, SectionType
 from steelsnakes.US.factory import SectionFactory, get_US_factory
 
-@dataclass
+@dataclass(slots=True)
 class Tee(BaseSection):
     section_type: str = ""
     EDI_Std_Nomenclature: str = ""
@@ -37,11 +37,9 @@ class Tee(BaseSection):
     ro: float = 0.0
     H: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        return asdict(self)
     
 
-@dataclass
+@dataclass(slots=True)
 class StandardTee(Tee):
     WGi: float = 0.0
 
@@ -49,7 +47,7 @@ class StandardTee(Tee):
     def get_section_type(cls) -> SectionType:
         return SectionType.ST
 
-@dataclass
+@dataclass(slots=True)
 class MiscellaneousTee(Tee):
     T_F: str = ""
     
@@ -57,7 +55,7 @@ class MiscellaneousTee(Tee):
     def get_section_type(cls) -> SectionType:
         return SectionType.MT
 
-@dataclass
+@dataclass(slots=True)
 class WideFlangeTee(Tee):
     T_F: str = ""
     H: float =  0.0
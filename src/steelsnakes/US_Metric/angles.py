@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from steelsnakes.base import BaseSection, SectionType
 from typing import Any, Optional, cast
 from steelsnakes.US_Metric.factory import get_US_Metric_factory, USMetricSectionFactory
@@ -52,9 +52,6 @@ class Angle(BaseSection):
     PA2: float = 0.0
     PB: float = 0.0
 
-    def get_properties(self) -> dict[str, float]:
-        """Return all section properties as a dictionary."""
-        return asdict(self)
 
 @dataclass
 class DoubleAngle(BaseSection):
@@ -79,9 +76,6 @@ class DoubleAngle(BaseSection):
     ro: float = 0.0
     H: float = 0.0
 
-    def get_properties(self) -> dict[str, float]:
-        """Return all section properties as a dictionary."""
-        return asdict(self)
     
 
 @dataclass
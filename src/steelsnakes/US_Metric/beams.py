@@ -56,10 +56,6 @@ class Beam(BaseSection):
     WGi: float = 0.0
     WGo: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        from dataclasses import asdict
-        return asdict(self) # SAFE: applies recursively to field values that are dataclass instances.
 
 
 @dataclass
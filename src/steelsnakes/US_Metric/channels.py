@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from steelsnakes.base import BaseSection, SectionType
 from typing import Any, cast, Optional
 from steelsnakes.US_Metric.factory import USMetricSectionFactory, get_US_Metric_factory
@@ -57,9 +57,6 @@ class Channel(BaseSection):
     T: float = 0.0 #
     WGi: float = 0.0 #
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return asdict(self)
 
 
 
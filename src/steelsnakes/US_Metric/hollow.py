@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, cast, Optional
 from steelsnakes.base import BaseSection, SectionType
 from steelsnakes.US_Metric.factory import get_US_Metric_factory, USMetricSectionFactory
@@ -25,9 +25,6 @@ class HollowStructuralSection(BaseSection):
     J: float = 0.0
     C: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return a dictionary of all section properties."""
-        return asdict(self)
     
 @dataclass
 class RectangularHSS(HollowStructuralSection):
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Optional, cast
 from steelsnakes.base import BaseSection, SectionType
 from steelsnakes.US_Metric.factory import USMetricSectionFactory, get_US_Metric_factory
@@ -57,9 +57,6 @@ class Pile(BaseSection):
     WGi: float = 0.0
     WGo: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        """Return all section properties as a dictionary."""
-        return asdict(self) # SAFE: applies recursively to field values that are dataclass instances.
 
 @dataclass
 class BearingPile(Pile):
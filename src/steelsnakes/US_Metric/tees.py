@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Optional, cast
 from steelsnakes.base import BaseSection, SectionType
 from steelsnakes.US_Metric.factory import SectionFactory, get_US_Metric_factory
@@ -37,8 +37,6 @@ class Tee(BaseSection):
     ro: float = 0.0
     H: float = 0.0
 
-    def get_properties(self) -> dict[str, Any]:
-        return asdict(self)
     
 
 @dataclass
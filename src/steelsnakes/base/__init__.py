@@ -1,20 +1,24 @@
 """Base classes and utilities for `steelsnakes`"""
 
-from steelsnakes.base.sections import BaseSection, SectionType
+from steelsnakes.base.sections import BaseSection, SectionType, parse_designation, section_arrays
 from steelsnakes.base.connectors import BaseConnector, ConnectorType
 from steelsnakes.base.database import SectionDatabase, SQLiteJSONInterface, build_regional_sqlite_db
 from steelsnakes.base.factory import SectionFactory
+from steelsnakes.base.table import SectionTable
 from steelsnakes.base.exceptions import SectionFactoryError, SectionNotFoundError, SectionTypeNotRegisteredError
 
 __all__: list[str] = [
     "BaseSection",
     "SectionType",
+    "parse_designation",
+    "section_arrays",
     "BaseConnector",
     "ConnectorType",
     "SectionDatabase",
     "SQLiteJSONInterface",
     "build_regional_sqlite_db",
     "SectionFactory",
+    "SectionTable",
     "SectionFactoryError",
     "SectionNotFoundError",
     "SectionTypeNotRegisteredError",
@@ -0,0 +1,32 @@
+"""Lazy (PEP 562) module attributes for the region packages in `steelsnakes`."""
+
+from __future__ import annotations
+from importlib import import_module
+from typing import Any
+
+
+def install(namespace: dict[str, Any], lazy: dict[str, str]) -> None:
+    """Give a module lazy exports: `install(globals(), _LAZY)` at the end of its `__init__.py`.
+
+    Adds a module `__getattr__` that imports each name in `lazy` from its module on first access and caches it
+    in the module's globals, and a `__dir__` that lists the lazy names alongside the already imported ones.
+
+    Args:
+        namespace: The module's `globals()`
+        lazy: Exported name -> dotted name of the module that defines it
+    """
+    module_name: str = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        source: str | None = lazy.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(source), name)
+        namespace[name] = value # cache so later lookups skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(lazy))
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
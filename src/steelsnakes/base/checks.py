@@ -1,10 +1,15 @@
 from __future__ import annotations
-from typing import Optional, Union, Any, Literal, Callable
+from typing import TYPE_CHECKING, Optional, Union, Any, Literal, Callable
 from enum import Enum
 import logging
 from abc import ABC, abstractmethod
 import math
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass as validated_dataclass
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -91,15 +96,42 @@ class BaseCheck(ABC):
 
 
 
-class UtilisationCheck(BaseModel):
-    """Simple utilisation check result."""
+# Pydantic dataclasses rather than models: fields are still validated (e.g. `code="EN_1993"` -> `DesignCode`), but
+# instances have `__slots__` and no `__dict__`, and are frozen, since a design run builds thousands of them.
+# As dataclasses they have no `model_dump()`/`model_copy()`; use `dataclasses.asdict()`/`dataclasses.replace()`.
+@validated_dataclass(slots=True, frozen=True)
+class UtilisationCheck:
+    """Simple utilisation check result. Hashable; `metadata` is free-form notes, left out of the hash."""
     utilisation: float
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict, hash=False)
     adequacy: Literal["OK", "FAILS"] = "OK"
     reference: Optional["Reference"] = None
 
 
-class Reference(BaseModel):
+@dataclass(slots=True)
+class UtilisationCheckArray:
+    """Utilisation check results for a batch of members or load cases, as parallel arrays (struct of arrays)
+    rather than one `UtilisationCheck` per entry. `adequate` is the boolean mask `utilisation <= 1.0`."""
+    utilisation: np.ndarray
+    adequate: np.ndarray
+    reference: Optional["Reference"] = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.utilisation.size
+
+    def __getitem__(self, index: Any) -> UtilisationCheck:
+        """The `UtilisationCheck` for one entry of the batch."""
+        return UtilisationCheck(
+            utilisation=float(self.utilisation[index]),
+            metadata=dict(self.metadata),
+            adequacy="OK" if self.adequate[index] else "FAILS",
+            reference=self.reference,
+        )
+
+
+@validated_dataclass(slots=True, frozen=True) # immutable, so check modules can share one instance per clause
+class Reference:
     code: DesignCode # or string?
     clause: Optional[str] = None
     # section: Optional[str] = None # for US # FIXME: may be problematic; retain clause
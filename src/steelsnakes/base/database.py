@@ -5,13 +5,36 @@ import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
 import json
+import operator
 import sqlite3
-from typing import Any, Optional, Type, Iterable
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Type, Iterable
+
+if TYPE_CHECKING:
+    import numpy as np
 
 from steelsnakes.base.sections import SectionType
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Section JSON files are parsed with `orjson` when installed (`pip install steelsnakes[fast]`), else the standard library
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Text properties repeated across many rows (e.g. every 457x191 UB shares `serial_size`), interned at load
+_INTERNED_PROPERTIES: tuple[str, ...] = ("serial_size", "hxh", "hxb", "axb")
+
+# Comparison operators understood by `search_sections()` / `filter_sections()` as `<property>__<op>`
+_COMPARISONS: dict[str, Any] = {
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
 
 
 class SectionDatabase(ABC):
@@ -22,6 +45,9 @@ class SectionDatabase(ABC):
     - override `_fuzzy_find_section()`
     """
 
+    # If `True`, section types are read from disk on first access rather than all at once in `__init__`
+    lazy_load: bool = False
+
     def __init__(self, data_directory: Optional[Path] = None, use_sqlite: bool = False) -> None:
         """Initialize the database with the data directory.
         
@@ -33,6 +59,8 @@ class SectionDatabase(ABC):
         self.use_sqlite: bool = use_sqlite
         self._cache: dict[SectionType, dict[str, dict[str, Any]]] = {}
         self._sqlite_db_path: Optional[Path] = None
+        self._tables: dict[SectionType, np.ndarray] = {} # NumPy views of `_cache`, see `section_table()`
+        self._arrays: dict[tuple[SectionType, str], dict[str, np.ndarray]] = {} # per-column copies, see `as_arrays()`
         self._load_sections()
 
     # ------- Abstract Methods -------
@@ -45,8 +73,8 @@ class SectionDatabase(ABC):
 
     # -
     @abstractmethod
-    def get_supported_types(self) -> list[SectionType]:
-        """Return a tuple of supported section types for given region."""
+    def get_supported_types(self) -> Sequence[SectionType]:
+        """Return a sequence (list or tuple) of supported section types for given region."""
         # Override in region-specific databases
         pass
 
@@ -60,34 +88,58 @@ class SectionDatabase(ABC):
     # ------- Standard Interface Methods -------
     # 🌟 - Loading sections from database
     def _load_sections(self) -> None:
-        """Load all supported section types into the cache."""
+        """Load all supported section types into the cache, unless the region loads them lazily."""
         if not self.data_directory.is_dir(): # .is_dir() implies .exists()
             # raise FileNotFoundError(f"Data directory '{self.data_directory}' does not exist.") # TODO: compare raise vs log warning and return
             logger.warning(f"Data directory '{self.data_directory}' does not exist.")
             return
 
-        loaded_count: int = 0
+        if self.lazy_load:
+            return # each type is loaded on first access, see `_get_sections()`
 
         for section_type in self.get_supported_types(): # .get_supported_types() is overridden in region-specific databases
-            try:
-                section_data = self._load_section_type(section_type)
-                if section_data:
-                    # Adding metadata for each section...
-                    for designation, properties in section_data.items():
-                        properties["_section_type"] = section_type.value
+            self._cache_section_type(section_type)
 
-                    self._cache[section_type] = section_data
-                    # logger.info(f"Loaded {len(section_data)} {section_type.value} sections") # TODO: consider silent logging for success
-                    loaded_count += 1
+    # -
+    def _cache_section_type(self, section_type: SectionType) -> dict[str, dict[str, Any]]:
+        """Load a single section type into the cache and return its sections."""
+        try:
+            section_data = self._load_section_type(section_type)
+            if section_data:
+                # Adding metadata for each section, and interning designations (the keys every lookup hashes
+                # and compares) so the key and the row's `designation` share one string object...
+                interned_data: dict[str, dict[str, Any]] = {}
+                for designation, properties in section_data.items():
+                    designation = sys.intern(designation)
+                    properties["_section_type"] = section_type.value
+                    if properties.get("designation") == designation:
+                        properties["designation"] = designation
+                    for key in _INTERNED_PROPERTIES:
+                        value = properties.get(key)
+                        if isinstance(value, str):
+                            properties[key] = sys.intern(value)
+                    interned_data[designation] = properties
+                section_data = interned_data
+                # logger.info(f"Loaded {len(section_data)} {section_type.value} sections") # TODO: consider silent logging for success
+            else:
+                section_data = {}
 
-                else:
-                    self._cache[section_type] = {}
+        except Exception as e:
+            logger.error(f"Error loading {section_type.value} sections: {e}")
+            section_data = {}
 
-            except Exception as e:
-                logger.error(f"Error loading {section_type.value} sections: {e}")
-                self._cache[section_type] = {}
+        self._cache[section_type] = section_data
+        return section_data
 
-        # logger.info(f"Loaded {loaded_count} section types into cache.") # TODO: consider silent logging for success
+    # -
+    def _get_sections(self, section_type: SectionType) -> dict[str, dict[str, Any]]:
+        """Return the cached sections of a type, loading them on first access for lazy regions."""
+        sections: Optional[dict[str, dict[str, Any]]] = self._cache.get(section_type)
+        if sections is None:
+            if not self.lazy_load or section_type not in self.get_supported_types():
+                return {}
+            sections = self._cache_section_type(section_type)
+        return sections
     
     # -
     def _load_section_type(self, section_type: SectionType) -> Optional[dict[str, dict[str, Any]]]:
@@ -97,8 +149,7 @@ class SectionDatabase(ABC):
         json_path: Path = self.data_directory / f"{section_type.value}.json"
         
         if json_path.exists():
-            with open(json_path, mode="r", encoding="utf-8") as filepath:
-                return json.load(fp=filepath)
+            return _json_loads(json_path.read_bytes()) # UTF-8 bytes; both parsers decode them directly
         
         # Try SQLite if enabled (experimental)
         if self.use_sqlite:
@@ -119,12 +170,12 @@ class SectionDatabase(ABC):
     # - 🌟 Get section data
     def get_section_data(self, designation: str, section_type: SectionType) -> Optional[dict[str, Any]]:
         """Retrieve section data by designation and type."""
-        return self._cache.get(section_type, {}).get(designation)
+        return self._get_sections(section_type).get(designation)
     
     # -
     def list_sections(self, section_type: SectionType) -> list[str]:
         """List all section designations for a given type."""
-        return list(self._cache.get(section_type, {}).keys())
+        return list(self._get_sections(section_type).keys())
     
     # 🌟 - Find section # TODO: redocument
     def find_section(self, designation: str) -> Optional[tuple[SectionType, dict[str, Any]]]:
@@ -144,7 +195,7 @@ class SectionDatabase(ABC):
         return [
             section_type for section_type 
             in self.get_supported_types()
-            if section_type in self._cache and self._cache[section_type]
+            if self._get_sections(section_type)
             ]
     
     # 🌟 - Search sections from cache; is independent of database impl.
@@ -155,7 +206,7 @@ class SectionDatabase(ABC):
         ) -> list[tuple[str, dict[str, Any]]]:
 
         """Search sections by criteria with comparison operators."""
-        sections: dict[str, dict[str, Any]] = self._cache.get(section_type, {})
+        sections: dict[str, dict[str, Any]] = self._get_sections(section_type)
         results = []
 
         for designation, data in sections.items():
@@ -203,6 +254,139 @@ class SectionDatabase(ABC):
         
         return results
 
+    # 🌟 - Vectorised queries over a NumPy structured array per section type
+    def section_table(self, section_type: SectionType) -> np.ndarray:
+        """Return the sections of a type as a structured array, built once and cached.
+
+        One row per section, with a `designation` column plus every numeric (`f8`) and boolean
+        column of the source data; text columns are left out. Missing numbers are stored as NaN.
+        """
+        import numpy as np # deferred so NumPy is only imported for catalogue-wide queries
+
+        table: Optional[np.ndarray] = self._tables.get(section_type)
+        if table is not None:
+            return table
+
+        sections: dict[str, dict[str, Any]] = self._get_sections(section_type)
+        rows: list[dict[str, Any]] = list(sections.values())
+        dtype: list[tuple[str, Any]] = [("designation", object)]
+        for key in (rows[0] if rows else {}):
+            if key.startswith("_") or key == "designation":
+                continue
+            values = [row.get(key) for row in rows]
+            if all(isinstance(value, bool) for value in values):
+                dtype.append((key, "?"))
+            elif all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)) for value in values):
+                dtype.append((key, "f8"))
+
+        table = np.empty(len(rows), dtype=dtype)
+        table["designation"] = list(sections)
+        for key, kind in dtype[1:]:
+            missing = False if kind == "?" else np.nan
+            table[key] = [missing if (value := row.get(key)) is None else value for row in rows]
+
+        self._tables[section_type] = table
+        return table
+
+    # -
+    def filter_sections(self, section_type: SectionType, **criteria: Any) -> list[str]:
+        """Return the designations matching `criteria`, evaluated as NumPy masks.
+
+        Takes the same `<property>` / `<property>__<op>` criteria as `search_sections()` for numeric
+        and boolean properties; unknown operators are ignored and unknown properties match nothing.
+        """
+        import numpy as np
+
+        table: np.ndarray = self.section_table(section_type)
+        mask = np.ones(len(table), dtype=bool)
+        for key, value in criteria.items():
+            prop, _, op = key.partition("__")
+            compare = _COMPARISONS.get(op or "eq")
+            if compare is None:
+                continue # unknown operator, skip this criteria (as in `search_sections()`)
+            if prop == "designation" or prop not in table.dtype.names:
+                return []
+            mask &= compare(table[prop], value)
+
+        return table["designation"][mask].tolist()
+
+    # -
+    def as_arrays(self, section_type: SectionType, dtype: Any = "f8") -> dict[str, np.ndarray]:
+        """Return the columns of `section_table()` by name, each copied once into its own contiguous array
+        (structure of arrays), so whole-column arithmetic runs over packed memory rather than strided rows.
+
+        Numeric columns are stored as `dtype`; pass `"f4"` (float32) to halve the memory moved by
+        catalogue-wide scans, as tabulated properties carry only 4-5 significant figures anyway.
+        """
+        import numpy as np
+
+        key: tuple[SectionType, str] = (section_type, np.dtype(dtype).str)
+        arrays: Optional[dict[str, np.ndarray]] = self._arrays.get(key)
+        if arrays is None:
+            columns: Optional[dict[str, np.ndarray]] = self._load_baked_arrays(section_type)
+            if columns is None:
+                table: np.ndarray = self.section_table(section_type)
+                columns = {name: table[name] for name in table.dtype.names}
+            arrays = {
+                name: np.ascontiguousarray(column, dtype=dtype if column.dtype.kind == "f" else None)
+                for name, column in columns.items()
+            }
+            self._arrays[key] = arrays
+        return arrays
+
+    # -
+    def _get_arrays_path(self, section_type: SectionType) -> Path:
+        """Return where `save_arrays()` bakes a section type's columns: `{data_directory}/{TYPE}.npz`."""
+        return self.data_directory / f"{section_type.value}.npz"
+
+    # 🌟 - Bake columns to a binary file
+    def save_arrays(self, section_type: SectionType) -> Path:
+        """Write the `as_arrays()` columns of a section type to a `.npz` beside its JSON file and return its path.
+
+        Once baked, `as_arrays()` (and so `mask_sections()`) read the typed columns straight from the binary
+        file instead of building them from the parsed JSON, for as long as the JSON file is not newer.
+        """
+        import numpy as np
+
+        arrays: dict[str, np.ndarray] = self.as_arrays(section_type)
+        path: Path = self._get_arrays_path(section_type)
+        columns = {name: array.astype(str) if array.dtype == object else array for name, array in arrays.items()}
+        np.savez(path, **columns) # designations stored as fixed-width text, so loading needs no pickle
+        return path
+
+    # 🌟 - Bake every section type
+    def save_all_arrays(self) -> list[Path]:
+        """Bake the columns of every supported section type that has data (see `save_arrays()`), e.g. as a
+        build step after updating the JSON files, and return the paths written."""
+        return [self.save_arrays(section_type) for section_type in self.get_available_section_types()]
+
+    # -
+    def _load_baked_arrays(self, section_type: SectionType) -> Optional[dict[str, np.ndarray]]:
+        """Return the columns baked by `save_arrays()`, or `None` if there are none or the JSON file is newer."""
+        import numpy as np
+
+        path: Path = self._get_arrays_path(section_type)
+        json_path: Path = self.data_directory / f"{section_type.value}.json"
+        try:
+            if json_path.exists() and json_path.stat().st_mtime > path.stat().st_mtime:
+                return None
+            with np.load(path, allow_pickle=False) as baked:
+                columns: dict[str, np.ndarray] = {name: baked[name] for name in baked.files}
+        except (OSError, ValueError):
+            return None
+        if "designation" not in columns: # not written by `save_arrays()`; rebuild from the JSON instead
+            return None
+        # Object array of interned strings, as built from the (interned) JSON rows
+        columns["designation"] = np.array([sys.intern(designation) for designation in columns["designation"].tolist()], dtype=object)
+        return columns
+
+    # -
+    def mask_sections(self, section_type: SectionType, predicate: Callable[[dict[str, np.ndarray]], np.ndarray], dtype: Any = "f8") -> list[str]:
+        """Return the designations where `predicate(columns)` is true, without creating any sections, e.g.
+        `db.mask_sections(SectionType.UB, lambda c: (c["I_yy"] > 50000) & (c["h"] < 600))`."""
+        arrays: dict[str, np.ndarray] = self.as_arrays(section_type, dtype)
+        return arrays["designation"][predicate(arrays)].tolist()
+
     # ------- SQLite Methods -------
     # - 🪶 SQLite: Get database path
     def _get_sqlite_db_path(self) -> Path:
@@ -2,17 +2,47 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import MISSING, fields
 from typing import Any, Optional, Type
+import importlib
 import logging
 import difflib
 
 from steelsnakes.base.sections import BaseSection, SectionType
 from steelsnakes.base.database import SectionDatabase
+from steelsnakes.base.table import SectionTable
 from steelsnakes.base.exceptions import SectionNotFoundError, SectionTypeNotRegisteredError
 
 # -
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Most recent `create_section()` queries kept per factory, so arbitrary user spellings can't grow it without limit
+_MAX_QUERY_ALIASES: int = 1024
+
+# Per-class `(field names, ((name, default), ...))` used by `_instantiate()`; `None` means "use the constructor"
+_CONSTRUCTION_PLANS: dict[type, Optional[tuple[frozenset[str], tuple[tuple[str, Any], ...]]]] = {}
+
+
+def _construction_plan(section_class: Type[BaseSection]) -> Optional[tuple[frozenset[str], tuple[tuple[str, Any], ...]]]:
+    """Return how to fill `section_class` field-by-field, or `None` if it needs its own `__init__`."""
+    try:
+        return _CONSTRUCTION_PLANS[section_class]
+    except KeyError:
+        pass
+
+    plan = None
+    # Only classes decorated with @dataclass (so `__init__` is the generated one) without post-init hooks
+    if "__dataclass_fields__" in section_class.__dict__ and not hasattr(section_class, "__post_init__"):
+        section_fields = fields(section_class)
+        if all(f.init and f.default_factory is MISSING for f in section_fields):
+            plan = (
+                frozenset(f.name for f in section_fields),
+                tuple((f.name, f.default) for f in section_fields),
+            )
+    _CONSTRUCTION_PLANS[section_class] = plan
+    return plan
+
 # -
 class SectionFactory(ABC):
     """Abstract base class for section factories.
@@ -26,6 +56,9 @@ class SectionFactory(ABC):
         """Initialize the factory with a section database."""
         self.database: SectionDatabase = database
         self._section_classes: dict[SectionType, Type[BaseSection]] = {}
+        self._lazy_section_classes: dict[SectionType, tuple[str, str]] = {} # type -> (module, class name)
+        self._instances: dict[tuple[str, SectionType], BaseSection] = {} # (designation, type) -> section; see `create_section()`
+        self._query_aliases: OrderedDict[tuple[str, Optional[SectionType]], BaseSection] = OrderedDict() # LRU of raw queries
         self._register_default_classes()
 
     # -
@@ -37,9 +70,41 @@ class SectionFactory(ABC):
 
     # -
     def register_section_class(self, section_class: Type[BaseSection]) -> None:
-        """Register a section class for automatic creation."""
-        section_type: SectionType = section_class.get_section_type()
-        self._section_classes[section_type] = section_class
+        """Register a section class for automatic creation.
+        Classes serving several section types list them in a `_TYPES` class attribute."""
+        section_types: tuple[SectionType, ...] = getattr(section_class, "_TYPES", None) or (section_class.get_section_type(),)
+        for section_type in section_types:
+            self._section_classes[section_type] = section_class
+
+    # -
+    def register_lazy_section_class(self, section_types: tuple[SectionType, ...], module_name: str, class_name: str) -> None:
+        """Register a section class by import path, for `section_types`, without importing it yet.
+        The module is imported the first time one of those types is created, see `_get_section_class()`."""
+        for section_type in section_types:
+            self._lazy_section_classes[section_type] = (module_name, class_name)
+
+    # -
+    def _get_section_class(self, section_type: SectionType) -> Optional[Type[BaseSection]]:
+        """Return the class registered for `section_type`, importing a lazily registered one on first use."""
+        section_class: Optional[Type[BaseSection]] = self._section_classes.get(section_type)
+        if section_class is not None:
+            return section_class
+
+        target: Optional[tuple[str, str]] = self._lazy_section_classes.get(section_type)
+        if target is None:
+            return None
+        module_name, class_name = target
+        try:
+            section_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Warning: Could not import {module_name}.{class_name}: {e}")
+            return None
+
+        for lazy_type, lazy_target in list(self._lazy_section_classes.items()):
+            if lazy_target == target:
+                del self._lazy_section_classes[lazy_type]
+        self.register_section_class(section_class)
+        return section_class
 
     def _get_similar_sections(self, designation: str, section_type: Optional[SectionType] = None, n: int = 3) -> list[str]:
         """Get similar section designations using fuzzy matching.
@@ -75,7 +140,30 @@ class SectionFactory(ABC):
 
     # 🌟 - Create section
     def create_section(self, designation: str, section_type: Optional[SectionType] = None) -> BaseSection:
-        """Create a section instance given its designation and optional type."""
+        """Create a section instance given its designation and optional type.
+        Sections are catalogue rows, so each `(designation, section_type)` row is built once and the same
+        instance is returned on later calls; treat returned sections as read-only.
+        Lookups with or without the type (and fuzzy matches of the same designation) share that instance."""
+        query = (designation, section_type)
+        section: Optional[BaseSection] = self._query_aliases.get(query)
+        if section is not None:
+            self._query_aliases.move_to_end(query)
+            return section
+
+        section_type, section_data = self._find_section_data(designation, section_type)
+        key = (section_data.get("designation", designation), section_type) # the type looked up, not the class's primary type
+        section = self._instances.get(key)
+        if section is None:
+            section = self._instances[key] = self._build_section(designation, section_type, section_data)
+
+        self._query_aliases[query] = section
+        if len(self._query_aliases) > _MAX_QUERY_ALIASES:
+            self._query_aliases.popitem(last=False)
+        return section
+
+    # -
+    def _find_section_data(self, designation: str, section_type: Optional[SectionType] = None) -> tuple[SectionType, dict[str, Any]]:
+        """Look up a section's type and row of data, raising `SectionNotFoundError` with suggestions if it is missing."""
 
         if section_type:
             # Use specified type
@@ -127,10 +215,16 @@ class SectionFactory(ABC):
          
             section_type, section_data = result
 
+        return section_type, section_data
+
+    # -
+    def _build_section(self, designation: str, section_type: SectionType, section_data: dict[str, Any]) -> BaseSection:
+        """Build a new instance of the class registered for `section_type` from its row of data."""
+
         # Get the section class
-        section_class: Optional[Type[BaseSection]] = self._section_classes.get(section_type)
+        section_class: Optional[Type[BaseSection]] = self._get_section_class(section_type)
         if not section_class:
-            raise SectionTypeNotRegisteredError(f"No registered class for section type '{section_type.value}'. Available types: {[t.value for t in self._section_classes.keys()]}")
+            raise SectionTypeNotRegisteredError(f"No registered class for section type '{section_type.value}'. Available types: {[t.value for t in {**self._section_classes, **self._lazy_section_classes}]}")
             # TODO: compare raise vs log warning + return None
             # FIXME: fix error message: doesn't show list of available types
 
@@ -142,8 +236,48 @@ class SectionFactory(ABC):
         if 'designation' not in clean_data:
             clean_data['designation'] = designation
             
-        return section_class(**clean_data)
+        return self._instantiate(section_class, clean_data)
+
+    # -
+    @staticmethod
+    def _instantiate(section_class: Type[BaseSection], data: dict[str, Any]) -> BaseSection:
+        """Create a section from a row of data.
+        Plain dataclass sections are allocated with `__new__` and filled field-by-field, skipping the
+        ~30 keyword binds of the generated `__init__`; rows with unknown or missing required keys, and
+        classes with their own constructor, go through `section_class(**data)` as usual."""
+        plan = _construction_plan(section_class)
+        if plan is None:
+            return section_class(**data)
+
+        names, defaults = plan
+        if not names.issuperset(data):
+            return section_class(**data) # raises the usual TypeError for unexpected keys
+
+        instance = section_class.__new__(section_class)
+        get, set_attribute, missing = data.get, object.__setattr__, MISSING # locals, not per-field attribute/global loads
+        for name, default in defaults:
+            value = get(name, default)
+            if value is missing:
+                return section_class(**data) # raises the usual TypeError for missing arguments
+            set_attribute(instance, name, value)
+        return instance
+
+
+    # 🌟 - Column-wise catalogue
+    def table(self, section_type: SectionType, dtype: Any = "f4") -> SectionTable:
+        """Return the sections of `section_type` as a `SectionTable` of (float32 by default) NumPy columns, for
+        bulk queries such as `table.select(table.I_yy > 5e4)`; sections are only created for the rows selected."""
+        return SectionTable(self, section_type, dtype)
 
+    # 🌟 - Filter sections
+    def filter_sections(self, section_type: SectionType, **criteria: Any) -> list[BaseSection]:
+        """Create only the sections of `section_type` that match `criteria`,
+        e.g. `filter_sections(SectionType.UB, mass_per_metre__lt=100, I_yy__gt=5e4)`.
+        Matching runs on the database's NumPy table (see `SectionDatabase.filter_sections()`)."""
+        return [
+            self.create_section(designation, section_type)
+            for designation in self.database.filter_sections(section_type, **criteria)
+        ]
 
 if __name__ == "__main__":
     # TODO: add tests here
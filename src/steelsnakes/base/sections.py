@@ -5,18 +5,29 @@
 
 from __future__ import annotations
 import logging
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Optional
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-class SectionType(Enum):
+class SectionType(str, Enum):
     """Global enumeration of all section types available in steelsnakes.
     Currently supports 🇬🇧 UK, 🇪🇺 EU, 🇺🇸 US.
     Developing 🇮🇳 IS.
     Considering 🇦🇺 AU / 🇳🇿 NZ, 🇯🇵 JP, 🇲🇽 MX, 🇿🇦 SA, 🇨🇳 CN, 🇨🇦 CA, 🇰🇷 KR.
+
+    The `str` mixin gives members C-level (cached) `str` hashing and equality, which matters as they key
+    every factory registry and database cache lookup; `Enum.__hash__` is a Python-level call. Values stay
+    strings since they name the data files, e.g. `UB.json`.
     """
     
     # --- 🇬🇧 UK ---
@@ -170,9 +181,26 @@ class SectionType(Enum):
     # TODO: Add info here... from KS standards (K004en.pdf available)
 
 
+_DESIGNATION_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+@lru_cache(maxsize=4096)
+def parse_designation(designation: str) -> tuple[float, ...]:
+    """Return the numbers in a designation, e.g. `"200x100x14"` -> `(200.0, 100.0, 14.0)`
+    or `"HD-400x421"` -> `(400.0, 421.0)`. Memoized, so each designation is only split once."""
+    return tuple(float(number) for number in _DESIGNATION_NUMBER.findall(designation))
+
+
 @dataclass
 class BaseSection(ABC):
-    """Abstract base class for all steel sections"""
+    """Abstract base class for all steel sections.
+
+    Sections are catalogue rows and factories may hand the same instance to several callers, so treat
+    them as read-only; derive a modified copy with `dataclasses.replace(section, ...)` instead.
+    Sections hash by class and designation, so they can key dicts, sets and `lru_cache`d calculations."""
+
+    # Only the `get_properties()` cache slot, so `@dataclass(slots=True)` subclasses carry no per-instance
+    # `__dict__`; subclasses that don't declare slots still get one as usual.
+    __slots__ = ("_properties",)
 
     designation: str # TODO: find other properties e.g mass/weight present in all sections
     # section_type: SectionType # TODO: implement section_type as Enum in all sections
@@ -182,6 +210,10 @@ class BaseSection(ABC):
     
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(designation={self.designation})"
+
+    def __hash__(self) -> int:
+        # Equal sections (same class and fields) share a designation, so hash that rather than every field
+        return hash((self.__class__, self.designation))
     
     # - 🌟 Get section type
     @classmethod # A classmethod is a method that is bound to the class and not the instance of the class
@@ -198,11 +230,88 @@ class BaseSection(ABC):
         return cls(**data)
 
     # - 🌟 Get section properties
-    @abstractmethod
-    def get_properties(self) -> dict[str, Any]:
-        """Return a dictionary of all section properties."""
-        # TODO: implement...
-        pass
+    def get_properties(self) -> Mapping[str, Any]:
+        """Return a read-only mapping of all section properties.
+        Fields are read by a per-class generated function (one dict display) on first use and the result is
+        kept on the instance, so repeat calls allocate nothing; override for custom behaviour."""
+        try:
+            return self._properties
+        except AttributeError:
+            properties = self._properties = MappingProxyType(self._property_accessor()[2](self))
+            return properties
+
+    def __getstate__(self) -> Any:
+        # Leave the `get_properties()` cache out of pickles and copies; it is rebuilt on first use
+        state = super().__getstate__()
+        if isinstance(state, tuple): # (instance dict or None, slot values)
+            dict_state, slot_state = state
+            state = (dict_state, {name: value for name, value in slot_state.items() if name != "_properties"} or None)
+        return state
+
+    # Per-class `(field names, tuple getter, dict builder)` used by `get_properties()`, reset for every subclass
+    _properties_accessor = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # `@dataclass(slots=True)` re-creates the class with its fields already attached, so slotted
+        # sections get their accessor here, at definition time. For other classes this hook runs before
+        # `@dataclass` has added the fields, so the accessor is built on first use instead.
+        cls._properties_accessor = _build_property_accessor(cls) if "__dataclass_fields__" in cls.__dict__ else None
+        # `@dataclass` (eq=True, not frozen) sets `__hash__ = None` unless the class defines one, so define it here
+        if "__hash__" not in cls.__dict__:
+            cls.__hash__ = BaseSection.__hash__
+
+    @classmethod
+    def _property_accessor(cls) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]], Callable[[Any], dict[str, Any]]]:
+        """Return the field names, a tuple getter and a dict builder for them, built once per class."""
+        accessor = cls._properties_accessor
+        if accessor is None:
+            accessor = cls._properties_accessor = _build_property_accessor(cls)
+        return accessor
+
+
+def _build_property_accessor(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]], Callable[[Any], dict[str, Any]]]:
+    """Return the dataclass field names of `cls`, an `attrgetter` returning their values as a tuple, and a
+    function returning them as a dict. The latter is generated source, `{'h': self.h, ...}`, as `dataclasses`
+    does for `__init__`: one dict display with direct attribute loads, no zip or per-call introspection."""
+    names: tuple[str, ...] = tuple(f.name for f in fields(cls))
+    getter = attrgetter(*names)
+    if len(names) == 1: # a single-name attrgetter returns the bare value
+        getter = lambda obj, _get=getter: (_get(obj),)
+    namespace: dict[str, Any] = {}
+    exec("def as_dict(self):\n    return {" + ", ".join(f"{name!r}: self.{name}" for name in names) + "}\n", namespace)
+    return names, getter, namespace["as_dict"]
+
+
+# 🌟 - Structure-of-arrays view over section instances
+def section_arrays(sections: Sequence[BaseSection], dtype: Any = "f8") -> dict[str, np.ndarray]:
+    """Pack the fields of same-class sections into one contiguous NumPy array per field, e.g. for
+    catalogue-wide checks such as `np.sqrt(fy * (K * L / arrays["r_y"])**2 / (np.pi**2 * E))`.
+
+    Mirrors `SectionDatabase.as_arrays()` for sections built in code rather than loaded from data:
+    `designation` is kept as an object array, numeric fields as `dtype` (`float64` by default, `"f4"` for
+    float32) and boolean fields as `bool`; other text fields are left out.
+    """
+    import numpy as np # deferred so NumPy is only imported for catalogue-wide queries
+
+    if not sections:
+        return {}
+    section_class: type[BaseSection] = type(sections[0])
+    if any(type(section) is not section_class for section in sections):
+        raise TypeError(f"section_arrays() needs sections of one class, got a mix with {section_class.__name__}")
+
+    names, getter, _ = section_class._property_accessor()
+    rows: list[tuple[Any, ...]] = [getter(section) for section in sections]
+    arrays: dict[str, np.ndarray] = {}
+    for position, name in enumerate(names):
+        values = [row[position] for row in rows]
+        if name == "designation":
+            arrays[name] = np.array(values, dtype=object)
+        elif all(isinstance(value, bool) for value in values):
+            arrays[name] = np.fromiter(values, dtype=bool, count=len(values))
+        elif all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+            arrays[name] = np.fromiter(values, dtype=dtype, count=len(values))
+    return arrays
 
 
 if __name__ == "__main__":
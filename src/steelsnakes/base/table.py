@@ -0,0 +1,53 @@
+"""Column-wise (structure of arrays) view of a section catalogue in `steelsnakes`."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterator
+
+from steelsnakes.base.sections import BaseSection, SectionType
+
+if TYPE_CHECKING:
+    import numpy as np
+    from steelsnakes.base.factory import SectionFactory
+
+
+# -
+class SectionTable:
+    """All sections of one type as parallel NumPy columns, one entry per section, e.g.
+    `table = factory.table(SectionType.UB); heavy = table.select(table.I_yy > 50000)`.
+
+    Columns are the database's `as_arrays()` output, shared rather than copied, so treat them as read-only.
+    Numeric columns are float32 by default: tabulated properties carry 4-5 significant figures, and half the
+    bytes per scan doubles the values per SIMD lane; pass `dtype="f8"` where full float64 columns are wanted.
+    Section objects are only created when asked for, by index or through `select()`.
+    """
+
+    __slots__ = ("section_type", "columns", "_factory")
+
+    def __init__(self, factory: SectionFactory, section_type: SectionType, dtype: Any = "f4") -> None:
+        self.section_type: SectionType = section_type
+        self.columns: dict[str, np.ndarray] = factory.database.as_arrays(section_type, dtype)
+        self._factory: SectionFactory = factory
+
+    # -
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name.startswith("__") or name in SectionTable.__slots__: # unset slot (e.g. mid copy/unpickle) or dunder probe
+            raise AttributeError(name)
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' for '{self.section_type.value}' has no column '{name}'") from None
+
+    def __len__(self) -> int:
+        return len(self.columns["designation"])
+
+    def __iter__(self) -> Iterator[BaseSection]:
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, index: int) -> BaseSection:
+        """Create the section at row `index`."""
+        return self._factory.create_section(self.columns["designation"][index], self.section_type)
+
+    # -
+    def select(self, mask: np.ndarray) -> list[BaseSection]:
+        """Create the sections picked by a boolean mask (or integer index array) over the columns."""
+        return [self._factory.create_section(designation, self.section_type) for designation in self.columns["designation"][mask]]
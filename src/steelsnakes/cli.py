@@ -42,12 +42,13 @@ def _get_available_regions() -> list[str]:
 
 def _get_region_components(region: str) -> tuple[Any, Any]:
     """Get database and create_section function for a region."""
-    region_lower = region.lower()
+    # Package directories are region-cased (UK, US_Metric), so map the upper-cased region back to its name
+    region_name = next((d.name for d in Path(__file__).parent.iterdir() if d.name.upper() == region.upper()), region)
     
     try:
-        region_module = importlib.import_module(f"steelsnakes.{region_lower}") # Import the region module
-        database_module = importlib.import_module(f"steelsnakes.{region_lower}.database") # Import the database module
-        database_getter_name = f"get_{region_lower}_database" # Get the database getter function
+        region_module = importlib.import_module(f"steelsnakes.{region_name}") # Import the region module
+        database_module = importlib.import_module(f"steelsnakes.{region_name}.database") # Import the database module
+        database_getter_name = f"get_{region_name}_database" # Get the database getter function
         database_getter = getattr(database_module, database_getter_name) # Get the database getter function
         create_section = getattr(region_module, 'create_section') # Get the create_section function
         
@@ -157,6 +158,26 @@ def list_regions() -> None:
     print(f"\nTotal regions available: {len(available_regions)}")
     print("Use --region <REGION> to specify a region (default: UK)")
 
+def bake_arrays(region: str = "UK") -> None:
+    """Write each section type's property columns to a binary `.npz` beside its JSON file, so
+    `as_arrays()` and section tables load typed columns instead of parsing JSON."""
+    available_regions = _get_available_regions()
+    
+    if region.upper() not in available_regions:
+        print(f"✗ Region '{region}' not supported.")
+        print(f"Available regions: {', '.join(available_regions)}")
+        sys.exit(1)
+    
+    try:
+        database_getter, _ = _get_region_components(region.upper())
+        paths = database_getter().save_all_arrays()
+        print(f"=== {region.upper()} Baked Section Arrays ({len(paths)} types) ===")
+        for path in paths:
+            print(f"  {path}")
+    except Exception as e:
+        print(f"✗ Error baking section arrays: {e}")
+        sys.exit(1)
+
 def _display_properties(properties: dict[str, Any]) -> None:
     """Display section properties in a simple format."""
     # Skip internal/meta fields
@@ -192,6 +213,7 @@ Examples:
   %(prog)s list --type UB --region UK       # List UK Universal Beams
   %(prog)s list --type IPE --region EU      # List EU IPE sections
   %(prog)s regions                           # Show all available regions
+  %(prog)s bake --region UK                  # Bake UK section columns to .npz
         """
     )
     
@@ -215,6 +237,11 @@ Examples:
     # Regions command
     regions_parser = subparsers.add_parser('regions', help='List all available regions')
     
+    # Bake command
+    bake_parser = subparsers.add_parser('bake', help='Bake section property columns to binary .npz files')
+    bake_parser.add_argument('--region', default='UK',
+                           help='Region to bake section arrays for (default: UK)')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -227,6 +254,8 @@ Examples:
         list_sections(args.section_type, args.region, args.limit)
     elif args.command == 'regions':
         list_regions()
+    elif args.command == 'bake':
+        bake_arrays(args.region)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+Tests for the IN (IS 800:2007) design checks in `steelsnakes.IN.checks`.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from steelsnakes.IN.checks.bending import (
+    elastic_lateral_buckling_moment,
+    elastic_lateral_buckling_moment_grid,
+    elastic_lateral_buckling_moment_table,
+)
+from steelsnakes.IN.checks.combined import (
+    reduced_design_moment,
+    reduced_design_moment_semi_compact,
+    shear_reduction_factor,
+)
+from steelsnakes.IN.checks.compression import (
+    IMPERFECTION_FACTORS,
+    design_compressive_strength_table,
+    design_compressive_stress,
+)
+from steelsnakes.IN.checks.constants import GAMMA_M0
+from steelsnakes.IN.checks.shear import (
+    I_section_shear_areas,
+    design_shear_strength,
+    plastic_shear_resistance,
+    shear_area_CHS,
+    shear_area_RHS,
+)
+
+
+class TestCompression:
+    """Test IS 800:2007 7.1.2 design compressive stress and strength."""
+
+    def test_design_compressive_stress(self):
+        """Test fcd for fy = 250 N/mm², KL/r = 100, buckling class b (Table 9(b) gives 118)."""
+        assert design_compressive_stress(250.0, 100, IMPERFECTION_FACTORS["b"]) == pytest.approx(118.23, abs=0.01)
+
+    def test_zero_slenderness(self):
+        """Test that KL/r = 0 gives fcd = fy/gamma_M0 without a divide-by-zero warning."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            fcd = design_compressive_stress(250.0, [0.0, 100.0], IMPERFECTION_FACTORS["b"])
+        assert fcd == pytest.approx([250.0 / GAMMA_M0, 118.23], abs=0.01)
+
+    def test_table_shape(self):
+        """Test that a 1-D effective length gives one row per section and one column per length."""
+        arrays = {"area": np.array([20.0, 40.0, 60.0]), "r_y": np.array([80.0, 100.0, 120.0]), "r_z": np.array([20.0, 25.0, 30.0])}
+        Pd = design_compressive_strength_table(arrays, np.array([0.0, 1000.0, 2000.0, 2500.0]), 250.0, IMPERFECTION_FACTORS["b"])
+        assert Pd.shape == (3, 4)
+        # 2000 mm over r_z = 20 mm is KL/r = 100, on 2000 mm² of gross area
+        assert Pd[0, 2] == pytest.approx(2000.0 * 118.23, rel=1e-4)
+        assert design_compressive_strength_table(arrays, 2000.0, 250.0, IMPERFECTION_FACTORS["b"]).shape == (3,)
+
+
+class TestCombined:
+    """Test IS 800:2007 9.2 design bending strength under shear."""
+
+    # Vd = 100 kN, Md = 150 kNm, Mfd = 100 kNm, Ze = 573.6x10³ mm³, fy = 250 N/mm²
+    SECTION = {"Vd": 100e3, "Md": 150e6, "Mfd": 100e6, "Ze": 573.6e3, "fy": 250.0}
+
+    def test_low_shear(self):
+        """Test that Md is unreduced up to and including V = 0.6*Vd (9.2.1)."""
+        assert reduced_design_moment(V=60e3, **self.SECTION) == pytest.approx(150e6)
+        assert reduced_design_moment(V=20e3, **self.SECTION) == pytest.approx(150e6)
+
+    def test_high_shear(self):
+        """Test Mdv = Md - beta*(Md - Mfd) with beta = (2*80/100 - 1)² = 0.36 just above V = 0.6*Vd (9.2.2(a))."""
+        assert shear_reduction_factor(80e3, 100e3) == pytest.approx(0.36)
+        assert reduced_design_moment(V=80e3, **self.SECTION) == pytest.approx(150e6 - 0.36 * 50e6)
+
+    def test_high_shear_capped(self):
+        """Test that Mdv is capped at 1.2*Ze*fy/gamma_M0."""
+        section = {**self.SECTION, "Ze": 400e3}
+        assert reduced_design_moment(V=80e3, **section) == pytest.approx(1.2 * 400e3 * 250.0 / GAMMA_M0)
+
+    def test_broadcast(self):
+        """Test that shear forces either side of 0.6*Vd are handled in one call."""
+        Mdv = reduced_design_moment(V=np.array([60e3, 80e3]), **self.SECTION)
+        assert Mdv == pytest.approx([150e6, 132e6])
+
+    def test_semi_compact(self):
+        """Test Mdv = Ze*fy/gamma_M0 for semi-compact sections (9.2.2(b))."""
+        assert reduced_design_moment_semi_compact(573.6e3, 250.0) == pytest.approx(573.6e3 * 250.0 / GAMMA_M0)
+
+
+class TestShear:
+    """Test IS 800:2007 8.4 shear areas and design shear strength."""
+
+    def test_I_section_shear_areas(self):
+        """Test Av = h*tw along the web and 2*b*tf along the flanges, for ISMB 300 and ISMB 400."""
+        arrays = {"D": np.array([300.0, 400.0]), "t": np.array([7.5, 8.9]), "B": np.array([140.0, 140.0]), "T": np.array([12.4, 16.0])}
+        Av = I_section_shear_areas(arrays)
+        assert Av["Av_major"] == pytest.approx([2250.0, 3560.0])
+        assert Av["Av_minor"] == pytest.approx([3472.0, 4480.0])
+
+    def test_RHS(self):
+        """Test Av = A*h/(b+h), and A*b/(b+h) with h and b swapped."""
+        assert shear_area_RHS(5490.0, 200.0, 100.0) == pytest.approx(3660.0)
+        assert shear_area_RHS(5490.0, 100.0, 200.0) == pytest.approx(1830.0)
+
+    def test_CHS(self):
+        """Test Av = 2*A/pi."""
+        assert shear_area_CHS(np.pi * 1000.0) == pytest.approx(2000.0)
+
+    def test_design_shear_strength(self):
+        """Test Vp = Av*fyw/sqrt(3) and Vd = Vp/gamma_M0 for ISMB 300 at fyw = 250 N/mm²."""
+        assert plastic_shear_resistance(2250.0, 250.0) == pytest.approx(324_760, rel=1e-5)
+        assert design_shear_strength(2250.0, 250.0) == pytest.approx(324_760 / GAMMA_M0, rel=1e-5)
+        assert design_shear_strength([2250.0, 3560.0], 250.0).shape == (2,)
+
+
+class TestBending:
+    """Test IS 800:2007 8.2.2.1 elastic lateral buckling moment."""
+
+    # ISMB 300: Iy = 453.9x10⁴ mm⁴, hf = 300 - 12.4 mm, ry = 28.4 mm, tf = 12.4 mm
+    ISMB_300 = (453.9e4, 287.6, 28.4, 12.4)
+
+    def test_elastic_lateral_buckling_moment(self):
+        """Test Mcr = (pi²*E*Iy*hf)/(2*L_LT²) * [1 + 0.05*((L_LT/ry)/(hf/tf))²]^0.5 at L_LT = 3 m."""
+        Mcr = elastic_lateral_buckling_moment(*self.ISMB_300, 3000.0)
+        assert np.ndim(Mcr) == 0
+        assert Mcr == pytest.approx(204.32e6, rel=1e-4)
+
+    def test_grid_shape(self):
+        """Test that the grid has one row per section and one column per effective length."""
+        Iy, hf, ry, tf = (np.array([value, 2 * value]) for value in self.ISMB_300)
+        Mcr = elastic_lateral_buckling_moment_grid(Iy, hf, ry, tf, [2000.0, 3000.0, 4000.0])
+        assert Mcr.shape == (2, 3)
+        assert Mcr[0, 1] == pytest.approx(elastic_lateral_buckling_moment(*self.ISMB_300, 3000.0))
+
+    def test_table_picks_minor_axis(self):
+        """Test that the table reads the minor axis and hf = D - T from the property columns."""
+        arrays = {"D": np.array([300.0]), "T": np.array([12.4]), "I_yy": np.array([8603.6]), "I_zz": np.array([453.9]), "r_y": np.array([123.7]), "r_z": np.array([28.4])}
+        Mcr = elastic_lateral_buckling_moment_table(arrays, [3000.0])
+        assert Mcr.shape == (1, 1)
+        assert Mcr[0, 0] == pytest.approx(elastic_lateral_buckling_moment(*self.ISMB_300, 3000.0))
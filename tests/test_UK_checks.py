@@ -0,0 +1,216 @@
+"""
+Tests for the UK (EN 1993-1-1) design checks in `steelsnakes.UK.checks`.
+"""
+
+import dataclasses
+import math
+
+import numpy as np
+import pytest
+
+from steelsnakes.UK import UB, HFCHS, HFRHS, HFSHS, HFEHS
+from steelsnakes.UK.checks.stability import (
+    BucklingCurve,
+    buckling_resistance,
+    chi_flexural,
+    epsilon,
+    flexural_slenderness,
+    imperfection_factor,
+    lambda_1,
+    reduction_factor,
+)
+from steelsnakes.base.checks import UtilisationCheck, UtilisationCheckArray
+from steelsnakes.UK.checks.uls import (
+    biaxial_bending_utilisation_batch,
+    compression_utilisation,
+    compression_utilisation_batch,
+    gamma_m1,
+    moment_utilisation,
+    moment_utilisation_batch,
+    shear_area,
+    shear_utilisation,
+    shear_utilisation_batch,
+    tension_utilisation,
+    tension_utilisation_batch,
+)
+
+
+class TestShearArea:
+    """Test EN 1993-1-1 clause 6.2.6(3) shear areas per section family."""
+
+    def test_rolled_I_section(self):
+        """Test Av = A - 2*b*tf + (tw + 2*r)*tf, with the eta*hw*tw lower bound."""
+        section = UB("457x191x67")
+        result = shear_area(section)
+        assert result["Av"] == pytest.approx(section.A*100 - 2*section.b*section.tf + (section.tw + 2*section.r)*section.tf)
+        assert result["Av"] == pytest.approx(4093.57)
+        assert result["Av_min"] == pytest.approx((section.h - 2*section.tf - 2*section.r) * section.tw)
+
+    def test_CHS(self):
+        """Test Av = 2*A/pi for circular hollow sections."""
+        section = HFCHS("42.4x3.2")
+        assert shear_area(section) == pytest.approx(2 * 394.0 / math.pi)
+
+    def test_RHS(self):
+        """Test Av = A*h/(b+h) parallel to the depth and A*b/(b+h) parallel to the width."""
+        result = shear_area(HFRHS("200x100x10.0"))
+        assert result["// depth"] == pytest.approx(5490.0 * 200 / 300)
+        assert result["// width"] == pytest.approx(5490.0 * 100 / 300)
+
+    def test_SHS(self):
+        """Test that square hollow sections read their side from the `hxh` column."""
+        section = HFSHS("40x40x3.2")
+        result = shear_area(section)
+        assert result["// depth"] == pytest.approx(section.A * 100 / 2)
+        assert result["// width"] == pytest.approx(result["// depth"])
+
+    def test_elliptical_hollow_section_not_implemented(self):
+        """Test that elliptical hollow sections raise rather than getting the circular formula."""
+        with pytest.raises(NotImplementedError, match="HFEHS"):
+            shear_area(HFEHS("300x150x8.0"))
+
+
+class TestUtilisationCheck:
+    """Test the frozen `UtilisationCheck` result type."""
+
+    def test_hashable(self):
+        """Test that results hash, with metadata left out of the hash but not out of equality."""
+        check = tension_utilisation(850e3, 1000e3)
+        assert hash(check) == hash(tension_utilisation(850e3, 1000e3))
+        assert len({check, tension_utilisation(850e3, 1000e3)}) == 1
+        assert hash(UtilisationCheck(utilisation=0.5)) == hash(UtilisationCheck(utilisation=0.5, metadata={"member": "B1"}))
+        assert UtilisationCheck(utilisation=0.5) != UtilisationCheck(utilisation=0.5, metadata={"member": "B1"})
+
+    def test_frozen(self):
+        """Test that fields cannot be reassigned, and that `dataclasses` replaces the removed model helpers."""
+        check = tension_utilisation(850e3, 1000e3)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            check.utilisation = 0.1
+        assert dataclasses.replace(check, utilisation=1.2).utilisation == 1.2
+        assert dataclasses.asdict(check)["adequacy"] == "OK"
+
+
+class TestBatchChecks:
+    """Test the `*_batch` utilisation checks and `UtilisationCheckArray`."""
+
+    def test_broadcast(self):
+        """Test members down the rows against one resistance per member, over load cases across the columns."""
+        checks = tension_utilisation_batch(np.array([[850e3, 1200e3], [400e3, 950e3]]), np.array([[1000e3], [900e3]]))
+        assert isinstance(checks, UtilisationCheckArray)
+        assert checks.utilisation.shape == (2, 2)
+        assert checks.utilisation == pytest.approx(np.array([[0.85, 1.2], [400 / 900, 950 / 900]]))
+        assert checks.adequate.tolist() == [[True, False], [True, False]]
+        assert checks.reference.equation == "6.5"
+
+    @pytest.mark.parametrize("batch", [tension_utilisation_batch, compression_utilisation_batch, moment_utilisation_batch, shear_utilisation_batch])
+    def test_adequate_at_unity(self, batch):
+        """Test that a utilisation of exactly 1.0 is adequate and anything above is not."""
+        checks = batch([0.5, 1.0, 1.0 + 1e-9], 1.0)
+        assert checks.adequate.tolist() == [True, True, False]
+
+    def test_scalar_is_one_entry(self):
+        """Test that scalar arguments give a batch of one."""
+        checks = compression_utilisation_batch(500e3, 1000e3)
+        assert checks.utilisation.shape == (1,)
+        assert len(checks) == 1
+
+    def test_biaxial_bending(self):
+        """Test (My/MNy)^alpha + (Mz/MNz)^beta with alpha and beta broadcast per member."""
+        checks = biaxial_bending_utilisation_batch([50.0, 50.0], [20.0, 20.0], 100.0, 40.0, alpha=[1.0, 2.0], beta=[1.0, 2.0])
+        assert checks.utilisation == pytest.approx([1.0, 0.5])
+        assert checks.adequate.tolist() == [True, True]
+
+    def test_len_and_getitem(self):
+        """Test that `len()` counts every entry and indexing gives the matching `UtilisationCheck`."""
+        checks = shear_utilisation_batch(np.array([[100.0, 300.0], [150.0, 250.0]]), 200.0)
+        assert len(checks) == 4
+        entry = checks[0, 1]
+        assert isinstance(entry, UtilisationCheck)
+        assert entry.utilisation == pytest.approx(1.5)
+        assert entry.adequacy == "FAILS"
+        assert entry.reference is checks.reference
+        assert checks[1, 0].adequacy == "OK"
+
+    def test_getitem_copies_metadata(self):
+        """Test that each `UtilisationCheck` gets its own metadata dict."""
+        checks = moment_utilisation_batch([10.0, 20.0], 100.0)
+        checks.metadata["member"] = "B1"
+        entry = checks[0]
+        entry.metadata["load_case"] = "ULS1"
+        assert entry.metadata == {"member": "B1", "load_case": "ULS1"}
+        assert checks.metadata == {"member": "B1"}
+        assert checks[1].metadata == {"member": "B1"}
+
+    @pytest.mark.parametrize("check, batch", [
+        (tension_utilisation, tension_utilisation_batch),
+        (compression_utilisation, compression_utilisation_batch),
+        (shear_utilisation, shear_utilisation_batch),
+    ])
+    def test_zero_resistance(self, check, batch):
+        """Test that a zero resistance gives an infinite utilisation that fails, in the scalar and batch checks alike."""
+        result = check(1.0, 0.0)
+        assert result.utilisation == math.inf
+        assert result.adequacy == "FAILS"
+        with np.errstate(divide="ignore"):
+            assert batch(1.0, 0.0).utilisation.tolist() == [math.inf]
+        assert moment_utilisation(1.0, 0.0)["Utilisation"] == math.inf
+
+    def test_matches_scalar_check(self):
+        """Test that a batch entry agrees with the scalar check."""
+        assert tension_utilisation_batch([850e3], [1000e3])[0].utilisation == pytest.approx(tension_utilisation(850e3, 1000e3).utilisation)
+
+
+class TestFlexuralBuckling:
+    """Test EN 1993-1-1 clause 6.3.1 flexural buckling reduction factor and resistance."""
+
+    def test_reduction_factor(self):
+        """Test chi at lambda_bar = 1.0 on curve b against Figure 6.4 (0.597)."""
+        chi = reduction_factor(1.0, imperfection_factor(BucklingCurve.b))
+        assert isinstance(chi, float)
+        assert chi == pytest.approx(0.597, abs=5e-4)
+
+    @pytest.mark.parametrize("lambda_bar", [0.0, 0.1, 0.2])
+    def test_no_reduction_below_plateau(self, lambda_bar):
+        """Test chi = 1.0 for lambda_bar <= 0.2 on every curve."""
+        for curve in BucklingCurve:
+            assert reduction_factor(lambda_bar, imperfection_factor(curve)) == pytest.approx(1.0)
+
+    def test_broadcast(self):
+        """Test one call over slenderness down the rows and buckling curves across the columns."""
+        lambda_bar = np.array([[0.2], [1.0], [2.0]])
+        chi = reduction_factor(lambda_bar, imperfection_factor([BucklingCurve.a, BucklingCurve.b, BucklingCurve.c]))
+        assert chi.shape == (3, 3)
+        assert chi[0] == pytest.approx(1.0)
+        assert chi[1, 1] == pytest.approx(0.597, abs=5e-4)
+        assert np.all(np.diff(chi[1:], axis=1) < 0) # lower curves reduce more
+
+    def test_buckling_resistance(self):
+        """Test N_bRd = chi*A*f_y/gamma_M1, with N_cr = A*f_y so that lambda_bar = 1.0."""
+        chi = chi_flexural(A=8550.0, f_y=355.0, N_cr=8550.0 * 355.0, alpha=imperfection_factor(BucklingCurve.b))
+        assert chi == pytest.approx(0.597, abs=5e-4)
+        assert buckling_resistance(chi, 8550.0, 355.0) == pytest.approx(chi * 8550.0 * 355.0 / gamma_m1)
+
+
+class TestFlexuralSlenderness:
+    """Test EN 1993-1-1 clause 6.3.1.3 epsilon, lambda_1 = 93.9*epsilon and lambda_bar = L_cr/(i*lambda_1)."""
+
+    @pytest.mark.parametrize("f_y", [235, 275, 355.0, 420, 460, 300.0]) # 300 N/mm² is not a tabulated grade
+    def test_epsilon_and_lambda_1(self, f_y):
+        """Test epsilon = sqrt(235/f_y) and lambda_1 = 93.9*epsilon."""
+        assert epsilon(f_y) == pytest.approx(math.sqrt(235.0 / f_y))
+        assert lambda_1(f_y) == pytest.approx(93.9 * epsilon(f_y), rel=2e-4)
+
+    @pytest.mark.parametrize("f_y", [355.0, 300.0])
+    def test_flexural_slenderness(self, f_y):
+        """Test lambda_bar = L_cr/(i*93.9*epsilon) for a tabulated and an off-table grade."""
+        assert flexural_slenderness(3000.0, 50.0, f_y) == pytest.approx(3000.0 / (50.0 * 93.9 * epsilon(f_y)), rel=2e-4)
+
+    def test_array_of_yield_strengths(self):
+        """Test that an array of f_y broadcasts instead of being looked up as a single grade."""
+        f_y = np.array([275.0, 355.0, 300.0])
+        assert epsilon(f_y) == pytest.approx([epsilon(value) for value in f_y])
+        assert lambda_1(f_y) == pytest.approx([lambda_1(value) for value in f_y])
+        lambda_bar = flexural_slenderness(3000.0, 50.0, f_y)
+        assert lambda_bar.shape == (3,)
+        assert lambda_bar == pytest.approx([flexural_slenderness(3000.0, 50.0, value) for value in f_y])
+        assert flexural_slenderness(3000.0, 50.0, np.float64(355.0)) == pytest.approx(flexural_slenderness(3000.0, 50.0, 355))
@@ -262,11 +262,32 @@ class TestUKSectionDatabase:
         assert section_type == SectionType.UB
         assert data["designation"] == "457x191x67"
     
+    def test_section_types_loaded_on_first_lookup(self, mock_uk_data_dir):
+        """Test that only the section types looked up are read from disk."""
+        db = UKSectionDatabase(data_directory=mock_uk_data_dir)
+        assert db._cache == {}
+        assert db.get_section_data("430x100x64", SectionType.PFC) is not None
+        assert list(db._cache) == [SectionType.PFC]
+
     def test_fuzzy_find_section_not_found(self, uk_database):
         """Test fuzzy finding when section doesn't exist."""
         result = uk_database._fuzzy_find_section("999x999x999")
         assert result is None
 
+    def test_find_section_uses_designation_index(self, uk_database):
+        """Test lookups across types through the flat designation and fuzzy indexes, rebuilt after a load."""
+        section_type, data = uk_database.find_section("430x100x64")
+        assert section_type == SectionType.PFC
+        assert uk_database._designation_index["430x100x64"] == (section_type, data)
+        assert uk_database.find_section("457X191X67")[0] == SectionType.UB # falls back to fuzzy matching
+
+        assert uk_database._exact_lower["457x191x67"][1] == SectionType.UB
+
+        uk_database._cache_section_type(SectionType.UB)
+        assert uk_database._designation_index is None
+        assert uk_database._exact_lower is None
+        assert uk_database.find_section("457x191x67")[0] == SectionType.UB
+
 
 class TestUKSectionFactory:
     """Test UK-specific factory functionality."""
@@ -308,6 +329,14 @@ class TestUKSectionFactory:
         # Should have successfully registered at least some classes
         assert len(factory._section_classes) > 0
 
+    def test_sections_are_shared(self, uk_factory):
+        """Test that repeated requests for the same section return the shared instance."""
+        beam = uk_factory.create_section("457x191x67", SectionType.UB)
+        assert uk_factory.create_section("457x191x67", SectionType.UB) is beam
+        assert uk_factory.create_section("457x191x67") is beam
+        with pytest.raises(SectionNotFoundError):
+            uk_factory.create_section("999x999x999", SectionType.UB)
+
 
 class TestUniversalSections:
     """Test Universal sections (UB, UC, UBP)."""
@@ -589,27 +618,32 @@ class TestModuleIntegration:
         for item_name in __all__:
             assert hasattr(uk_module, item_name), f"{item_name} not available in module"
     
-    def test_auto_register_function_success(self):
-        """Test auto-registration function succeeds."""
-        # Test that the function can be called without error
-        from steelsnakes.UK import _register_all_uk_sections
-        try:
-            _register_all_uk_sections()
-            # Should not raise an exception
-            assert True
-        except Exception as e:
-            pytest.fail(f"Auto-registration failed: {e}")
-    
-    def test_auto_register_function_handles_exception(self):
-        """Test auto-registration handles exceptions gracefully."""
-        with patch('steelsnakes.UK.get_UK_factory', side_effect=Exception("Test error")):
-            with patch('builtins.print') as mock_print:
-                # Import the _register_all_uk_sections function and call it directly
-                from steelsnakes.UK import _register_all_uk_sections
-                _register_all_uk_sections()
-                
-                mock_print.assert_called_once()
-                assert "Warning: Could not auto-register UK section classes" in str(mock_print.call_args)
+    def test_section_modules_imported_on_first_access(self):
+        """Test that importing the package leaves section modules (and the factory) unbuilt until used."""
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, steelsnakes.UK as uk\n"
+            "assert 'steelsnakes.UK.angles' not in sys.modules\n"
+            "assert uk.factory._global_uk_factory is None\n"
+            "uk.PFC\n"
+            "assert 'steelsnakes.UK.channels' in sys.modules and 'steelsnakes.UK.angles' not in sys.modules\n"
+        )
+        src_dir = str(Path(__file__).resolve().parent.parent / "src")
+        subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": src_dir})
+
+    @pytest.mark.parametrize("region, name", [("UK", "HFEHS"), ("EU", "IPE"), ("AU", "EqualAngle")])
+    def test_lazy_exports(self, region, name):
+        """Test that every region package lists its lazy exports in `dir()` and rejects unknown names."""
+        import importlib
+
+        module = importlib.import_module(f"steelsnakes.{region}")
+        assert name in dir(module)
+        assert getattr(module, name) is vars(module)[name]
+        with pytest.raises(AttributeError, match="has no attribute 'NOT_A_SECTION'"):
+            module.NOT_A_SECTION
 
 
 class TestGlobalInstances:
@@ -664,6 +698,13 @@ class TestGlobalInstances:
                 assert factory1 is mock_instance
                 mock_factory_class.assert_called_once()
 
+    def test_get_uk_factory_memoized_per_directory(self, mock_uk_data_dir):
+        """Test that asking again for the same data directory reuses the factory and its database."""
+        factory = get_UK_factory(mock_uk_data_dir)
+        assert get_UK_factory(Path(str(mock_uk_data_dir))) is factory
+        assert factory.database is get_uk_database(mock_uk_data_dir)
+        assert get_UK_factory() is not factory
+
 
 class TestErrorHandling:
     """Test error handling and edge cases."""
@@ -5,6 +5,7 @@ Tests for the base database system including SectionDatabase.
 import pytest
 import json
 import sqlite3
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 from typing import Optional, Any
@@ -183,6 +184,47 @@ class TestSectionLoading:
         # Should not raise an error, but UB cache should be empty
         assert db._cache.get(SectionType.UB, {}) == {}
 
+    def test_load_interns_designations(self, database):
+        """Test that cache keys are interned and shared with each row's `designation`."""
+        import sys
+
+        for designation, data in database._cache[SectionType.UB].items():
+            assert designation is sys.intern(designation)
+            assert data["designation"] is designation
+
+    def test_lazy_load_defers_until_first_access(self, mock_data_dir):
+        """Test that lazy databases only load a section type when it is first accessed."""
+
+        class LazyMockSectionDatabase(MockSectionDatabase):
+            lazy_load = True
+
+        db = LazyMockSectionDatabase(data_directory=mock_data_dir)
+        assert db._cache == {}
+
+        data = db.get_section_data("457x191x67", SectionType.UB)
+        assert data is not None
+        assert data["_section_type"] == "UB"
+        assert list(db._cache) == [SectionType.UB]
+
+    def test_json_fallback_without_orjson(self, monkeypatch):
+        """Test that the standard library parser is used when `orjson` is not installed."""
+        import importlib.util
+        import steelsnakes.base.database as database_module
+
+        monkeypatch.setitem(sys.modules, "orjson", None) # makes `from orjson import ...` raise ImportError
+        spec = importlib.util.spec_from_file_location("_database_without_orjson", database_module.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert module._json_loads is json.loads
+
+    def test_json_fallback_parses_same_data(self, mock_data_dir, monkeypatch):
+        """Test that the `json.loads` fallback parses a data file to the same dict as the default parser."""
+        import steelsnakes.base.database as database_module
+
+        expected = MockSectionDatabase(data_directory=mock_data_dir)._load_section_type(SectionType.UB)
+        monkeypatch.setattr(database_module, "_json_loads", json.loads)
+        assert MockSectionDatabase(data_directory=mock_data_dir)._load_section_type(SectionType.UB) == expected
+
 
 class TestDataRetrieval:
     """Test data retrieval methods."""
@@ -226,6 +268,58 @@ class TestDataRetrieval:
         result = database.find_section("999x999x999")
         assert result is None
 
+    def test_EU_fuzzy_find_normalizes_designations(self, mock_data_dir):
+        """Test that the EU fuzzy index ignores case and separators, and is built once."""
+        from steelsnakes.EU.database import EUSectionDatabase
+
+        db = EUSectionDatabase(data_directory=mock_data_dir)
+        section_type, data = db.find_section("457X191X67")
+        assert section_type == SectionType.UB and data["h"] == 457.0
+        index = db._fuzzy_index
+        assert index is not None
+
+        section_type, data = db.find_section("430 100-64")
+        assert section_type == SectionType.PFC and data["b"] == 100.0
+        assert db._fuzzy_index is index
+        assert db.find_section("999x999x999") is None
+
+        # exact hits are served from the index built alongside the fuzzy one
+        assert db._exact_index is not None
+        assert db.find_section("203x203x46")[0] == SectionType.UC
+
+        # fuzzy results, misses included, are memoized until the next load
+        assert db._fuzzy_results["999x999x999"] is None
+        db._cache_section_type(SectionType.UB)
+        assert db._fuzzy_results is None and db._fuzzy_index is None
+
+    def test_get_EU_database_memoized_per_directory(self, mock_data_dir):
+        """Test that asking again for the same EU data directory returns the loaded database."""
+        from steelsnakes.EU.database import get_EU_database
+
+        db = get_EU_database(mock_data_dir)
+        assert get_EU_database(Path(str(mock_data_dir))) is db
+        assert get_EU_database(mock_data_dir, use_sqlite=True) is not db
+        assert get_EU_database() is not db
+
+    def test_EU_find_sections_by_prefix(self, mock_data_dir):
+        """Test prefix lookups over normalized EU designations."""
+        from steelsnakes.EU.database import EUSectionDatabase
+
+        db = EUSectionDatabase(data_directory=mock_data_dir)
+        assert db.find_sections_by_prefix("457 X 191") == [(SectionType.UB, "457x191x67")]
+        assert db.find_sections_by_prefix("999") == []
+        assert len(db.find_sections_by_prefix("")) == 4
+
+    def test_EU_find_sections_containing(self, mock_data_dir):
+        """Test substring lookups, with and without the SQLite FTS5 trigram index."""
+        from steelsnakes.EU.database import EUSectionDatabase
+
+        for use_sqlite in (False, True):
+            db = EUSectionDatabase(data_directory=mock_data_dir, use_sqlite=use_sqlite)
+            assert db.find_sections_containing("305 X 137") == [(SectionType.UB, "305x305x137")]
+            assert db.find_sections_containing("203") == [(SectionType.UC, "203x203x46")]
+            assert db.find_sections_containing("999") == []
+
 
 class TestSectionSearch:
     """Test search functionality."""
@@ -308,6 +402,71 @@ class TestSectionSearch:
         # Should return no results due to type error
         assert len(results) == 0
 
+    def test_filter_sections_matches_search_sections(self, database):
+        """Test that the NumPy filter agrees with search_sections."""
+        pytest.importorskip("numpy")
+        criteria = {"mass_per_metre__lt": 100, "I_yy__gt": 20000}
+        expected = [designation for designation, _ in database.search_sections(SectionType.UB, **criteria)]
+        assert database.filter_sections(SectionType.UB, **criteria) == expected == ["457x191x67"]
+
+    def test_filter_sections_unknown_property(self, database):
+        """Test that filtering on a property that isn't in the table matches nothing."""
+        pytest.importorskip("numpy")
+        assert database.filter_sections(SectionType.UB, not_a_property__gt=0) == []
+
+    def test_section_table_is_cached(self, database):
+        """Test that the structured array is built once per section type."""
+        pytest.importorskip("numpy")
+        table = database.section_table(SectionType.UB)
+        assert table is database.section_table(SectionType.UB)
+        assert list(table["designation"]) == ["457x191x67", "305x305x137"]
+
+    def test_mask_sections_over_arrays(self, database):
+        """Test predicate filtering over the cached, contiguous per-column arrays."""
+        pytest.importorskip("numpy")
+        arrays = database.as_arrays(SectionType.UB)
+        assert arrays is database.as_arrays(SectionType.UB)
+        assert arrays["h"].flags["C_CONTIGUOUS"]
+        assert database.mask_sections(SectionType.UB, lambda c: (c["h"] > 400) & (c["I_yy"] > 20000)) == ["457x191x67"]
+
+    def test_float32_arrays(self, database):
+        """Test that numeric columns can be packed as float32, cached separately from float64."""
+        np = pytest.importorskip("numpy")
+        arrays = database.as_arrays(SectionType.UB, "f4")
+        assert arrays["h"].dtype == np.float32
+        assert arrays is not database.as_arrays(SectionType.UB)
+        assert arrays["designation"].dtype == object
+        assert database.mask_sections(SectionType.UB, lambda c: c["h"] > 400, dtype="f4") == ["457x191x67"]
+
+    def test_baked_arrays_skip_the_json_rows(self, database, mock_data_dir):
+        """Test that columns baked by `save_arrays()` are read back without rebuilding the table."""
+        np = pytest.importorskip("numpy")
+        path = database.save_arrays(SectionType.UB)
+        assert path == mock_data_dir / "UB.npz"
+
+        fresh = MockSectionDatabase(data_directory=mock_data_dir)
+        with patch.object(fresh, "section_table") as section_table:
+            arrays = fresh.as_arrays(SectionType.UB)
+            section_table.assert_not_called()
+        np.testing.assert_array_equal(arrays["h"], database.as_arrays(SectionType.UB)["h"])
+        assert arrays["designation"].tolist() == ["457x191x67", "305x305x137"]
+        assert arrays["designation"][0] is sys.intern("457x191x67")
+
+    def test_baked_arrays_without_designations_are_ignored(self, database, mock_data_dir):
+        """Test that an `.npz` not written by `save_arrays()` falls back to the JSON rows."""
+        np = pytest.importorskip("numpy")
+        np.savez(mock_data_dir / "UB.npz", h=np.array([1.0]))
+
+        fresh = MockSectionDatabase(data_directory=mock_data_dir)
+        assert fresh._load_baked_arrays(SectionType.UB) is None
+        assert fresh.as_arrays(SectionType.UB)["designation"].tolist() == ["457x191x67", "305x305x137"]
+
+    def test_save_all_arrays(self, database, mock_data_dir):
+        """Test that every section type with data is baked, and only those."""
+        paths = database.save_all_arrays()
+        assert paths == [mock_data_dir / f"{t.value}.npz" for t in database.get_available_section_types()]
+        assert all(path.exists() for path in paths)
+
 
 class TestUtilityMethods:
     """Test utility methods."""
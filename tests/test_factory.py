@@ -3,6 +3,7 @@ Tests for the base factory system including SectionFactory.
 """
 
 import pytest
+from dataclasses import dataclass
 from unittest.mock import Mock, MagicMock
 from typing import Optional, Any, Dict, Type
 
@@ -216,7 +217,40 @@ class TestSectionFactoryBase:
         # Verify registration
         assert SectionType.UC in factory._section_classes
         assert factory._section_classes[SectionType.UC] is MockColumn
-    
+
+    def test_register_section_class_with_multiple_types(self, factory):
+        """Test that a class listing several types in `_TYPES` is registered for each of them."""
+
+        class MockExtraWideBeam(BaseSection):
+            _TYPES = (SectionType.HL, SectionType.HLZ)
+
+            @classmethod
+            def get_section_type(cls):
+                return cls._TYPES[0]
+
+            def get_properties(self):
+                return {}
+
+        factory.register_section_class(MockExtraWideBeam)
+
+        assert factory._section_classes[SectionType.HL] is MockExtraWideBeam
+        assert factory._section_classes[SectionType.HLZ] is MockExtraWideBeam
+
+    def test_register_lazy_section_class(self, mock_database):
+        """Test that a class registered by import path is only resolved when its type is first created."""
+
+        class LazyMockSectionFactory(MockSectionFactory):
+            def _register_default_classes(self) -> None:
+                self.register_lazy_section_class((SectionType.UB,), MockUniversalBeam.__module__, "MockUniversalBeam")
+
+        factory = LazyMockSectionFactory(mock_database)
+        assert SectionType.UB not in factory._section_classes
+
+        section = factory.create_section("254x146x31", SectionType.UB)
+        assert type(section).__name__ == "MockUniversalBeam"
+        assert SectionType.UB in factory._section_classes
+        assert factory._lazy_section_classes == {}
+
     def test_abstract_factory_cannot_instantiate(self) -> None:
         """Test that abstract SectionFactory cannot be instantiated directly."""
         with pytest.raises(TypeError):
@@ -264,6 +298,28 @@ class TestSectionCreation:
     #     assert section.weld_type == "BUTT"
     #     assert section.throat_thickness == 6.0 # type: ignore[reportAttributeAccessIssue]; mock property, so SAFE
     
+    def test_sections_are_shared_per_looked_up_type(self, mock_database, factory):
+        """Test that a class serving several types keeps one shared instance per type, not per primary type."""
+        mock_database._cache[SectionType.UPE] = {
+            "150x75x18": {"designation": "150x75x18", "mass_per_metre": 17.9, "_section_type": "UPE"}
+        }
+        factory._section_classes[SectionType.UPE] = MockParallelFlangeChannel # as if `_TYPES = (PFC, UPE)`
+
+        pfc = factory.create_section("150x75x18", SectionType.PFC)
+        upe = factory.create_section("150x75x18", SectionType.UPE)
+        assert pfc is not upe
+        assert (pfc.mass_per_metre, upe.mass_per_metre) == (18.0, 17.9)
+        assert factory.create_section("150x75x18") is pfc # untyped lookup finds PFC first
+        assert factory.create_section("150x75x18", SectionType.UPE) is upe
+
+    def test_query_aliases_are_bounded(self, factory, monkeypatch):
+        """Test that differently spelt queries share one instance while only the latest queries are remembered."""
+        monkeypatch.setattr("steelsnakes.base.factory._MAX_QUERY_ALIASES", 2)
+        sections = [factory.create_section(query) for query in ("254x146x31", "254X146X31", "254X146x31", "254x146X31")]
+        assert all(section is sections[0] for section in sections)
+        assert len(factory._instances) == 1
+        assert list(factory._query_aliases) == [("254X146x31", None), ("254x146X31", None)]
+
     def test_create_section_filters_metadata(self, factory):
         """Test that metadata fields starting with '_' are filtered out."""
         section = factory.create_section("254x146x31", SectionType.UB)
@@ -273,6 +329,36 @@ class TestSectionCreation:
         assert section.designation == "254x146x31"
         assert section.mass_per_metre == 31.0
 
+    def test_instantiate_dataclass_matches_constructor(self):
+        """Test that the __new__ fast path builds the same object as the dataclass constructor."""
+
+        @dataclass
+        class PlainBeam(BaseSection):
+            h: float = 0.0
+            b: float = 0.0
+
+            @classmethod
+            def get_section_type(cls) -> SectionType:
+                return SectionType.UB
+
+        section = SectionFactory._instantiate(PlainBeam, {"designation": "254x146x31", "h": 254.0})
+        assert section == PlainBeam(designation="254x146x31", h=254.0)
+        assert section.b == 0.0  # default applied
+
+    def test_instantiate_dataclass_rejects_unknown_keys(self):
+        """Test that unknown keys still raise the constructor's TypeError."""
+
+        @dataclass
+        class PlainBeam(BaseSection):
+            h: float = 0.0
+
+            @classmethod
+            def get_section_type(cls) -> SectionType:
+                return SectionType.UB
+
+        with pytest.raises(TypeError):
+            SectionFactory._instantiate(PlainBeam, {"designation": "254x146x31", "not_a_field": 1.0})
+
 
 class TestErrorHandling:
     """Test error handling and edge cases."""
@@ -387,5 +473,49 @@ class TestEdgeCases:
         assert section.extra_property == "test_value"
 
 
+
+class TestEUSectionFactory:
+    """Test EU factory behaviour on top of the base factory."""
+
+    def test_sections_are_shared(self):
+        """Test that repeated requests for the same section return the shared instance."""
+        from steelsnakes.EU.factory import EUSectionFactory
+
+        factory = EUSectionFactory()
+        section = factory.create_section("IPE-750x220", SectionType.IPE)
+        assert factory.create_section("IPE-750x220", SectionType.IPE) is section
+        assert factory.create_section("IPE-750x220") is section # typed and untyped lookups share the instance
+        with pytest.raises(SectionNotFoundError):
+            factory.create_section("IPE-0x0", SectionType.IPE)
+
+    def test_table_columns_and_selection(self):
+        """Test that the section table exposes columns and only creates the selected sections."""
+        from steelsnakes.EU.factory import EUSectionFactory
+
+        factory = EUSectionFactory()
+        table = factory.table(SectionType.IPE)
+        assert len(table) == len(factory.database.list_sections(SectionType.IPE))
+        assert table.designation is table.columns["designation"]
+        assert table.mass_per_metre.dtype == "f4"
+        assert factory.table(SectionType.IPE, dtype="f8").mass_per_metre.dtype == "f8"
+        heavy = table.select(table.mass_per_metre > 100)
+        assert heavy and all(section.mass_per_metre > 100 for section in heavy)
+        assert table[0] is factory.create_section(table.designation[0], SectionType.IPE)
+        with pytest.raises(AttributeError):
+            table.not_a_column
+
+    def test_table_copy_and_pickle(self):
+        """Test that a section table survives copy and a pickle round-trip."""
+        import copy
+        import pickle
+        from steelsnakes.EU.factory import EUSectionFactory
+
+        table = EUSectionFactory().table(SectionType.IPE)
+        for clone in (copy.copy(table), pickle.loads(pickle.dumps(table))):
+            assert len(clone) == len(table)
+            assert list(clone.designation) == list(table.designation)
+            assert clone[0].designation == table[0].designation
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
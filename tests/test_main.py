@@ -1 +1,84 @@
-assert 1
\ No newline at end of file
+"""
+Tests for the `steelsnakes` command-line interface in `steelsnakes.cli`.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import steelsnakes.UK.database as uk_database
+from steelsnakes import cli
+from steelsnakes.base.sections import SectionType
+from steelsnakes.UK import create_section
+from steelsnakes.UK.database import UKSectionDatabase, get_UK_database
+
+
+@pytest.fixture
+def uk_tmp_database(tmp_path, monkeypatch):
+    """A UK database over a copy of the UB and PFC data files, served by `get_UK_database()`."""
+    data_dir = tmp_path / "UK"
+    data_dir.mkdir()
+    source_dir = Path(uk_database.__file__).parent / "data"
+    for section_type in (SectionType.UB, SectionType.PFC):
+        shutil.copy(source_dir / f"{section_type.value}.json", data_dir)
+    database = UKSectionDatabase(data_dir)
+    monkeypatch.setattr(uk_database, "get_UK_database", lambda: database)
+    return database
+
+
+class TestRegionLookup:
+    """Test mapping a `--region` argument to the region's database getter and `create_section`."""
+
+    @pytest.mark.parametrize("region", ["UK", "uk", "Uk"])
+    def test_region_components(self, region):
+        """Test that the region lookup is case-insensitive."""
+        database_getter, create = cli._get_region_components(region)
+        assert database_getter is get_UK_database
+        assert create is create_section
+
+    def test_unknown_region(self):
+        """Test that a region without a package raises `ValueError`."""
+        with pytest.raises(ValueError, match="not properly implemented"):
+            cli._get_region_components("XX")
+
+    def test_available_regions(self):
+        """Test that UK is discovered as an available region."""
+        assert "UK" in cli._get_available_regions()
+
+    def test_list_sections(self, uk_tmp_database, capsys):
+        """Test that `list --type` reads the region's database found by the lookup."""
+        cli.list_sections("UB", region="uk", limit=3)
+        output = capsys.readouterr().out
+        assert f"UK UB Sections ({len(uk_tmp_database.list_sections(SectionType.UB))} total)" in output
+        assert "... and" in output
+
+    def test_unsupported_region_exits(self, capsys):
+        """Test that an unsupported region exits with the available regions listed."""
+        with pytest.raises(SystemExit):
+            cli.list_sections(region="XX")
+        assert "Available regions: " in capsys.readouterr().out
+
+
+class TestBake:
+    """Test `steelsnakes bake`, which writes each section type's columns to a `.npz` beside its JSON file."""
+
+    def test_bake_writes_npz(self, uk_tmp_database, monkeypatch, capsys):
+        """Test that `bake --region UK` writes one `.npz` per section type with data."""
+        monkeypatch.setattr(sys, "argv", ["steelsnakes", "bake", "--region", "UK"])
+        cli.main()
+        data_dir = uk_tmp_database.data_directory
+        assert sorted(path.name for path in data_dir.glob("*.npz")) == ["PFC.npz", "UB.npz"]
+        assert "UK Baked Section Arrays (2 types)" in capsys.readouterr().out
+
+        with np.load(data_dir / "UB.npz", allow_pickle=False) as baked:
+            assert baked["designation"].tolist() == uk_tmp_database.as_arrays(SectionType.UB)["designation"].tolist()
+
+    def test_baked_arrays_are_read_back(self, uk_tmp_database):
+        """Test that a fresh database reads the baked columns."""
+        cli.bake_arrays("UK")
+        database = UKSectionDatabase(uk_tmp_database.data_directory)
+        assert database._load_baked_arrays(SectionType.UB) is not None
+        assert np.array_equal(database.as_arrays(SectionType.UB)["h"], uk_tmp_database.as_arrays(SectionType.UB)["h"])
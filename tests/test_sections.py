@@ -5,9 +5,10 @@
 
 import pytest
 from abc import ABC
+from dataclasses import dataclass
 from typing import Any
 
-from steelsnakes.base.sections import SectionType, BaseSection
+from steelsnakes.base.sections import SectionType, BaseSection, parse_designation, section_arrays
 
 
 # Mock concrete implementation for testing BaseSection
@@ -228,6 +229,125 @@ class TestInheritance:
         assert issubclass(AnotherMockSection, BaseSection)
 
 
+class TestSectionTypeEnum:
+    """Test SectionType behaviour relied on by the databases and factories."""
+
+    def test_values_are_file_stems(self):
+        """Test that values stay the strings used to name the data files."""
+        assert SectionType.UB.value == "UB"
+        assert SectionType("L_EQUAL") is SectionType.L_EQUAL
+
+    def test_hashes_as_str(self):
+        """Test that members hash like their string value, so dict lookups use `str.__hash__`."""
+        assert hash(SectionType.PFC) == hash("PFC")
+        assert {SectionType.PFC: 1}[SectionType.PFC] == 1
+
+    def test_json_serialises_as_value(self):
+        """Test that members serialise to JSON as their plain string value."""
+        import json
+
+        assert json.dumps({"type": SectionType.UB}) == '{"type": "UB"}'
+        assert SectionType(json.loads('"HLZ"')) is SectionType.HLZ
+
+
+class TestParseDesignation:
+    """Test the memoized designation parser."""
+
+    def test_parse_designation(self):
+        assert parse_designation("200x100x14") == (200.0, 100.0, 14.0)
+        assert parse_designation("300x300x35.0") == (300.0, 300.0, 35.0)
+        assert parse_designation("HD-400x421") == (400.0, 421.0)
+
+
+class TestDefaultProperties:
+    """Test the default dataclass-driven get_properties."""
+
+    def test_default_get_properties_reads_fields(self):
+        """Test that subclasses without an override return every dataclass field in order."""
+
+        @dataclass(slots=True)
+        class PlainSection(BaseSection):
+            h: float = 0.0
+            b: float = 0.0
+
+            @classmethod
+            def get_section_type(cls) -> SectionType:
+                return SectionType.UB
+
+        section = PlainSection("457x191x67", h=457.0, b=191.0)
+        assert section.get_properties() == {"designation": "457x191x67", "h": 457.0, "b": 191.0}
+        assert not hasattr(section, "__dict__")
+
+    def test_read_only_properties_snapshot(self):
+        """Test that sections without their own dataclass fields get the same cached, read-only snapshot."""
+        from steelsnakes.AU.sections import I_Section
+
+        section = I_Section("610UB125")
+        properties = section.get_properties()
+        assert properties == {"designation": "610UB125"}
+        assert section.get_properties() is properties
+        with pytest.raises(TypeError):
+            properties["designation"] = ""  # type: ignore[index]
+
+    def test_slotted_sections_read_fields(self):
+        """Test that slotted sections without an override return their fields in order."""
+        from steelsnakes.EU.flats import Sigma
+
+        section = Sigma("A140100", hw=140.0)
+        properties = section.get_properties()
+        assert list(properties)[:2] == ["designation", "serial_size"]
+        assert properties["hw"] == 140.0
+        assert not hasattr(section, "__dict__")
+
+    def test_properties_cached_per_instance(self):
+        """Test that the default mapping is built once, is read-only and is not carried into pickles."""
+        import pickle
+        from steelsnakes.EU.flats import Sigma
+
+        section = Sigma("A140100", hw=140.0)
+        properties = section.get_properties()
+        assert section.get_properties() is properties
+        with pytest.raises(TypeError):
+            properties["hw"] = 0.0  # type: ignore[index]
+
+        restored = pickle.loads(pickle.dumps(section))
+        assert restored == section
+        assert restored.get_properties() == properties
+        assert restored.get_properties() is not properties
+
+    def test_sections_are_hashable(self):
+        """Test that sections hash by class and designation, consistently with dataclass equality."""
+        from dataclasses import replace
+        from steelsnakes.EU.flats import Sigma, Zed
+
+        section = Sigma("A140100", hw=140.0)
+        assert {section: "cached"}[replace(section)] == "cached"
+        assert hash(Zed("A140100")) != hash(section)
+
+
+class TestSectionArrays:
+    """Test the structure-of-arrays view over section instances."""
+
+    def test_columns_per_field(self):
+        """Test that numeric fields become contiguous float64 columns alongside the designations."""
+        import numpy as np
+        from steelsnakes.IN.angles import EqualAngle
+
+        angles = [EqualAngle("ISA 50x50x5", a=50.0, r_y=15.2), EqualAngle("ISA 65x65x6", a=65.0, r_y=19.8)]
+        arrays = section_arrays(angles)
+        assert arrays["designation"].tolist() == ["ISA 50x50x5", "ISA 65x65x6"]
+        assert arrays["r_y"].dtype == np.float64 and arrays["r_y"].flags["C_CONTIGUOUS"]
+        assert arrays["a"].tolist() == [50.0, 65.0]
+        assert section_arrays([]) == {}
+
+    def test_mixed_classes_rejected(self):
+        """Test that sections of different classes are not packed together."""
+        from steelsnakes.IN.angles import EqualAngle, UnequalAngle
+
+        with pytest.raises(TypeError):
+            section_arrays([EqualAngle("ISA 50x50x5"), UnequalAngle("ISA 75x50x6")])
+
+
 # class TestEdgeCases:
 #     """Test edge cases and error conditions."""
     